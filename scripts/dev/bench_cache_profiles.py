@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark de perfiles de caché (CACHE_PROFILE) con el gateway simulado
+Informatica UAIn'T Community Bot
+
+Para cada perfil conecta el bot a los servidores de tests/fixtures con N
+miembros (los servidores grandes reciben sus miembros por chunking si el
+perfil lo pide) y reproduce un rato de actividad de voz. Muestra:
+
+  - arranque: CPU para procesar GUILD_CREATE y los GUILD_MEMBERS_CHUNK
+    (sin el tiempo de red de los chunks, que depende de Discord)
+  - memoria tras conectar y al terminar: bytes asignados por el bot y
+    discord.py según tracemalloc, sin contar los payloads del simulador
+  - miembros que quedaron en la caché del gateway
+
+Uso:
+    python scripts/dev/bench_cache_profiles.py [--usuarios 10000] [--horas H]
+        [--perfiles full voice minimal] [--logs]
+"""
+
+import sys
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.simulator.churn import run
+
+
+def megabytes(value: int) -> str:
+    return f"{value / 1024 / 1024:.1f}MB"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de perfiles de caché (simulado)")
+    parser.add_argument("--usuarios", type=int, nargs="+", default=[10000])
+    parser.add_argument("--horas", type=float, default=0.5, help="actividad de voz tras conectar")
+    parser.add_argument("--perfiles", nargs="+", default=["full", "voice", "minimal"])
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--logs", action="store_true", help="mostrar los avisos del bot")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING if args.logs else logging.CRITICAL, format="%(message)s")
+
+    print(f"{'perfil':<9}{'usuarios':>9}{'chunks':>8}{'arranque':>10}{'mem. inicio':>13}"
+          f"{'mem. final':>12}{'en caché':>10}{'p50':>8}{'REST':>7}")
+
+    for users in args.usuarios:
+        for profile in args.perfiles:
+            report = run(users, args.horas, cache_profile=profile, seed=args.semilla)
+            print(
+                f"{profile:<9}{users:>9}{report.chunks:>8}{report.startup_seconds * 1000:>8.0f}ms"
+                f"{megabytes(report.startup_memory):>13}{megabytes(report.memory):>12}"
+                f"{report.cached_members:>10}{report.p50:>7.2f}s{report.requests:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de construcción de embeds administrativos
+Informatica UAIn'T Community Bot
+
+Compara el tiempo de CPU por comando de la construcción campo a campo
+(implementación anterior de AdminEmbeds.create_embed) con las plantillas
+precompiladas y la caché de colores. Incluye la serialización a payload
+(`to_dict`), que es lo que se envía a Discord.
+
+Uso:
+    python scripts/dev/bench_embeds.py [--iteraciones N]
+"""
+
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import discord
+
+from cogs.admin.embeds import COLORS, DEFAULT_PAYLOAD, TEMPLATES, parse_color, render_embed
+
+THUMBNAIL = "https://cdn.discordapp.com/icons/1/abc.png"
+
+
+# ====================================
+# IMPLEMENTACIÓN ANTERIOR
+# ====================================
+
+def legacy_templates() -> dict:
+    """Diccionarios que se reconstruían en cada instancia del cog"""
+    return {
+        name: {"color": template.color, "emoji": template.emoji, "footer": template.footer}
+        for name, template in TEMPLATES.items()
+    }
+
+
+def legacy_parse_color(color_input: str) -> discord.Color:
+    color_input = color_input.lower().strip()
+    if color_input in COLORS:
+        return COLORS[color_input]
+    match = re.compile(r'^#?([A-Fa-f0-9]{6})$').match(color_input)
+    if match:
+        return discord.Color(int(match.group(1), 16))
+    return discord.Color.blue()
+
+
+def legacy_create_embed(title, description, color, footer=None, thumbnail_url=None, author_name=None):
+    embed = discord.Embed(title=title, description=description, color=color)
+    embed.timestamp = discord.utils.utcnow()
+    if footer:
+        embed.set_footer(text=footer)
+    if thumbnail_url:
+        embed.set_thumbnail(url=thumbnail_url)
+    if author_name:
+        embed.set_author(name=author_name)
+    return embed
+
+
+# ====================================
+# COMANDOS
+# ====================================
+
+def template_before(templates: dict) -> dict:
+    template = templates["anuncio"]
+    return legacy_create_embed(
+        f"{template['emoji']} Nuevo evento", "Inscripciones abiertas",
+        template["color"], template["footer"], THUMBNAIL
+    ).to_dict()
+
+
+def template_after() -> dict:
+    template = TEMPLATES["anuncio"]
+    return render_embed(
+        template.payload, f"{template.emoji} Nuevo evento", "Inscripciones abiertas",
+        thumbnail_url=THUMBNAIL
+    ).to_dict()
+
+
+def advanced_before() -> dict:
+    return legacy_create_embed(
+        "Reglas", "Normas del servidor", legacy_parse_color("#ff8800"),
+        "Enviado por alguien", THUMBNAIL, "Moderación"
+    ).to_dict()
+
+
+def advanced_after() -> dict:
+    return render_embed(
+        DEFAULT_PAYLOAD, "Reglas", "Normas del servidor", color=parse_color("#ff8800"),
+        footer="Enviado por alguien", thumbnail_url=THUMBNAIL, author_name="Moderación"
+    ).to_dict()
+
+
+def measure(function, iterations: int) -> float:
+    """Tiempo de CPU medio por llamada, en microsegundos (mejor de 5 rondas)"""
+    best = float("inf")
+    for _ in range(5):
+        start = time.process_time()
+        for _ in range(iterations):
+            function()
+        best = min(best, time.process_time() - start)
+    return best / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de embeds administrativos")
+    parser.add_argument("--iteraciones", type=int, default=20000)
+    args = parser.parse_args()
+
+    templates = legacy_templates()
+    cases = [
+        ("embed-plantilla", lambda: template_before(templates), template_after),
+        ("embed-avanzado", advanced_before, advanced_after),
+        ("plantillas (dicts por instancia)", legacy_templates, lambda: TEMPLATES),
+    ]
+
+    # Mismo resultado salvo el timestamp
+    for before, after in ((template_before(templates), template_after()), (advanced_before(), advanced_after())):
+        before.pop("timestamp")
+        after.pop("timestamp")
+        assert before == after, (before, after)
+
+    print(f"{'comando':<34}{'antes':>12}{'después':>12}{'mejora':>9}")
+    for name, before, after in cases:
+        before_us = measure(before, args.iteraciones)
+        after_us = measure(after, args.iteraciones)
+        print(f"{name:<34}{before_us:>10.2f}µs{after_us:>10.2f}µs{before_us / after_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark de bienvenidas y rol automático durante una oleada de entradas (raid)
+Informatica UAIn'T Community Bot
+
+Conecta el bot al gateway simulado con WELCOME_CHANNEL_ID en #general y
+MEMBER_ROLE_ID en el rol "Miembro" de las fixtures, y hace entrar N cuentas
+a un ritmo dado (una parte sale poco después). Muestra cuántos mensajes de
+bienvenida se enviaron (los resúmenes cuentan como uno) y la latencia desde
+la entrada hasta la bienvenida y hasta recibir el rol.
+
+Uso:
+    python scripts/dev/bench_join_raid.py [--entradas 500] [--ritmo 0.2 20]
+        [--rol-por-segundo 1] [--umbral 5] [--ventana 10] [--resumen 30] [--logs]
+"""
+
+import os
+import sys
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.simulator.raid import run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de bienvenidas y rol automático (simulado)")
+    parser.add_argument("--entradas", type=int, nargs="+", default=[20, 500, 2000])
+    parser.add_argument("--ritmo", type=float, nargs="+", default=[0.2, 20], help="entradas por segundo")
+    parser.add_argument("--rol-por-segundo", type=float, default=1.0, help="AUTO_ROLE_RATE")
+    parser.add_argument("--umbral", type=int, default=5, help="WELCOME_BURST_THRESHOLD")
+    parser.add_argument("--ventana", type=float, default=10.0, help="WELCOME_BURST_WINDOW")
+    parser.add_argument("--resumen", type=float, default=30.0, help="WELCOME_DIGEST_INTERVAL")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--logs", action="store_true", help="mostrar los avisos del bot")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING if args.logs else logging.CRITICAL, format="%(message)s")
+    os.environ["AUTO_ROLE_RATE"] = str(args.rol_por_segundo)
+    os.environ["WELCOME_BURST_THRESHOLD"] = str(args.umbral)
+    os.environ["WELCOME_BURST_WINDOW"] = str(args.ventana)
+    os.environ["WELCOME_DIGEST_INTERVAL"] = str(args.resumen)
+
+    print(f"{'entradas':>9}{'ritmo':>9}{'bienvenidos':>13}{'mensajes':>10}{'bienv. p50':>12}"
+          f"{'bienv. p99':>12}{'roles':>7}{'rol medio':>11}{'rol máx':>10}")
+
+    for joins in args.entradas:
+        for rate in args.ritmo:
+            report = run(joins, rate, seed=args.semilla)
+            print(
+                f"{joins:>9}{rate:>7.1f}/s{report.welcomed:>13}{report.welcome_messages:>10}"
+                f"{report.welcome_p50:>11.1f}s{report.welcome_p99:>11.1f}s"
+                f"{report.roles:>7}{report.role_mean:>10.1f}s{report.role_max:>9.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
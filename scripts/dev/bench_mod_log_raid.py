@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark del registro de moderación durante una oleada de entradas (raid)
+Informatica UAIn'T Community Bot
+
+Conecta el bot al gateway simulado con MOD_LOG_CHANNEL_ID apuntando al
+canal #moderacion de las fixtures y hace entrar N cuentas a un ritmo dado
+(una parte sale poco después). El canal tiene el límite de Discord de 5
+mensajes cada 5 segundos. Muestra cuántos eventos se publicaron, en cuántos
+mensajes y cuántos se descartaron por saturación.
+
+Uso:
+    python scripts/dev/bench_mod_log_raid.py [--entradas 2000] [--ritmo 50]
+        [--buffer 1000] [--intervalo 5] [--429 0.0] [--logs]
+"""
+
+import os
+import sys
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.simulator.raid import run
+from tests.simulator.rest import RestProfile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark del registro de moderación (simulado)")
+    parser.add_argument("--entradas", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--ritmo", type=float, nargs="+", default=[20, 50, 200], help="entradas por segundo")
+    parser.add_argument("--buffer", type=int, default=1000, help="MOD_LOG_BUFFER_SIZE")
+    parser.add_argument("--intervalo", type=float, default=5.0, help="MOD_LOG_FLUSH_INTERVAL")
+    parser.add_argument("--429", dest="random_429", type=float, default=0.0,
+                        help="probabilidad de un 429 espurio por petición")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--logs", action="store_true", help="mostrar los avisos del bot")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING if args.logs else logging.CRITICAL, format="%(message)s")
+    os.environ["MOD_LOG_BUFFER_SIZE"] = str(args.buffer)
+    os.environ["MOD_LOG_FLUSH_INTERVAL"] = str(args.intervalo)
+    rest_profile = RestProfile(random_429=args.random_429, retry_after=5.0)
+
+    print(f"{'entradas':>9}{'ritmo':>8}{'eventos':>9}{'publicados':>12}{'descartados':>13}"
+          f"{'mensajes':>10}{'embeds':>8}{'ev/msg':>8}{'429':>6}{'buffer máx':>12}")
+
+    for joins in args.entradas:
+        for rate in args.ritmo:
+            report = run(joins, rate, rest_profile=rest_profile, seed=args.semilla)
+            print(
+                f"{joins:>9}{rate:>6.0f}/s{report.recorded:>9}{report.sent:>12}{report.dropped:>13}"
+                f"{report.messages:>10}{report.embeds:>8}{report.events_per_message:>8.1f}"
+                f"{report.rate_limited:>6}{report.max_buffer:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark de canales de voz dinámicos con el gateway simulado
+Informatica UAIn'T Community Bot
+
+Construye los servidores de tests/fixtures, conecta el bot real (eventos y
+canales dinámicos) a un gateway y una API REST simulados, con latencia y
+rate limits, y reproduce horas de entradas y salidas de voz con un reloj
+virtual. No necesita token ni red.
+
+Para cada tamaño muestra:
+  - eventos/s: VOICE_STATE_UPDATE procesados por segundo real
+  - entrada -> movimiento: desde que el usuario entra al trigger hasta que
+    llega el evento de su movimiento al canal nuevo (segundos virtuales)
+  - 429: respuestas de rate limit que tuvo que absorber la cola de acciones
+  - memoria: pico de tracemalloc (bot, caché de discord.py y simulador)
+
+Uso:
+    python scripts/dev/bench_voice_churn.py [--usuarios 100 1000 10000] [--horas H]
+        [--latencia S] [--429 P] [--sin-limites] [--pool] [--sin-memoria] [--logs]
+"""
+
+import sys
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.simulator.churn import ChurnProfile, run
+from tests.simulator.rest import RestProfile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de canales de voz dinámicos (simulado)")
+    parser.add_argument("--usuarios", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--horas", type=float, default=1.0, help="ventana en la que se generan entradas nuevas")
+    parser.add_argument("--sesion", type=float, default=1800.0, help="duración media en un canal (s)")
+    parser.add_argument("--pausa", type=float, default=3600.0, help="tiempo medio entre sesiones (s)")
+    parser.add_argument("--latencia", type=float, default=0.08, help="latencia base de la API (s)")
+    parser.add_argument("--429", dest="random_429", type=float, default=0.0, help="probabilidad de 429 espurio")
+    parser.add_argument("--sin-limites", action="store_true", help="sin rate limits por ruta")
+    parser.add_argument("--pool", action="store_true", help="activar la reserva de canales")
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir memoria (más rápido)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--logs", action="store_true", help="mostrar los avisos del bot")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING if args.logs else logging.CRITICAL, format="%(message)s")
+
+    rest_profile = RestProfile(latency=args.latencia, random_429=args.random_429)
+    if args.sin_limites:
+        rest_profile = rest_profile._replace(limits={})
+    profile = ChurnProfile(session_mean=args.sesion, idle_mean=args.pausa)
+
+    print(f"{'usuarios':>9}{'eventos':>9}{'eventos/s':>11}{'p50':>9}{'p99':>9}{'máx':>9}"
+          f"{'429':>7}{'memoria':>10}{'virtual':>10}{'real':>9}")
+
+    for users in args.usuarios:
+        report = run(
+            users, args.horas, pool=args.pool, profile=profile, rest_profile=rest_profile,
+            seed=args.semilla, trace_memory=not args.sin_memoria
+        )
+        memory = f"{report.peak_memory / 1024 / 1024:.1f}MB" if report.peak_memory else "-"
+        print(
+            f"{report.users:>9}{report.voice_events:>9}{report.events_per_second:>11.0f}"
+            f"{report.p50:>8.2f}s{report.p99:>8.2f}s{report.max:>8.1f}s{report.rate_limited:>7}"
+            f"{memory:>10}{report.virtual_seconds / 3600:>9.1f}h{report.wall_seconds:>8.1f}s"
+        )
+
+        if report.abandoned or report.temp_channels:
+            print(f"{'':>9}  {report.abandoned} salieron antes de ser movidos "
+                  f"({report.coalesced} acciones anuladas en la cola), "
+                  f"{report.temp_channels} canal(es) temporal(es) sin eliminar")
+
+
+if __name__ == "__main__":
+    main()
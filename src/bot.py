@@ -8,8 +8,10 @@ import asyncio
 from pathlib import Path
 from typing import List
 
+from config.settings import get_settings
 from core.client import UaintBot
 from core.exceptions import ConfigurationError
+from core.startup import timeline
 
 logger = logging.getLogger(__name__)
 
@@ -17,43 +19,28 @@ logger = logging.getLogger(__name__)
 class BotManager:
     """Gestor principal del bot"""
 
-    def __init__(self):
-        self.bot: UaintBot = UaintBot()
-        self.extensions_loaded: List[str] = []
+    def __init__(self, force_sync: bool = False):
+        # Logging antes de crear el bot y cargar extensiones: sin handlers, los
+        # INFO del arranque (tiempos por extensión) irían a logging.lastResort
+        get_settings().setup_logging()
 
-    async def load_extensions(self) -> None:
-        """Carga todas las extensiones (cogs) del bot"""
-
-        # Extensiones principales
-        core_extensions = [
-            "core.events",  # Eventos globales
-        ]
-
-        # Cogs básicos
-        basic_cogs = [
-            "cogs.utility.basic",  # Comandos básicos
-            "cogs.utility.dynamic_voice",  # Canales dinámicos
-            "cogs.admin.embeds",  # Sistema de embeds administrativos
-        ]
-
-        # Todas las extensiones a cargar
-        all_extensions = core_extensions + basic_cogs
-
-        logger.info(f"Cargando {len(all_extensions)} extensiones...")
+        self.bot: UaintBot = UaintBot(force_sync=force_sync)
+        # Lista compartida con el cargador (incluye las extensiones diferidas ya cargadas)
+        self.extensions_loaded: List[str] = self.bot.extension_loader.loaded
 
-        for extension in all_extensions:
-            try:
-                await self.bot.load_extension(extension)
-                self.extensions_loaded.append(extension)
-                logger.info(f"✅ Cargada extensión: {extension}")
+    async def load_extensions(self) -> None:
+        """
+        Carga las extensiones (cogs) del bot.
 
-            except Exception as e:
-                logger.error(f"❌ Error cargando extensión {extension}: {e}")
-                # En desarrollo, podemos continuar sin algunas extensiones
-                if not self.bot.settings.IS_DEVELOPMENT:
-                    raise
+        Se descubren todos los módulos con setup() bajo src/cogs (además de
+        core.events) y se cargan por niveles de dependencias, en paralelo
+        dentro de cada nivel. Las marcadas con EXTENSION_LAZY se cargan con el
+        primer uso de uno de sus comandos.
+        """
 
-        logger.info(f"🎉 Cargadas {len(self.extensions_loaded)} extensiones correctamente")
+        # En desarrollo, podemos continuar sin algunas extensiones
+        await self.bot.extension_loader.load_all(strict=not self.bot.settings.IS_DEVELOPMENT)
+        timeline.mark("extensiones")
 
     async def unload_extensions(self) -> None:
         """Descarga todas las extensiones"""
@@ -64,21 +51,21 @@ class BotManager:
             try:
                 await self.bot.unload_extension(extension)
                 self.extensions_loaded.remove(extension)
-                logger.info(f"✅ Descargada extensión: {extension}")
+                logger.info("✅ Descargada extensión: %s", extension)
 
             except Exception as e:
-                logger.error(f"❌ Error descargando extensión {extension}: {e}")
+                logger.error("❌ Error descargando extensión %s: %s", extension, e)
 
     async def reload_extension(self, extension: str) -> bool:
         """Recarga una extensión específica"""
 
         try:
             await self.bot.reload_extension(extension)
-            logger.info(f"🔄 Recargada extensión: {extension}")
+            logger.info("🔄 Recargada extensión: %s", extension)
             return True
 
         except Exception as e:
-            logger.error(f"❌ Error recargando extensión {extension}: {e}")
+            logger.error("❌ Error recargando extensión %s: %s", extension, e)
             return False
 
     async def start(self) -> None:
@@ -93,11 +80,11 @@ class BotManager:
             await self.bot.start(self.bot.settings.DISCORD_TOKEN)
 
         except ConfigurationError as e:
-            logger.error(f"❌ Error de configuración: {e}")
+            logger.error("❌ Error de configuración: %s", e)
             raise
 
         except Exception as e:
-            logger.exception(f"❌ Error iniciando bot: {e}")
+            logger.exception("❌ Error iniciando bot: %s", e)
             raise
 
         finally:
@@ -118,7 +105,7 @@ class BotManager:
                 await self.bot.close()
 
         except Exception as e:
-            logger.error(f"Error durante limpieza: {e}")
+            logger.error("Error durante limpieza: %s", e)
 
         logger.info("✅ Limpieza completada")
 
@@ -146,14 +133,19 @@ def setup_project_path() -> None:
         sys.path.insert(0, str(src_path))
 
 
-async def run_bot() -> None:
-    """Función principal para ejecutar el bot"""
+async def run_bot(force_sync: bool = False) -> None:
+    """
+    Función principal para ejecutar el bot
+
+    Args:
+        force_sync: Sincronizar los comandos slash aunque no hayan cambiado
+    """
 
     # Configurar path del proyecto
     setup_project_path()
 
     # Crear gestor del bot
-    bot_manager = BotManager()
+    bot_manager = BotManager(force_sync=force_sync)
 
     try:
         # Iniciar bot
@@ -163,7 +155,7 @@ async def run_bot() -> None:
         logger.info("🛑 Interrupción por teclado recibida")
 
     except Exception as e:
-        logger.exception(f"❌ Error fatal: {e}")
+        logger.exception("❌ Error fatal: %s", e)
         return 1
 
     return 0
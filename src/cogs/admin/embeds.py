@@ -3,16 +3,228 @@ Sistema de Embeds Administrativos
 Informatica UAIn'T Community Bot
 """
 
+import re
 import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Optional, Dict, Any, Literal
-from datetime import datetime
-import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Literal, Mapping, NamedTuple, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Se importa con el primer uso de sus comandos (ver core.extensions)
+EXTENSION_LAZY = True
+
+HEX_COLOR = re.compile(r'^#?([A-Fa-f0-9]{6})$')
+
+# IDs de canal en menciones (<#123>) o sueltos
+CHANNEL_ID = re.compile(r'(\d{15,20})')
+
+# Canales como máximo por difusión
+MAX_BROADCAST_CHANNELS = 50
+
+# Colores predefinidos
+COLORS: Mapping[str, discord.Color] = MappingProxyType({
+    "rojo": discord.Color.red(),
+    "verde": discord.Color.green(),
+    "azul": discord.Color.blue(),
+    "naranja": discord.Color.orange(),
+    "morado": discord.Color.purple(),
+    "rosa": discord.Color.magenta(),
+    "dorado": discord.Color.gold(),
+    "gris": discord.Color.light_grey(),
+    "gris_oscuro": discord.Color.dark_grey(),
+    "amarillo": discord.Color.from_rgb(255, 255, 0),
+    "cyan": discord.Color.from_rgb(0, 255, 255),
+    "negro": discord.Color.from_rgb(0, 0, 0),
+    "blanco": discord.Color.from_rgb(255, 255, 255)
+})
+
+
+class EmbedTemplate(NamedTuple):
+    """Plantilla predefinida con su payload base ya construido"""
+
+    color: discord.Color
+    emoji: str
+    footer: str
+    payload: Mapping[str, Any]  # partes fijas del embed (formato de la API)
+
+
+def compile_payload(color: discord.Color, footer: Optional[str] = None) -> Mapping[str, Any]:
+    """
+    Payload base inmutable de un embed (lo que no cambia entre envíos).
+
+    El único valor anidado es el footer; `render_embed` lo copia por envío.
+    """
+    payload: Dict[str, Any] = {"type": "rich", "color": color.value, "flags": 0}
+    if footer:
+        payload["footer"] = MappingProxyType({"text": footer})
+    return MappingProxyType(payload)
+
+
+def compile_template(color: discord.Color, emoji: str, footer: str) -> EmbedTemplate:
+    return EmbedTemplate(color, emoji, footer, compile_payload(color, footer))
+
+
+# Plantillas predefinidas (se compilan una vez al importar el módulo)
+TEMPLATES: Mapping[str, EmbedTemplate] = MappingProxyType({
+    "anuncio": compile_template(discord.Color.blue(), "📢", "Anuncio oficial del servidor"),
+    "reglas": compile_template(discord.Color.red(), "📋", "Reglas del servidor - Cumplimiento obligatorio"),
+    "informacion": compile_template(discord.Color.green(), "ℹ️", "Información del servidor"),
+    "aviso": compile_template(discord.Color.orange(), "⚠️", "Aviso importante"),
+    "evento": compile_template(discord.Color.purple(), "🎉", "Evento del servidor"),
+    "bienvenida": compile_template(discord.Color.gold(), "👋", "¡Te damos la bienvenida!"),
+})
+
+# Payload base sin plantilla (color por defecto, sin footer)
+DEFAULT_PAYLOAD = compile_payload(discord.Color.blue())
+
+# Partes del payload que discord.Embed guarda tal cual en un atributo privado
+_RAW_KEYS = ("footer", "thumbnail", "author", "fields")
+
+
+class CompiledEmbed(discord.Embed):
+    """
+    Embed creado desde un payload ya en formato de la API.
+
+    `to_dict()` (lo que discord.py envía) devuelve ese payload sin recorrer
+    los atributos. Los atributos del embed se rellenan desde el payload la
+    primera vez que se leen; los valores anidados son los mismos objetos en
+    ambos (los cambios en el sitio se ven en los dos) y cualquier asignación o
+    borrado de un atributo descarta el payload, así `to_dict()` nunca queda
+    desfasado.
+    """
+
+    __slots__ = ("_payload", "_hydrated")
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "CompiledEmbed":
+        embed = cls.__new__(cls)
+        object.__setattr__(embed, "_payload", payload)
+        object.__setattr__(embed, "_hydrated", False)
+        return embed
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> discord.Embed:
+        # copy() y similares devuelven un embed normal
+        return discord.Embed.from_dict(data)
+
+    def _hydrate(self) -> bool:
+        """Rellena los atributos desde el payload (una sola vez)"""
+
+        if self._hydrated:
+            return False
+
+        payload = self._payload
+        setter = object.__setattr__
+        setter(self, "_hydrated", True)
+
+        setter(self, "title", payload.get("title"))
+        setter(self, "type", payload.get("type", "rich"))
+        setter(self, "description", payload.get("description"))
+        setter(self, "url", payload.get("url"))
+        setter(self, "_flags", payload.get("flags", 0))
+        if "color" in payload:
+            setter(self, "_colour", discord.Colour(payload["color"]))
+        if "timestamp" in payload:
+            setter(self, "_timestamp", discord.utils.parse_time(payload["timestamp"]))
+
+        for key in _RAW_KEYS:
+            if key in payload:
+                setter(self, "_" + key, payload[key])
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        # Solo se llama para slots sin valor
+        if name in self.__slots__ or not self._hydrate():
+            raise AttributeError(name)
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._hydrate()
+        object.__setattr__(self, "_payload", None)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        self._hydrate()
+        object.__setattr__(self, "_payload", None)
+        object.__delattr__(self, name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = self._payload
+        if payload is None:
+            return super().to_dict()
+        return dict(payload)
+
+
+@lru_cache(maxsize=256)
+def parse_color(color_input: str) -> discord.Color:
+    """Convierte input de color a objeto Color de Discord (nombre o hex; azul si no se reconoce)"""
+
+    # Limpiar input
+    color_input = color_input.lower().strip()
+
+    # Verificar si es un color predefinido
+    if color_input in COLORS:
+        return COLORS[color_input]
+
+    # Verificar si es hex válido
+    match = HEX_COLOR.match(color_input)
+    if match:
+        return discord.Color(int(match.group(1), 16))
+
+    # Color por defecto si no se reconoce
+    return discord.Color.blue()
+
+
+def render_embed(
+        base: Mapping[str, Any],
+        title: str,
+        description: str,
+        color: Optional[discord.Color] = None,
+        footer: Optional[str] = None,
+        thumbnail_url: Optional[str] = None,
+        timestamp: bool = True,
+        author_name: Optional[str] = None,
+        fields: Optional[list] = None
+) -> discord.Embed:
+    """
+    Crea un embed a partir de un payload base, superponiendo solo las partes
+    dinámicas (título, descripción, timestamp, autor...).
+    """
+
+    payload = dict(base)
+    payload["title"] = str(title)
+    payload["description"] = str(description)
+
+    if color is not None:
+        payload["color"] = color.value
+    if footer:
+        payload["footer"] = {"text": footer}
+    elif "footer" in payload:
+        payload["footer"] = dict(payload["footer"])
+    if thumbnail_url:
+        payload["thumbnail"] = {"url": thumbnail_url}
+    if author_name:
+        payload["author"] = {"name": author_name}
+    if fields:
+        payload["fields"] = [
+            {
+                "name": str(field.get("name", "Campo")),
+                "value": str(field.get("value", "Valor")),
+                "inline": field.get("inline", False)
+            }
+            for field in fields
+        ]
+
+    if timestamp:
+        payload["timestamp"] = discord.utils.utcnow().isoformat()
+
+    return CompiledEmbed.from_payload(payload)
+
 
 class AdminEmbeds(commands.Cog, name="Admin Embeds"):
     """Sistema de embeds administrativos para anuncios y comunicados"""
@@ -20,56 +232,9 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-        # Plantillas predefinidas
-        self.templates = {
-            "anuncio": {
-                "color": discord.Color.blue(),
-                "emoji": "📢",
-                "footer": "Anuncio oficial del servidor"
-            },
-            "reglas": {
-                "color": discord.Color.red(),
-                "emoji": "📋",
-                "footer": "Reglas del servidor - Cumplimiento obligatorio"
-            },
-            "informacion": {
-                "color": discord.Color.green(),
-                "emoji": "ℹ️",
-                "footer": "Información del servidor"
-            },
-            "aviso": {
-                "color": discord.Color.orange(),
-                "emoji": "⚠️",
-                "footer": "Aviso importante"
-            },
-            "evento": {
-                "color": discord.Color.purple(),
-                "emoji": "🎉",
-                "footer": "Evento del servidor"
-            },
-            "bienvenida": {
-                "color": discord.Color.gold(),
-                "emoji": "👋",
-                "footer": "¡Te damos la bienvenida!"
-            }
-        }
-
-        # Colores predefinidos
-        self.colors = {
-            "rojo": discord.Color.red(),
-            "verde": discord.Color.green(),
-            "azul": discord.Color.blue(),
-            "naranja": discord.Color.orange(),
-            "morado": discord.Color.purple(),
-            "rosa": discord.Color.magenta(),
-            "dorado": discord.Color.gold(),
-            "gris": discord.Color.light_grey(),
-            "gris_oscuro": discord.Color.dark_grey(),
-            "amarillo": discord.Color.from_rgb(255, 255, 0),
-            "cyan": discord.Color.from_rgb(0, 255, 255),
-            "negro": discord.Color.from_rgb(0, 0, 0),
-            "blanco": discord.Color.from_rgb(255, 255, 255)
-        }
+        # Plantillas y colores predefinidos (compartidos, definidos a nivel de módulo)
+        self.templates = TEMPLATES
+        self.colors = COLORS
 
     async def check_admin_permissions(self, interaction: discord.Interaction) -> bool:
         """Verifica si el usuario tiene permisos de administrador"""
@@ -90,28 +255,10 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
             )
             return False
 
-        member = interaction.user
-
-        # Owner del bot siempre puede
-        if await self.bot.is_owner(member):
-            return True
+        perms = self.bot.permissions.resolve(interaction.user)
 
-        # Administradores del servidor pueden
-        if member.guild_permissions.administrator:
-            return True
-
-        # Verificar si tiene permiso de gestionar mensajes
-        if member.guild_permissions.manage_messages:
-            return True
-
-        # Verificar roles de admin configurados
-        admin_roles = self.bot.settings.ADMIN_ROLE_IDS
-        if admin_roles and any(role.id in admin_roles for role in member.roles):
-            return True
-
-        # Verificar roles de moderador configurados
-        mod_roles = self.bot.settings.MOD_ROLE_IDS
-        if mod_roles and any(role.id in mod_roles for role in member.roles):
+        # Owner, administradores, roles de admin/moderador o gestionar mensajes
+        if perms.is_moderator or perms.manage_messages:
             return True
 
         # Si no tiene permisos, enviar mensaje de error
@@ -127,23 +274,7 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
 
     def parse_color(self, color_input: str) -> discord.Color:
         """Convierte input de color a objeto Color de Discord"""
-
-        # Limpiar input
-        color_input = color_input.lower().strip()
-
-        # Verificar si es un color predefinido
-        if color_input in self.colors:
-            return self.colors[color_input]
-
-        # Verificar si es hex válido
-        hex_pattern = re.compile(r'^#?([A-Fa-f0-9]{6})$')
-        match = hex_pattern.match(color_input)
-        if match:
-            hex_code = match.group(1)
-            return discord.Color(int(hex_code, 16))
-
-        # Color por defecto si no se reconoce
-        return discord.Color.blue()
+        return parse_color(color_input)
 
     def create_embed(
             self,
@@ -154,38 +285,25 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
             thumbnail_url: Optional[str] = None,
             timestamp: bool = True,
             author_name: Optional[str] = None,
-            fields: Optional[list] = None
+            fields: Optional[list] = None,
+            template: Optional[EmbedTemplate] = None
     ) -> discord.Embed:
-        """Crea un embed con los parámetros especificados"""
+        """Crea un embed con los parámetros especificados (sobre el payload de `template` si se indica)"""
+
+        if template is not None:
+            return render_embed(
+                template.payload, title, description,
+                footer=footer,
+                thumbnail_url=thumbnail_url, timestamp=timestamp,
+                author_name=author_name, fields=fields
+            )
 
-        embed = discord.Embed(
-            title=title,
-            description=description,
-            color=color
+        return render_embed(
+            DEFAULT_PAYLOAD, title, description,
+            color=color, footer=footer, thumbnail_url=thumbnail_url,
+            timestamp=timestamp, author_name=author_name, fields=fields
         )
 
-        if timestamp:
-            embed.timestamp = discord.utils.utcnow()
-
-        if footer:
-            embed.set_footer(text=footer)
-
-        if thumbnail_url:
-            embed.set_thumbnail(url=thumbnail_url)
-
-        if author_name:
-            embed.set_author(name=author_name)
-
-        if fields:
-            for field in fields:
-                embed.add_field(
-                    name=field.get("name", "Campo"),
-                    value=field.get("value", "Valor"),
-                    inline=field.get("inline", False)
-                )
-
-        return embed
-
     async def log_embed_action(
             self,
             interaction: discord.Interaction,
@@ -196,8 +314,8 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
         """Registra el envío de embeds en los logs"""
 
         logger.info(
-            f"📨 Embed enviado por {interaction.user.name} ({interaction.user.id}) "
-            f"en #{target_channel.name}: '{embed_title}' (Tipo: {command_type})"
+            "📨 Embed enviado por %s (%s) en #%s: '%s' (Tipo: %s)",
+            interaction.user.name, interaction.user.id, target_channel.name, embed_title, command_type
         )
 
     # ====================================
@@ -273,7 +391,7 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
                 ephemeral=True
             )
         except Exception as e:
-            logger.error(f"Error enviando embed simple: {e}")
+            logger.error("Error enviando embed simple: %s", e)
             await interaction.response.send_message(
                 "❌ Error inesperado al enviar el embed.",
                 ephemeral=True
@@ -378,7 +496,7 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
                 ephemeral=True
             )
         except Exception as e:
-            logger.error(f"Error enviando embed avanzado: {e}")
+            logger.error("Error enviando embed avanzado: %s", e)
             await interaction.response.send_message(
                 "❌ Error inesperado al enviar el embed.",
                 ephemeral=True
@@ -423,15 +541,14 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
         template = self.templates[tipo]
 
         # Crear título con emoji
-        full_title = f"{template['emoji']} {titulo}"
+        full_title = f"{template.emoji} {titulo}"
 
         # Crear embed con plantilla
         embed = self.create_embed(
             title=full_title,
             description=contenido,
-            color=template["color"],
-            footer=template["footer"],
-            thumbnail_url=interaction.guild.icon.url if interaction.guild.icon else None
+            thumbnail_url=interaction.guild.icon.url if interaction.guild.icon else None,
+            template=template
         )
 
         try:
@@ -445,7 +562,7 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
             )
             confirm_embed.add_field(
                 name="📋 Plantilla",
-                value=f"{template['emoji']} {tipo.title()}",
+                value=f"{template.emoji} {tipo.title()}",
                 inline=True
             )
             confirm_embed.add_field(
@@ -470,7 +587,7 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
                 ephemeral=True
             )
         except Exception as e:
-            logger.error(f"Error enviando embed con plantilla: {e}")
+            logger.error("Error enviando embed con plantilla: %s", e)
             await interaction.response.send_message(
                 "❌ Error inesperado al enviar el embed.",
                 ephemeral=True
@@ -502,24 +619,24 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
             return
 
         # Determinar configuración del embed
+        thumbnail_url = interaction.guild.icon.url if interaction.guild.icon else None
+
         if tipo_plantilla:
             template = self.templates[tipo_plantilla]
-            embed_color = template["color"]
-            full_title = f"{template['emoji']} {titulo}"
-            footer_text = template["footer"]
+            preview_embed = self.create_embed(
+                title=f"{template.emoji} {titulo}",
+                description=descripcion,
+                thumbnail_url=thumbnail_url,
+                template=template
+            )
         else:
-            embed_color = self.parse_color(color) if color else discord.Color.blue()
-            full_title = titulo
-            footer_text = f"Vista previa - por {interaction.user.display_name}"
-
-        # Crear embed de preview
-        preview_embed = self.create_embed(
-            title=full_title,
-            description=descripcion,
-            color=embed_color,
-            footer=footer_text,
-            thumbnail_url=interaction.guild.icon.url if interaction.guild.icon else None
-        )
+            preview_embed = self.create_embed(
+                title=titulo,
+                description=descripcion,
+                color=self.parse_color(color) if color else discord.Color.blue(),
+                footer=f"Vista previa - por {interaction.user.display_name}",
+                thumbnail_url=thumbnail_url
+            )
 
         # Embed de información sobre el preview
         info_embed = discord.Embed(
@@ -531,7 +648,7 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
         if tipo_plantilla:
             info_embed.add_field(
                 name="📋 Plantilla",
-                value=f"{self.templates[tipo_plantilla]['emoji']} {tipo_plantilla.title()}",
+                value=f"{self.templates[tipo_plantilla].emoji} {tipo_plantilla.title()}",
                 inline=True
             )
 
@@ -547,6 +664,200 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
             ephemeral=True
         )
 
+    # ====================================
+    # DIFUSIÓN A VARIOS CANALES
+    # ====================================
+
+    def resolve_broadcast_targets(
+            self,
+            interaction: discord.Interaction,
+            categoria: Optional[discord.CategoryChannel],
+            canales: Optional[str]
+    ) -> Tuple[List[discord.TextChannel], List[str]]:
+        """Canales de texto de destino y los descartados (con motivo)"""
+
+        candidates: Dict[int, Optional[discord.abc.GuildChannel]] = {}
+        if categoria:
+            for channel in categoria.text_channels:
+                candidates[channel.id] = channel
+        for channel_id in CHANNEL_ID.findall(canales or ""):
+            candidates.setdefault(int(channel_id), interaction.guild.get_channel(int(channel_id)))
+
+        targets = []
+        skipped = []
+        for channel_id, channel in candidates.items():
+            if not isinstance(channel, discord.TextChannel):
+                skipped.append(f"<#{channel_id}>: no es un canal de texto de este servidor")
+            elif not channel.permissions_for(interaction.user).send_messages:
+                skipped.append(f"{channel.mention}: no puedes escribir en él")
+            else:
+                targets.append(channel)
+
+        return targets, skipped
+
+    @admin_group.command(
+        name="difusion",
+        description="Envía un embed a varios canales a la vez (ahora o más tarde)"
+    )
+    @app_commands.describe(
+        titulo="Título del embed",
+        descripcion="Contenido principal del embed",
+        categoria="Enviar a todos los canales de texto de esta categoría",
+        canales="Menciones o IDs de canales separados por espacios",
+        plantilla="Plantilla predefinida (opcional)",
+        color="Color del embed si no se usa plantilla (nombre o código hex)",
+        en_minutos="Programar el envío dentro de N minutos (opcional)"
+    )
+    async def difusion(
+            self,
+            interaction: discord.Interaction,
+            titulo: str,
+            descripcion: str,
+            categoria: Optional[discord.CategoryChannel] = None,
+            canales: Optional[str] = None,
+            plantilla: Optional[Literal["anuncio", "reglas", "informacion", "aviso", "evento", "bienvenida"]] = None,
+            color: Optional[str] = None,
+            en_minutos: Optional[app_commands.Range[int, 1, 10080]] = None
+    ):
+        """Difunde un embed a una categoría o lista de canales"""
+
+        # Verificar permisos
+        if not await self.check_admin_permissions(interaction):
+            return
+
+        targets, skipped = self.resolve_broadcast_targets(interaction, categoria, canales)
+
+        if not targets:
+            await interaction.response.send_message(
+                "❌ No hay canales de destino válidos. Indica una `categoria` o `canales`."
+                + ("\n" + "\n".join(skipped[:10]) if skipped else ""),
+                ephemeral=True
+            )
+            return
+
+        if len(targets) > MAX_BROADCAST_CHANNELS:
+            await interaction.response.send_message(
+                f"❌ Demasiados canales ({len(targets)}); el máximo por difusión es {MAX_BROADCAST_CHANNELS}.",
+                ephemeral=True
+            )
+            return
+
+        # Crear embed
+        thumbnail_url = interaction.guild.icon.url if interaction.guild.icon else None
+        if plantilla:
+            template = self.templates[plantilla]
+            embed = self.create_embed(
+                title=f"{template.emoji} {titulo}",
+                description=descripcion,
+                thumbnail_url=thumbnail_url,
+                template=template
+            )
+        else:
+            embed = self.create_embed(
+                title=titulo,
+                description=descripcion,
+                color=self.parse_color(color) if color else discord.Color.blue(),
+                footer=f"Enviado por {interaction.user.display_name}",
+                thumbnail_url=thumbnail_url
+            )
+
+        broadcasts = self.bot.broadcasts
+
+        # Envío programado
+        if en_minutos:
+            run_at = discord.utils.utcnow() + timedelta(minutes=en_minutos)
+            job_id = broadcasts.schedule(
+                interaction.guild.id,
+                [channel.id for channel in targets],
+                embed,
+                run_at.timestamp(),
+                interaction.user.id
+            )
+
+            await interaction.response.send_message(
+                f"📅 Difusión **#{job_id}** programada para {discord.utils.format_dt(run_at, 'F')} "
+                f"({discord.utils.format_dt(run_at, 'R')}) en {len(targets)} canal(es)."
+                + ("\n⚠️ Descartados:\n" + "\n".join(skipped[:10]) if skipped else ""),
+                ephemeral=True
+            )
+            logger.info(
+                "📅 Difusión #%s programada por %s (%s) para %s en %s canal(es): '%s'",
+                job_id, interaction.user.name, interaction.user.id, run_at.isoformat(), len(targets), titulo
+            )
+            return
+
+        # Envío inmediato (puede tardar: responder después)
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        result = await broadcasts.send(targets, embed)
+
+        summary = discord.Embed(
+            title="📣 Difusión Enviada" if not result.failed else "📣 Difusión Enviada con Errores",
+            color=discord.Color.green() if not result.failed else discord.Color.orange()
+        )
+        summary.add_field(name="✅ Enviados", value=str(len(result.sent)), inline=True)
+        summary.add_field(name="❌ Con error", value=str(len(result.failed)), inline=True)
+
+        problems = [f"<#{outcome.channel_id}>: {outcome.error}" for outcome in result.failed] + skipped
+        if problems:
+            summary.add_field(
+                name="⚠️ Detalle",
+                value="\n".join(problems[:15]) + (f"\n... y {len(problems) - 15} más" if len(problems) > 15 else ""),
+                inline=False
+            )
+
+        await interaction.followup.send(embed=summary, ephemeral=True)
+        logger.info(
+            "📣 Difusión de %s (%s): '%s' en %s canal(es), %s con error",
+            interaction.user.name, interaction.user.id, titulo, len(result.sent), len(result.failed)
+        )
+
+    @admin_group.command(
+        name="difusion-pendientes",
+        description="Lista las difusiones programadas de este servidor"
+    )
+    async def difusion_pendientes(self, interaction: discord.Interaction):
+        """Muestra los envíos programados pendientes"""
+
+        # Verificar permisos
+        if not await self.check_admin_permissions(interaction):
+            return
+
+        jobs = self.bot.broadcasts.pending(interaction.guild.id)
+        if not jobs:
+            await interaction.response.send_message("📭 No hay difusiones programadas.", ephemeral=True)
+            return
+
+        embed = discord.Embed(title="📅 Difusiones Programadas", color=discord.Color.blue())
+        for job_id, record in jobs[:25]:
+            run_at = datetime.fromtimestamp(record["run_at"], timezone.utc)
+            embed.add_field(
+                name=f"#{job_id} · {record['embed'].get('title', 'Sin título')}"[:256],
+                value=f"{discord.utils.format_dt(run_at, 'R')} · {len(record['channel_ids'])} canal(es) · "
+                      f"por <@{record['author_id']}>",
+                inline=False
+            )
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @admin_group.command(
+        name="difusion-cancelar",
+        description="Cancela una difusión programada"
+    )
+    @app_commands.describe(numero="Número de la difusión (ver /admin difusion-pendientes)")
+    async def difusion_cancelar(self, interaction: discord.Interaction, numero: int):
+        """Cancela un envío programado"""
+
+        # Verificar permisos
+        if not await self.check_admin_permissions(interaction):
+            return
+
+        if not self.bot.broadcasts.cancel(numero, interaction.guild.id):
+            await interaction.response.send_message(f"❌ No hay ninguna difusión programada **#{numero}**.", ephemeral=True)
+            return
+
+        await interaction.response.send_message(f"🗑️ Difusión **#{numero}** cancelada.", ephemeral=True)
+        logger.info("🗑️ Difusión #%s cancelada por %s (%s)", numero, interaction.user.name, interaction.user.id)
+
     @admin_group.command(
         name="embed-ayuda",
         description="Guía completa para usar los comandos de embeds"
@@ -572,6 +883,8 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
                   "`/admin embed-avanzado` - Embed personalizable\n"
                   "`/admin embed-plantilla` - Usando plantillas\n"
                   "`/admin embed-preview` - Vista previa\n"
+                  "`/admin difusion` - Enviar a varios canales (o programarlo)\n"
+                  "`/admin difusion-pendientes` - Difusiones programadas\n"
                   "`/admin embed-ayuda` - Esta ayuda",
             inline=False
         )
@@ -579,7 +892,7 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
         # Plantillas disponibles
         templates_text = ""
         for name, template in self.templates.items():
-            templates_text += f"{template['emoji']} **{name.title()}** - {template['footer']}\n"
+            templates_text += f"{template.emoji} **{name.title()}** - {template.footer}\n"
 
         help_embed.add_field(
             name="📋 Plantillas Disponibles",
@@ -635,11 +948,10 @@ class AdminEmbeds(commands.Cog, name="Admin Embeds"):
         # Crear un embed de ejemplo para cada plantilla
         for name, template in self.templates.items():
             example_embed = self.create_embed(
-                title=f"{template['emoji']} Ejemplo de {name.title()}",
+                title=f"{template.emoji} Ejemplo de {name.title()}",
                 description=f"Este es un ejemplo de cómo se ve la plantilla '{name}'. "
                             f"Úsala para {name.replace('_', ' ')} del servidor.",
-                color=template["color"],
-                footer=template["footer"]
+                template=template
             )
             embeds.append(example_embed)
 
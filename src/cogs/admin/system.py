@@ -0,0 +1,285 @@
+"""
+Comandos de sistema para los owners del bot
+Informatica UAIn'T Community Bot
+"""
+
+import logging
+from typing import Optional
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+logger = logging.getLogger(__name__)
+
+# Se importa con el primer uso de sus comandos (ver core.extensions)
+EXTENSION_LAZY = True
+
+
+class SystemCommands(commands.Cog, name="Sistema"):
+    """Operación del bot en caliente (solo owners)"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def check_owner(self, interaction: discord.Interaction) -> bool:
+        """Verifica que el usuario sea owner del bot"""
+
+        if await self.bot.is_owner(interaction.user):
+            return True
+
+        await interaction.response.send_message(
+            "❌ Solo los owners del bot pueden usar este comando.",
+            ephemeral=True
+        )
+        return False
+
+    async def check_admin(self, interaction: discord.Interaction) -> bool:
+        """Verifica que el usuario sea administrador (o owner del bot)"""
+
+        if isinstance(interaction.user, discord.Member):
+            if self.bot.permissions.resolve(interaction.user).is_admin:
+                return True
+        elif await self.bot.is_owner(interaction.user):
+            return True
+
+        await interaction.response.send_message(
+            "❌ Solo los administradores pueden usar este comando.",
+            ephemeral=True
+        )
+        return False
+
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        if seconds >= 1:
+            return f"{seconds:.2f}s"
+        if seconds >= 0.001:
+            return f"{seconds * 1000:.1f}ms"
+        return f"{seconds * 1_000_000:.0f}µs"
+
+    # ====================================
+    # RENDIMIENTO
+    # ====================================
+
+    @app_commands.command(
+        name="perf",
+        description="Coste de los listeners de eventos por evento y cog"
+    )
+    @app_commands.describe(
+        ordenar="Criterio de orden",
+        evento="Filtrar por nombre de evento (p.ej. voice_state_update)",
+        reiniciar="Reiniciar los contadores después de mostrarlos"
+    )
+    @app_commands.choices(ordenar=[
+        app_commands.Choice(name="Tiempo total", value="total"),
+        app_commands.Choice(name="p99", value="p99"),
+        app_commands.Choice(name="Máximo", value="max"),
+        app_commands.Choice(name="Número de eventos", value="count"),
+    ])
+    @app_commands.default_permissions(administrator=True)
+    async def perf(
+        self,
+        interaction: discord.Interaction,
+        ordenar: str = "total",
+        evento: Optional[str] = None,
+        reiniciar: bool = False
+    ):
+        """Muestra count, p50/p95/p99 y máximo por (evento, cog)"""
+
+        if not await self.check_admin(interaction):
+            return
+
+        metrics = self.bot.metrics
+        stats = metrics.dispatch_stats
+        since = metrics.dispatch_stats_since
+
+        rows = list(stats.items())
+        if evento:
+            needle = evento.lower().removeprefix("on_")
+            rows = [row for row in rows if needle in row[0][0]]
+
+        sort_keys = {
+            "total": lambda row: row[1].total,
+            "p99": lambda row: row[1].percentile(99),
+            "max": lambda row: row[1].max,
+            "count": lambda row: row[1].count,
+        }
+        rows.sort(key=sort_keys.get(ordenar, sort_keys["total"]), reverse=True)
+
+        embed = discord.Embed(
+            title="⏱️ Rendimiento de Listeners",
+            description=f"Desde <t:{int(since)}:R> • {len(rows)} combinaciones evento/cog",
+            color=discord.Color.blue()
+        )
+
+        fmt = self.format_duration
+        for (event_name, cog_name), histogram in rows[:15]:
+            embed.add_field(
+                name=f"on_{event_name} • {cog_name}"[:256],
+                value=(
+                    f"`{histogram.count}` eventos • total {fmt(histogram.total)}\n"
+                    f"p50 {fmt(histogram.percentile(50))} • p95 {fmt(histogram.percentile(95))} • "
+                    f"p99 {fmt(histogram.percentile(99))} • máx {fmt(histogram.max)}"
+                ),
+                inline=False
+            )
+
+        if not rows:
+            embed.add_field(name="Sin datos", value="No se han registrado eventos todavía.", inline=False)
+        elif len(rows) > 15:
+            embed.set_footer(text=f"Mostrando 15 de {len(rows)}")
+
+        if reiniciar:
+            metrics.reset_dispatch_stats()
+            logger.info("⏱️ Contadores de /perf reiniciados por %s (%s)", interaction.user.name, interaction.user.id)
+            embed.set_footer(text=f"{embed.footer.text + ' • ' if embed.footer.text else ''}Contadores reiniciados")
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    # ====================================
+    # GRUPO DE COMANDOS DE SISTEMA
+    # ====================================
+
+    system_group = app_commands.Group(
+        name="sistema",
+        description="Operación del bot (solo owners)",
+        default_permissions=discord.Permissions(administrator=True)
+    )
+
+    @system_group.command(
+        name="recargar-config",
+        description="Vuelve a leer .env y aplica la configuración sin reiniciar"
+    )
+    async def recargar_config(self, interaction: discord.Interaction):
+        """Recarga la configuración del bot"""
+
+        if not await self.check_owner(interaction):
+            return
+
+        try:
+            changed = self.bot.reload_settings()
+
+        except ValueError as e:
+            embed = discord.Embed(
+                title="❌ Configuración Inválida",
+                description=f"Se mantiene la configuración anterior.\n```{str(e)[:1900]}```",
+                color=discord.Color.red()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        logger.info("🔄 Configuración recargada por %s (%s)", interaction.user.name, interaction.user.id)
+
+        if not changed:
+            embed = discord.Embed(
+                title="🔄 Configuración Recargada",
+                description="No hubo cambios.",
+                color=discord.Color.blue()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        embed = discord.Embed(
+            title="✅ Configuración Recargada",
+            color=discord.Color.green()
+        )
+
+        embed.add_field(
+            name="📝 Cambios aplicados",
+            value="\n".join(f"• `{name}`" for name in changed)[:1024],
+            inline=False
+        )
+
+        pending_restart = [name for name in changed if name in self.bot.settings.RESTART_REQUIRED]
+        if pending_restart:
+            embed.add_field(
+                name="⚠️ Requieren reinicio",
+                value="\n".join(f"• `{name}`" for name in pending_restart),
+                inline=False
+            )
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @system_group.command(
+        name="vigilancia",
+        description="Activa o desactiva la vigilancia de bloqueos del event loop"
+    )
+    @app_commands.describe(
+        activar="Activar o desactivar la vigilancia",
+        umbral_ms="Retraso del loop (ms) a partir del cual se registra un bloqueo"
+    )
+    async def vigilancia(
+        self,
+        interaction: discord.Interaction,
+        activar: bool,
+        umbral_ms: Optional[app_commands.Range[int, 10, 10_000]] = None
+    ):
+        """Activa o desactiva el watchdog del event loop"""
+
+        if not await self.check_owner(interaction):
+            return
+
+        watchdog = self.bot.watchdog
+        if umbral_ms is not None:
+            watchdog.threshold = umbral_ms / 1000
+
+        if activar:
+            watchdog.start()
+        else:
+            await watchdog.stop()
+
+        logger.info(
+            "🐕 Vigilancia del event loop %s por %s (%s)",
+            "activada" if activar else "desactivada", interaction.user.name, interaction.user.id
+        )
+
+        embed = discord.Embed(
+            title=f"🐕 Vigilancia {'Activada' if activar else 'Desactivada'}",
+            description=f"Umbral: **{watchdog.threshold * 1000:.0f}ms**",
+            color=discord.Color.green() if activar else discord.Color.light_grey()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @system_group.command(
+        name="bloqueos",
+        description="Muestra los últimos bloqueos del event loop detectados"
+    )
+    async def bloqueos(self, interaction: discord.Interaction):
+        """Lista los bloqueos registrados por el watchdog"""
+
+        if not await self.check_owner(interaction):
+            return
+
+        watchdog = self.bot.watchdog
+
+        embed = discord.Embed(
+            title="🐢 Bloqueos del Event Loop",
+            color=discord.Color.orange()
+        )
+        embed.set_footer(
+            text=f"Vigilancia {'activa' if watchdog.enabled else 'inactiva'} • "
+                 f"umbral {watchdog.threshold * 1000:.0f}ms"
+        )
+
+        if not watchdog.reports:
+            embed.description = "No se han detectado bloqueos."
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        for report in reversed(list(watchdog.reports)[-10:]):
+            embed.add_field(
+                name=f"{report.duration * 1000:.0f}ms • {report.culprit}"[:256],
+                value=(
+                    f"<t:{int(report.started_at)}:R> • tarea `{report.task or '?'}` • "
+                    f"{report.samples} muestras\n"
+                    f"```{report.stack[-1].strip()[:300] if report.stack else '?'}```"
+                ),
+                inline=False
+            )
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Función para cargar el cog"""
+    await bot.add_cog(SystemCommands(bot))
+    logger.info("✅ Comandos de sistema cargados")
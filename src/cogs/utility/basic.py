@@ -32,6 +32,26 @@ class BasicCommands(commands.Cog, name="Utilidad"):
             discord.Color.red()
         )
 
+        # Detalle por shard cuando el proceso gestiona más de uno
+        shards = self.bot.shard_monitor.snapshot()
+        if interaction.guild:
+            embed.set_footer(text=f"Shard de este servidor: {interaction.guild.shard_id} de {self.bot.shard_count}")
+
+        if len(shards) > 1:
+            lines = []
+            for shard in shards[:20]:
+                status = "🟢" if shard["connected"] else "🔴"
+                shard_latency = f"{shard['latency_ms']:.0f}ms" if shard["latency_ms"] is not None else "—"
+                lines.append(
+                    f"{status} **#{shard['shard_id']}** {shard_latency} · "
+                    f"{shard['guilds']} servidores · {shard['reconnects']} reconexiones"
+                )
+
+            if len(shards) > 20:
+                lines.append(f"… y {len(shards) - 20} shards más")
+
+            embed.add_field(name="🧩 Shards", value="\n".join(lines), inline=False)
+
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="info", description="Información del bot")
@@ -90,6 +110,12 @@ class BasicCommands(commands.Cog, name="Utilidad"):
 
         guild = interaction.guild
 
+        # El owner puede no estar en la caché del gateway (perfiles voice/minimal)
+        try:
+            owner = await self.bot.members.fetch(guild, guild.owner_id) if guild.owner_id else None
+        except discord.HTTPException:
+            owner = None
+
         embed = discord.Embed(
             title=f"🏠 {guild.name}",
             color=discord.Color.blue(),
@@ -109,7 +135,7 @@ class BasicCommands(commands.Cog, name="Utilidad"):
         embed.add_field(
             name="ℹ️ Información",
             value=f"**Creado:** <t:{int(guild.created_at.timestamp())}:D>\n"
-                  f"**Owner:** {guild.owner.mention if guild.owner else 'Desconocido'}\n"
+                  f"**Owner:** {owner.mention if owner else 'Desconocido'}\n"
                   f"**Nivel de verificación:** {guild.verification_level.name.title()}",
             inline=True
         )
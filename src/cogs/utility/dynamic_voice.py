@@ -3,16 +3,268 @@ Sistema de Canales de Voz Dinámicos
 Informatica UAIn'T Community Bot
 """
 
+import re
+import math
+import time
 import logging
 import asyncio
 import discord
+from collections import deque
 from discord.ext import commands, tasks
 from discord import app_commands
-from typing import Dict, Set, Optional
-from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Set, Optional, Tuple
+from datetime import datetime
+
+from core.actions import ActionKind
+from core.scheduler import DeadlineScheduler
 
 logger = logging.getLogger(__name__)
 
+# Namespace de los canales temporales en el almacenamiento de estado
+STATE_NAMESPACE = "dynamic_voice.temp_channels"
+
+# Namespace de los canales reservados (pool) en el almacenamiento de estado
+POOL_NAMESPACE = "dynamic_voice.pool"
+
+
+class ChannelPool:
+    """
+    Reserva de canales de voz ocultos pre-creados por categoría.
+
+    El tamaño objetivo de cada categoría se ajusta a la tasa reciente de
+    entradas al trigger: las entradas esperadas en `horizon` segundos,
+    acotadas entre `min_size` y `max_size`.
+    """
+
+    def __init__(self, min_size: int, max_size: int, window: float = 300, horizon: float = 60):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.window = window
+        self.horizon = horizon
+
+        self.channels: Dict[int, Deque[int]] = {}  # category_id -> canales listos
+        self.joins: Dict[int, Deque[float]] = {}  # category_id -> instantes de entrada
+        self._categories: Dict[int, int] = {}  # channel_id -> category_id
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self._categories
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._categories))
+
+    def size(self, category_id: int) -> int:
+        return len(self.channels.get(category_id, ()))
+
+    def record_join(self, category_id: int, now: float) -> None:
+        """Registra una entrada al trigger de la categoría"""
+        joins = self.joins.setdefault(category_id, deque())
+        joins.append(now)
+        self._prune(joins, now)
+
+    def _prune(self, joins: Deque[float], now: float) -> None:
+        while joins and now - joins[0] > self.window:
+            joins.popleft()
+
+    def target_size(self, category_id: int, now: float) -> int:
+        """Tamaño deseado de la reserva según la tasa de entradas reciente"""
+        joins = self.joins.get(category_id)
+        if joins:
+            self._prune(joins, now)
+
+        expected = math.ceil(len(joins or ()) / self.window * self.horizon)
+        return max(self.min_size, min(self.max_size, expected))
+
+    def add(self, category_id: int, channel_id: int) -> None:
+        self.channels.setdefault(category_id, deque()).append(channel_id)
+        self._categories[channel_id] = category_id
+
+    def take(self, category_id: int) -> Optional[int]:
+        """Extrae un canal listo de la categoría"""
+        channels = self.channels.get(category_id)
+        if not channels:
+            return None
+
+        channel_id = channels.popleft()
+        del self._categories[channel_id]
+        return channel_id
+
+    def discard(self, channel_id: int) -> None:
+        category_id = self._categories.pop(channel_id, None)
+        if category_id is not None:
+            self.channels[category_id].remove(channel_id)
+
+
+class TriggerRegistry:
+    """
+    Índice de canales trigger por ID.
+
+    Los nombres configurados se compilan en una sola expresión regular y cada
+    canal se evalúa una vez al crearse o renombrarse, de modo que comprobar si
+    un canal es trigger es una búsqueda en un set. Los IDs fijados son trigger
+    siempre; los canales cuyo nombre empieza por un prefijo excluido (canales
+    temporales, reserva) nunca lo son.
+    """
+
+    def __init__(
+            self,
+            names: Iterable[str],
+            pinned_ids: Iterable[int] = (),
+            excluded_prefixes: Iterable[str] = ()
+    ):
+        self.channels: Set[int] = set()
+        self.pinned_ids: frozenset = frozenset()
+        self.excluded_prefixes: Tuple[str, ...] = ()
+        self.pattern: Optional[re.Pattern] = None
+        self.configure(names, pinned_ids, excluded_prefixes)
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self.channels
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.channels)
+
+    def configure(
+            self,
+            names: Iterable[str],
+            pinned_ids: Iterable[int] = (),
+            excluded_prefixes: Iterable[str] = ()
+    ) -> None:
+        """Compila los criterios; los canales ya indexados se conservan hasta `rebuild`"""
+
+        # Más largos primero para que la alternancia prefiera la coincidencia completa
+        names = sorted({name.casefold() for name in names if name}, key=len, reverse=True)
+        self.pattern = re.compile("|".join(map(re.escape, names))) if names else None
+        self.pinned_ids = frozenset(pinned_ids)
+        self.excluded_prefixes = tuple(prefix.casefold() for prefix in excluded_prefixes if prefix)
+
+    def matches(self, channel: discord.abc.GuildChannel) -> bool:
+        """Indica si un canal cumple los criterios de trigger"""
+
+        if not isinstance(channel, discord.VoiceChannel):
+            return False
+
+        if channel.id in self.pinned_ids:
+            return True
+
+        if self.pattern is None:
+            return False
+
+        name = channel.name.casefold()
+        if name.startswith(self.excluded_prefixes):
+            return False
+
+        return self.pattern.search(name) is not None
+
+    def update(self, channel: discord.abc.GuildChannel) -> Optional[bool]:
+        """
+        Reevalúa un canal creado o modificado.
+
+        Devuelve True si pasó a ser trigger, False si dejó de serlo y None si
+        no cambió.
+        """
+
+        is_trigger = self.matches(channel)
+        was_trigger = channel.id in self.channels
+
+        if is_trigger == was_trigger:
+            return None
+
+        if is_trigger:
+            self.channels.add(channel.id)
+        else:
+            self.channels.discard(channel.id)
+        return is_trigger
+
+    def discard(self, channel_id: int) -> bool:
+        if channel_id in self.channels:
+            self.channels.discard(channel_id)
+            return True
+        return False
+
+    def rebuild(self, guild: discord.Guild) -> None:
+        """Recorre los canales de voz del servidor (solo al iniciar o cambiar criterios)"""
+        self.channels = {channel.id for channel in guild.voice_channels if self.matches(channel)}
+
+
+class GuildVoiceConfig(NamedTuple):
+    """Configuración efectiva de un servidor (globales + ajustes del servidor)"""
+
+    enabled: bool
+    trigger_names: Tuple[str, ...]
+    trigger_channel_ids: FrozenSet[int]
+    channel_prefix: str
+    cleanup_delay: int
+    pool_enabled: bool
+
+    @classmethod
+    def for_guild(cls, settings, guild_id: int) -> "GuildVoiceConfig":
+        overrides = settings.DYNAMIC_VOICE_GUILD_OVERRIDES.get(guild_id, {})
+        return cls(
+            enabled=overrides.get("enabled", True),
+            trigger_names=overrides.get("trigger_names", settings.DYNAMIC_VOICE_TRIGGER_NAMES),
+            trigger_channel_ids=overrides.get("trigger_channel_ids", settings.DYNAMIC_VOICE_TRIGGER_CHANNEL_IDS),
+            channel_prefix=overrides.get("channel_prefix", settings.DYNAMIC_VOICE_CHANNEL_PREFIX),
+            cleanup_delay=overrides.get("cleanup_delay", settings.DYNAMIC_VOICE_CLEANUP_DELAY),
+            pool_enabled=overrides.get("pool_enabled", settings.DYNAMIC_VOICE_POOL_ENABLED),
+        )
+
+
+class GuildVoiceState:
+    """
+    Partición del estado de canales dinámicos de un servidor.
+
+    Cada servidor tiene sus propios índices, lock y límite de eliminaciones,
+    así que los servidores no compiten entre sí. Las particiones se crean al
+    aparecer un trigger o un canal temporal y se liberan cuando quedan vacías.
+    """
+
+    __slots__ = (
+        "guild_id", "config", "triggers", "temp_channels", "user_channels",
+        "occupancy", "empty_since", "pool", "refilling", "lock", "deletion_slots",
+    )
+
+    def __init__(self, guild_id: int, config: GuildVoiceConfig, excluded_prefixes: Tuple[str, ...],
+                 pool: Optional[ChannelPool], max_concurrent_deletions: int):
+        self.guild_id = guild_id
+        self.config = config
+
+        self.triggers = TriggerRegistry(
+            config.trigger_names,
+            pinned_ids=config.trigger_channel_ids,
+            excluded_prefixes=excluded_prefixes
+        )
+        self.temp_channels: Dict[int, Dict] = {}  # channel_id -> info
+        self.user_channels: Dict[int, int] = {}  # user_id -> channel_id que creó
+
+        # Ocupación incremental de canales temporales
+        self.occupancy: Dict[int, int] = {}  # channel_id -> miembros conectados
+        self.empty_since: Dict[int, float] = {}  # channel_id -> vacío desde (reloj del loop), en orden
+
+        # Reserva opcional de canales pre-creados
+        self.pool = pool
+        self.refilling: Set[int] = set()  # categorías con reposición en curso
+
+        # Serializa la asignación de canales dentro del servidor
+        self.lock = asyncio.Lock()
+        self.deletion_slots = asyncio.Semaphore(max_concurrent_deletions)
+
+    @property
+    def idle(self) -> bool:
+        """Sin triggers, canales temporales, reserva ni trabajo en curso"""
+        return (
+            not self.triggers
+            and not self.temp_channels
+            and (self.pool is None or len(self.pool) == 0)
+            and not self.refilling
+            and not self.lock.locked()
+        )
+
 
 class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
     """Sistema de canales de voz dinámicos"""
@@ -21,42 +273,417 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
         self.bot = bot
 
         # Configuración
-        self.trigger_channel_names = ["🔧 Crear Canal", "Crear Canal", "➕ Crear Canal"]
-        self.temp_channel_prefix = "💬 Canal de"
-        self.cleanup_delay = 10  # segundos para verificar canales vacíos
-
-        # Estado interno
-        self.temp_channels: Dict[int, Dict] = {}  # channel_id -> info
-        self.trigger_channels: Set[int] = set()  # IDs de canales trigger
-        self.user_channels: Dict[int, int] = {}  # user_id -> channel_id que creó
+        self.empty_grace = 120  # segundos vacío antes de la limpieza de respaldo
+        self.max_concurrent_deletions = 5  # por servidor
+        self.pool_channel_name = "🔒 Reserva"
+
+        # Particiones por servidor (solo servidores con triggers o canales activos)
+        self.guilds: Dict[int, GuildVoiceState] = {}
+        self._state_restored = False
+
+        # Eliminaciones pendientes de canales vacíos, clave (guild_id, channel_id)
+        self.deletion_scheduler = DeadlineScheduler(
+            self.expire_empty_channels,
+            name="dynamic-voice-deletions"
+        )
 
         # Iniciar tarea de limpieza
         self.cleanup_empty_channels.start()
 
-    def cog_unload(self):
+    async def cog_load(self):
+        """Inicia el planificador de eliminaciones y registra las métricas"""
+        self.deletion_scheduler.start()
+        self.bot.metrics.registry.gauge(
+            "dynamic_voice_channels",
+            "Canales gestionados por el sistema de canales dinámicos",
+            ("kind",),
+            collect=self.metric_samples
+        )
+
+    async def cog_unload(self):
         """Limpieza al descargar el cog"""
         self.cleanup_empty_channels.cancel()
+        self.bot.metrics.registry.unregister("dynamic_voice_channels")
+        await self.deletion_scheduler.stop()
+
+    def metric_samples(self) -> List[Tuple[Tuple[str, ...], float]]:
+        """Totales de todas las particiones (se calcula solo al exportar métricas)"""
+        states = list(self.guilds.values())
+        return [
+            (("temp",), sum(len(state.temp_channels) for state in states)),
+            (("empty",), sum(len(state.empty_since) for state in states)),
+            (("trigger",), sum(len(state.triggers) for state in states)),
+            (("pooled",), sum(len(state.pool) for state in states if state.pool is not None)),
+            (("pending_deletion",), len(self.deletion_scheduler)),
+            (("guilds",), len(states)),
+        ]
 
     @commands.Cog.listener()
     async def on_ready(self):
         """Configurar canales trigger cuando el bot esté listo"""
+        await self.restore_state()
         await self.setup_trigger_channels()
 
-    async def setup_trigger_channels(self):
-        """Identifica y configura los canales trigger existentes"""
+        # Precalentar la reserva de las categorías con trigger
+        for state in self.guilds.values():
+            if state.pool is None:
+                continue
+            for channel_id in state.triggers:
+                channel = self.bot.get_channel(channel_id)
+                if channel and channel.category:
+                    self.request_pool_refill(state, channel.category)
+
+        await self.catch_up_trigger_members()
+
+    @commands.Cog.listener()
+    async def on_settings_reload(self, old, new):
+        """Aplica la configuración nueva (activar o desactivar la reserva requiere recargar el cog)"""
+
+        for state in self.guilds.values():
+            state.config = GuildVoiceConfig.for_guild(new, state.guild_id)
+            state.triggers.configure(
+                state.config.trigger_names,
+                pinned_ids=state.config.trigger_channel_ids,
+                excluded_prefixes=self.excluded_prefixes(state.config)
+            )
+
+            if state.pool is not None:
+                state.pool.min_size = new.DYNAMIC_VOICE_POOL_MIN
+                state.pool.max_size = new.DYNAMIC_VOICE_POOL_MAX
+                state.pool.window = new.DYNAMIC_VOICE_POOL_WINDOW
+
+        if any(getattr(old, name) != getattr(new, name) for name in (
+                "GUILD_ID",
+                "DYNAMIC_VOICE_SCOPE",
+                "DYNAMIC_VOICE_GUILD_OVERRIDES",
+                "DYNAMIC_VOICE_TRIGGER_NAMES",
+                "DYNAMIC_VOICE_TRIGGER_CHANNEL_IDS",
+                "DYNAMIC_VOICE_CHANNEL_PREFIX",
+        )):
+            await self.setup_trigger_channels()
+
+    # ====================================
+    # PARTICIONES POR SERVIDOR
+    # ====================================
+
+    def in_scope(self, guild_id: int) -> bool:
+        """Indica si el servidor está dentro de DYNAMIC_VOICE_SCOPE"""
+        settings = self.bot.settings
+        return settings.DYNAMIC_VOICE_SCOPE == "all" or guild_id == settings.GUILD_ID
+
+    def excluded_prefixes(self, config: GuildVoiceConfig) -> Tuple[str, ...]:
+        """Prefijos de canales gestionados por el bot que nunca son trigger"""
+        return config.channel_prefix, self.pool_channel_name
+
+    def new_state(self, guild_id: int) -> GuildVoiceState:
+        """Construye una partición sin registrarla"""
+
+        settings = self.bot.settings
+        config = GuildVoiceConfig.for_guild(settings, guild_id)
+
+        pool = None
+        if config.pool_enabled:
+            pool = ChannelPool(
+                min_size=settings.DYNAMIC_VOICE_POOL_MIN,
+                max_size=settings.DYNAMIC_VOICE_POOL_MAX,
+                window=settings.DYNAMIC_VOICE_POOL_WINDOW
+            )
+
+        return GuildVoiceState(
+            guild_id,
+            config,
+            excluded_prefixes=self.excluded_prefixes(config),
+            pool=pool,
+            max_concurrent_deletions=self.max_concurrent_deletions
+        )
+
+    def get_state(self, guild_id: int) -> GuildVoiceState:
+        """Obtiene la partición de un servidor, creándola si no existe"""
+        state = self.guilds.get(guild_id)
+        if state is None:
+            state = self.guilds[guild_id] = self.new_state(guild_id)
+        return state
+
+    def view_state(self, guild: discord.Guild) -> GuildVoiceState:
+        """Partición para consultas: la registrada o una vacía sin registrar"""
+        return self.guilds.get(guild.id) or self.new_state(guild.id)
+
+    def release_if_idle(self, state: GuildVoiceState) -> None:
+        """Libera la partición si ya no tiene nada que gestionar"""
+        if state.idle and self.guilds.get(state.guild_id) is state:
+            del self.guilds[state.guild_id]
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        """Indexa los triggers de un servidor nuevo"""
+        await self.setup_trigger_channels(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Descarta la partición de un servidor que dejó de atenderse"""
+        state = self.guilds.pop(guild.id, None)
+        if state is None:
+            return
+
+        for channel_id in list(state.temp_channels):
+            self.cleanup_channel_records(state, channel_id)
+
+        if state.pool is not None:
+            for channel_id in state.pool:
+                self.bot.state.delete(POOL_NAMESPACE, channel_id)
+
+    # ====================================
+    # PERSISTENCIA DE ESTADO
+    # ====================================
+
+    @staticmethod
+    def _serialize_info(info: Dict[str, Any]) -> Dict[str, Any]:
+        """Convierte la información de un canal a un registro persistible"""
+        record = dict(info)
+        record['created_at'] = info['created_at'].isoformat()
+        return record
+
+    @staticmethod
+    def _deserialize_info(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Reconstruye la información de un canal desde un registro"""
+        info = dict(record)
+        info['created_at'] = datetime.fromisoformat(record['created_at'])
+        return info
+
+    async def restore_state(self):
+        """
+        Reconstruye los índices de canales temporales desde el almacenamiento.
+
+        Solo consulta la caché de canales del bot (sin llamadas REST); los
+        registros de canales que ya no existen se descartan. Se restauran los
+        canales de cualquier servidor, aunque ya no esté en el alcance, para
+        que se sigan limpiando.
+        """
+
+        if self._state_restored:
+            return
+        self._state_restored = True
 
-        if not self.bot.main_guild:
+        try:
+            records = await self.bot.state.load(STATE_NAMESPACE)
+        except Exception as e:
+            logger.error("❌ No se pudo cargar el estado de canales dinámicos: %s", e)
             return
 
+        restored = 0
+        empty: List[Tuple[GuildVoiceState, int]] = []
+        for channel_id, record in records.items():
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                self.bot.state.delete(STATE_NAMESPACE, channel_id)
+                continue
+
+            state = self.get_state(channel.guild.id)
+            info = self._deserialize_info(record)
+            state.temp_channels[channel_id] = info
+            state.user_channels[info['owner_id']] = channel_id
+            restored += 1
+
+            # Única lectura completa de ocupación: desde aquí se actualiza por eventos.
+            # Se cuentan los estados de voz, que existen aunque el miembro no esté en caché
+            state.occupancy[channel_id] = len(channel.voice_states)
+            if state.occupancy[channel_id] == 0:
+                empty.append((state, channel_id))
+
+        # Canales vacíos: conservar el plazo que quedaba si el proceso anterior lo guardó
+        snapshot = self.bot.take_snapshot(self.qualified_name) or {}
+        saved_empty = snapshot.get('empty', {})
+        now = asyncio.get_running_loop().time()
+        offset = time.time() - now  # reloj del loop -> reloj de pared
+
+        timers = []
+        for state, channel_id in empty:
+            since, deadline = saved_empty.get(channel_id, (None, None))
+            since = now if since is None else min(since - offset, now)
+            delay = state.config.cleanup_delay if deadline is None else max(deadline - offset - now, 0)
+            timers.append((since, state, channel_id, delay))
+
+        for since, state, channel_id, delay in sorted(timers, key=lambda timer: timer[0]):
+            state.empty_since[channel_id] = since
+            self.deletion_scheduler.schedule((state.guild_id, channel_id), delay)
+
+        discarded = len(records) - restored
+        logger.info(
+            "♻️ Restaurados %s canales temporales en %s servidor(es) (%s registros obsoletos descartados)",
+            restored, len(self.guilds), discarded
+        )
+
+        await self.restore_pool()
+
+        # Ritmo de entradas de la reserva
+        for guild_id, categories in snapshot.get('joins', {}).items():
+            state = self.guilds.get(guild_id)
+            if state is None or state.pool is None:
+                continue
+            for category_id, joins in categories.items():
+                state.pool.joins[category_id] = deque(
+                    min(joined - offset, now) for joined in joins if joined - offset > now - state.pool.window
+                )
+
+        if snapshot:
+            logger.info("♻️ Temporizadores de %s canales vacíos recuperados de la instantánea", len(saved_empty))
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Estado volátil para el traspaso entre procesos (ver UaintBot.drain).
+
+        Los registros de canales ya están en el almacenamiento; aquí solo van
+        los temporizadores de los canales vacíos y el ritmo de entradas de la
+        reserva, con instantes en reloj de pared.
+        """
+
+        offset = time.time() - asyncio.get_running_loop().time()
+        empty: Dict[int, Tuple[float, Optional[float]]] = {}
+        joins: Dict[int, Dict[int, List[float]]] = {}
+
+        for state in self.guilds.values():
+            for channel_id, since in state.empty_since.items():
+                deadline = self.deletion_scheduler.deadline((state.guild_id, channel_id))
+                empty[channel_id] = (since + offset, None if deadline is None else deadline + offset)
+
+            if state.pool is not None and state.pool.joins:
+                joins[state.guild_id] = {
+                    category_id: [joined + offset for joined in category_joins]
+                    for category_id, category_joins in state.pool.joins.items() if category_joins
+                }
+
+        return {'empty': empty, 'joins': joins}
+
+    async def restore_pool(self):
+        """Recupera los canales reservados que siguen existiendo"""
+
+        try:
+            records = await self.bot.state.load(POOL_NAMESPACE)
+        except Exception as e:
+            logger.error("❌ No se pudo cargar la reserva de canales: %s", e)
+            return
+
+        restored = 0
+        for channel_id, record in records.items():
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                self.bot.state.delete(POOL_NAMESPACE, channel_id)
+                continue
+
+            if not GuildVoiceConfig.for_guild(self.bot.settings, channel.guild.id).pool_enabled:
+                continue
+
+            self.get_state(channel.guild.id).pool.add(record['category_id'], channel_id)
+            restored += 1
+
+        if restored:
+            logger.info("♻️ Restaurados %s canales de reserva", restored)
+
+    async def setup_trigger_channels(self, guild: Optional[discord.Guild] = None):
+        """Indexa los canales trigger existentes (recorrido completo, solo al iniciar o reconfigurar)"""
+
+        guilds = [guild] if guild else self.bot.guilds
         trigger_count = 0
 
-        for channel in self.bot.main_guild.voice_channels:
-            if any(name.lower() in channel.name.lower() for name in self.trigger_channel_names):
-                self.trigger_channels.add(channel.id)
-                trigger_count += 1
-                logger.info(f"📢 Canal trigger configurado: #{channel.name}")
+        for target in guilds:
+            trigger_count += self.index_guild_triggers(target)
+
+        logger.info("✅ Configurados %s canales trigger para canales dinámicos", trigger_count)
+
+    def index_guild_triggers(self, guild: discord.Guild) -> int:
+        """Recorre los canales de voz de un servidor y devuelve cuántos triggers tiene"""
+
+        state = self.guilds.get(guild.id)
+
+        if not self.in_scope(guild.id) or not GuildVoiceConfig.for_guild(self.bot.settings, guild.id).enabled:
+            if state is not None:
+                state.triggers.channels.clear()
+                self.release_if_idle(state)
+            return 0
+
+        if state is None:
+            state = self.new_state(guild.id)
+
+        state.triggers.rebuild(guild)
+
+        if state.triggers:
+            self.guilds[guild.id] = state
+            logger.info("📢 %s: %s canal(es) trigger", guild.name, len(state.triggers))
+        else:
+            self.release_if_idle(state)
 
-        logger.info(f"✅ Configurados {trigger_count} canales trigger para canales dinámicos")
+        return len(state.triggers)
+
+    async def catch_up_trigger_members(self):
+        """
+        Atiende a quienes ya están en un canal trigger al iniciar (entraron
+        mientras no había ningún proceso conectado, p.ej. durante un traspaso).
+        """
+
+        waiting = []  # (estado, canal, miembro)
+        misses = []  # (estado, canal, user_id) sin miembro en memoria
+        for state in list(self.guilds.values()):
+            for channel_id in state.triggers:
+                channel = self.bot.get_channel(channel_id)
+                if channel is None:
+                    continue
+                for user_id in list(channel.voice_states):
+                    member = self.bot.members.get(channel.guild, user_id)
+                    if member is not None:
+                        waiting.append((state, channel, member))
+                    else:
+                        misses.append((state, channel, user_id))
+
+        # Los que no están en memoria (perfil minimal) se piden en paralelo;
+        # un error de uno no impide atender a los demás
+        async def fetch(channel: discord.VoiceChannel, user_id: int) -> Optional[discord.Member]:
+            try:
+                return await self.bot.members.fetch(channel.guild, user_id)
+            except discord.HTTPException as e:
+                logger.warning("⚠️ No se pudo obtener al miembro %s de #%s: %s", user_id, channel.name, e)
+                return None
+
+        fetched = await asyncio.gather(*(fetch(channel, user_id) for _, channel, user_id in misses))
+        waiting.extend((state, channel, member)
+                       for (state, channel, _), member in zip(misses, fetched) if member is not None)
+
+        joins = [self.handle_trigger_join(state, member, channel)
+                 for state, channel, member in waiting if not member.bot]
+        if joins:
+            logger.info("⏩ Atendiendo a %s miembro(s) que esperaban en canales trigger", len(joins))
+            await asyncio.gather(*joins)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        """Indexa los canales trigger nuevos"""
+        if not self.in_scope(channel.guild.id):
+            return
+
+        state = self.guilds.get(channel.guild.id) or self.new_state(channel.guild.id)
+        if not state.config.enabled:
+            return
+
+        if state.triggers.update(channel):
+            self.guilds[channel.guild.id] = state
+            logger.info("📢 Nuevo canal trigger: #%s (%s)", channel.name, channel.guild.name)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        """Reevalúa un canal renombrado"""
+        if before.name == after.name or not self.in_scope(after.guild.id):
+            return
+
+        state = self.guilds.get(after.guild.id) or self.new_state(after.guild.id)
+        if not state.config.enabled:
+            return
+
+        changed = state.triggers.update(after)
+        if changed is True:
+            self.guilds[after.guild.id] = state
+            logger.info("📢 Canal trigger configurado: #%s (%s)", after.name, after.guild.name)
+        elif changed is False:
+            logger.info("🔇 #%s ya no es un canal trigger (%s)", after.name, after.guild.name)
+            self.release_if_idle(state)
 
     @commands.Cog.listener()
     async def on_voice_state_update(
@@ -67,50 +694,164 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
     ):
         """Maneja cambios en el estado de voz"""
 
-        # Solo procesar en el guild principal
-        if member.guild != self.bot.main_guild:
+        # Sin cambio de canal (mute, deafen, stream...)
+        if before.channel == after.channel:
+            return
+
+        # Servidor sin triggers ni canales temporales: nada que hacer
+        state = self.guilds.get(member.guild.id)
+        if state is None:
             return
 
+        # Actualizar ocupación (incluye bots, igual que channel.voice_states)
+        if before.channel and before.channel.id in state.temp_channels:
+            self.track_leave(state, before.channel.id)
+
+        if after.channel and after.channel.id in state.temp_channels:
+            self.track_join(state, after.channel.id)
+
         # Ignorar bots
         if member.bot:
             return
 
-        # Manejar entrada a canal trigger
-        if after.channel and after.channel.id in self.trigger_channels:
-            await self.handle_trigger_join(member, after.channel)
+        # Salió del trigger antes de que se creara su canal: anular la creación
+        if before.channel and before.channel.id in state.triggers:
+            self.bot.actions.cancel(ActionKind.CREATE, ("temp_channel", member.guild.id, member.id))
 
-        # Manejar salida de canales temporales
-        if before.channel and before.channel.id in self.temp_channels:
-            await self.handle_temp_channel_leave(before.channel)
+        # Manejar entrada a canal trigger
+        if after.channel and after.channel.id in state.triggers:
+            await self.handle_trigger_join(state, member, after.channel)
 
-    async def handle_trigger_join(self, member: discord.Member, trigger_channel: discord.VoiceChannel):
+    async def handle_trigger_join(
+            self,
+            state: GuildVoiceState,
+            member: discord.Member,
+            trigger_channel: discord.VoiceChannel
+    ):
         """Maneja cuando un usuario se une a un canal trigger"""
 
+        # Cerrando: el siguiente proceso lo atiende al iniciar (catch_up_trigger_members)
+        if self.bot.draining:
+            logger.debug("%s entró a un trigger durante el vaciado, se deja para el siguiente proceso", member.name)
+            return
+
         try:
-            # Verificar si el usuario ya tiene un canal
-            if member.id in self.user_channels:
-                existing_channel = self.bot.get_channel(self.user_channels[member.id])
-                if existing_channel and len(existing_channel.members) == 0:
-                    # Si su canal anterior está vacío, usarlo
-                    await member.move_to(existing_channel)
-                    logger.info(f"👤 {member.name} movido a su canal existente: {existing_channel.name}")
-                    return
-
-            # Crear nuevo canal temporal
-            temp_channel = await self.create_temp_channel(member, trigger_channel)
-            if temp_channel:
-                await member.move_to(temp_channel)
-                logger.info(f"✅ {member.name} movido a su nuevo canal: {temp_channel.name}")
+            # La asignación se serializa por servidor; el movimiento no
+            async with state.lock:
+                target, created = await self.assign_channel(state, member, trigger_channel)
+
+            if target:
+                try:
+                    await self.move_member(member, target)
+                except discord.HTTPException:
+                    # Salió de voz antes del movimiento: el canal quedaría vacío sin timer
+                    if state.occupancy.get(target.id, 0) == 0:
+                        self.schedule_channel_deletion(state, target)
+                    raise
+
+                if created:
+                    logger.info("✅ %s movido a su nuevo canal: %s", member.name, target.name)
+                else:
+                    logger.info("👤 %s movido a su canal existente: %s", member.name, target.name)
 
         except discord.Forbidden:
-            logger.error(f"❌ Sin permisos para mover a {member.name}")
+            logger.error("❌ Sin permisos para mover a %s", member.name)
         except discord.HTTPException as e:
-            logger.error(f"❌ Error moviendo a {member.name}: {e}")
+            logger.error("❌ Error moviendo a %s: %s", member.name, e)
         except Exception as e:
-            logger.exception(f"❌ Error inesperado manejando trigger join: {e}")
+            logger.exception("❌ Error inesperado manejando trigger join: %s", e)
+
+    async def assign_channel(
+            self,
+            state: GuildVoiceState,
+            member: discord.Member,
+            trigger_channel: discord.VoiceChannel
+    ) -> Tuple[Optional[discord.VoiceChannel], bool]:
+        """Elige el canal de `member`: su canal vacío anterior, uno de la reserva o uno nuevo"""
+
+        # Verificar si el usuario ya tiene un canal
+        if member.id in state.user_channels:
+            existing_channel = self.bot.get_channel(state.user_channels[member.id])
+            if existing_channel and state.occupancy.get(existing_channel.id, 0) == 0:
+                # Si su canal anterior está vacío, usarlo
+                return existing_channel, False
+
+        # Usar un canal de la reserva si hay, o crear uno nuevo
+        temp_channel = None
+        if state.pool is not None and trigger_channel.category:
+            temp_channel = await self.claim_pooled_channel(state, member, trigger_channel)
+
+        if temp_channel is None:
+            temp_channel = await self.create_temp_channel(state, member, trigger_channel)
+
+        return temp_channel, True
+
+    async def move_member(self, member: discord.Member, channel: discord.VoiceChannel):
+        """Mueve a un miembro a través de la cola de acciones (el último destino gana)"""
+
+        await self.bot.actions.submit(
+            ActionKind.MOVE,
+            f"guild:{member.guild.id}:members",
+            lambda: member.move_to(channel),
+            key=("move", member.id)
+        )
+
+    def temp_channel_overwrites(self, member: discord.Member) -> Dict:
+        """Permisos de un canal temporal para su propietario"""
+        return {
+            member.guild.default_role: discord.PermissionOverwrite(
+                view_channel=True,
+                connect=True,
+                speak=True
+            ),
+            member: discord.PermissionOverwrite(
+                view_channel=True,
+                connect=True,
+                speak=True,
+                move_members=True,
+                manage_channels=True,
+                mute_members=True,
+                deafen_members=True
+            ),
+            self.bot.user: discord.PermissionOverwrite(
+                view_channel=True,
+                connect=True,
+                manage_channels=True,
+                move_members=True
+            )
+        }
+
+    def register_temp_channel(
+            self,
+            state: GuildVoiceState,
+            channel: discord.VoiceChannel,
+            member: discord.Member,
+            trigger_channel: discord.VoiceChannel
+    ):
+        """Registra un canal como temporal de `member`"""
+
+        info = {
+            'guild_id': member.guild.id,
+            'owner_id': member.id,
+            'created_at': datetime.utcnow(),
+            'trigger_channel_id': trigger_channel.id,
+            'category_id': trigger_channel.category.id if trigger_channel.category else None
+        }
+        state.temp_channels[channel.id] = info
+        self.bot.state.put(STATE_NAMESPACE, channel.id, self._serialize_info(info))
+
+        # Vacío hasta que el usuario sea movido; si el movimiento falla,
+        # el canal se elimina al vencer el plazo de gracia
+        state.occupancy[channel.id] = 0
+        state.empty_since[channel.id] = asyncio.get_running_loop().time()
+        self.schedule_channel_deletion(state, channel)
+
+        # Asociar canal con usuario
+        state.user_channels[member.id] = channel.id
 
     async def create_temp_channel(
             self,
+            state: GuildVoiceState,
             member: discord.Member,
             trigger_channel: discord.VoiceChannel
     ) -> Optional[discord.VoiceChannel]:
@@ -118,148 +859,290 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
 
         try:
             # Nombre del canal
-            channel_name = f"{self.temp_channel_prefix} {member.display_name}"
+            channel_name = f"{state.config.channel_prefix} {member.display_name}"
 
             # Configurar permisos
-            overwrites = {
-                member.guild.default_role: discord.PermissionOverwrite(
-                    view_channel=True,
-                    connect=True,
-                    speak=True
-                ),
-                member: discord.PermissionOverwrite(
-                    view_channel=True,
-                    connect=True,
-                    speak=True,
-                    move_members=True,
-                    manage_channels=True,
-                    mute_members=True,
-                    deafen_members=True
+            overwrites = self.temp_channel_overwrites(member)
+
+            # Crear canal en la misma categoría (anulable si el usuario se va antes)
+            temp_channel = await self.bot.actions.submit(
+                ActionKind.CREATE,
+                f"guild:{member.guild.id}:channels",
+                lambda: trigger_channel.category.create_voice_channel(
+                    name=channel_name,
+                    overwrites=overwrites,
+                    reason=f"Canal dinámico creado para {member.name}"
                 ),
-                self.bot.user: discord.PermissionOverwrite(
-                    view_channel=True,
-                    connect=True,
-                    manage_channels=True,
-                    move_members=True
-                )
-            }
-
-            # Crear canal en la misma categoría
-            temp_channel = await trigger_channel.category.create_voice_channel(
-                name=channel_name,
-                overwrites=overwrites,
-                reason=f"Canal dinámico creado para {member.name}"
+                key=("temp_channel", member.guild.id, member.id)
             )
 
-            # Registrar canal temporal
-            self.temp_channels[temp_channel.id] = {
-                'owner_id': member.id,
-                'created_at': datetime.utcnow(),
-                'trigger_channel_id': trigger_channel.id,
-                'category_id': trigger_channel.category.id if trigger_channel.category else None
-            }
+            if temp_channel is None:
+                logger.info("↩️ Creación de canal anulada: %s salió del trigger", member.name)
+                return None
 
-            # Asociar canal con usuario
-            self.user_channels[member.id] = temp_channel.id
+            # Registrar canal temporal
+            self.register_temp_channel(state, temp_channel, member, trigger_channel)
 
-            logger.info(f"🎉 Canal temporal creado: {temp_channel.name} para {member.name}")
+            logger.info("🎉 Canal temporal creado: %s para %s", temp_channel.name, member.name)
             return temp_channel
 
         except discord.Forbidden:
             logger.error("❌ Sin permisos para crear canales de voz")
         except discord.HTTPException as e:
-            logger.error(f"❌ Error creando canal temporal: {e}")
+            logger.error("❌ Error creando canal temporal: %s", e)
         except Exception as e:
-            logger.exception(f"❌ Error inesperado creando canal: {e}")
+            logger.exception("❌ Error inesperado creando canal: %s", e)
 
         return None
 
-    async def handle_temp_channel_leave(self, channel: discord.VoiceChannel):
-        """Maneja cuando alguien deja un canal temporal"""
+    # ====================================
+    # RESERVA DE CANALES PRE-CREADOS
+    # ====================================
+
+    async def claim_pooled_channel(
+            self,
+            state: GuildVoiceState,
+            member: discord.Member,
+            trigger_channel: discord.VoiceChannel
+    ) -> Optional[discord.VoiceChannel]:
+        """Asigna a `member` un canal de la reserva (renombrar + permisos)"""
 
-        # Verificar si el canal está vacío después de un pequeño delay
-        await asyncio.sleep(1)  # Dar tiempo para que Discord actualice
+        category = trigger_channel.category
+        state.pool.record_join(category.id, asyncio.get_running_loop().time())
 
-        if len(channel.members) == 0:
-            await self.schedule_channel_deletion(channel)
+        channel = None
+        while channel is None:
+            channel_id = state.pool.take(category.id)
+            if channel_id is None:
+                break
+            self.bot.state.delete(POOL_NAMESPACE, channel_id)
+            channel = self.bot.get_channel(channel_id)
 
-    async def schedule_channel_deletion(self, channel: discord.VoiceChannel):
-        """Programa la eliminación de un canal vacío"""
+        # Reponer en segundo plano (también cuando la reserva estaba vacía)
+        self.request_pool_refill(state, category)
 
-        # Esperar un poco más para confirmar que está vacío
-        await asyncio.sleep(self.cleanup_delay)
+        if channel is None:
+            return None
 
-        # Verificar nuevamente si sigue vacío
-        fresh_channel = self.bot.get_channel(channel.id)
-        if fresh_channel and len(fresh_channel.members) == 0:
-            await self.delete_temp_channel(fresh_channel)
+        try:
+            await self.bot.actions.submit(
+                ActionKind.EDIT,
+                f"channel:{channel.id}",
+                lambda: channel.edit(
+                    name=f"{state.config.channel_prefix} {member.display_name}",
+                    overwrites=self.temp_channel_overwrites(member),
+                    reason=f"Canal dinámico asignado a {member.name}"
+                )
+            )
+        except discord.HTTPException as e:
+            logger.error("❌ Error asignando canal de reserva: %s", e)
+            return None
 
-    async def delete_temp_channel(self, channel: discord.VoiceChannel):
+        self.register_temp_channel(state, channel, member, trigger_channel)
+        logger.info("⚡ Canal de reserva asignado: %s para %s", channel.name, member.name)
+        return channel
+
+    def request_pool_refill(self, state: GuildVoiceState, category: discord.CategoryChannel):
+        """Lanza la reposición de la reserva de una categoría si no está en curso"""
+
+        if category.id in state.refilling:
+            return
+
+        state.refilling.add(category.id)
+        task = asyncio.create_task(self.refill_pool(state, category))
+        task.add_done_callback(lambda _: state.refilling.discard(category.id))
+
+    async def refill_pool(self, state: GuildVoiceState, category: discord.CategoryChannel):
+        """Crea canales ocultos hasta alcanzar el tamaño objetivo de la reserva"""
+
+        overwrites = {
+            category.guild.default_role: discord.PermissionOverwrite(view_channel=False, connect=False),
+            category.guild.me: discord.PermissionOverwrite(
+                view_channel=True,
+                connect=True,
+                manage_channels=True,
+                move_members=True
+            )
+        }
+
+        pool = state.pool
+        while pool.size(category.id) < pool.target_size(category.id, asyncio.get_running_loop().time()):
+            try:
+                channel = await self.bot.actions.submit(
+                    ActionKind.CREATE,
+                    f"guild:{category.guild.id}:channels",
+                    lambda: category.create_voice_channel(
+                        name=self.pool_channel_name,
+                        overwrites=overwrites,
+                        reason="Reserva de canales dinámicos"
+                    )
+                )
+            except discord.HTTPException as e:
+                logger.error("❌ Error reponiendo reserva en %s: %s", category.name, e)
+                return
+
+            pool.add(category.id, channel.id)
+            self.bot.state.put(POOL_NAMESPACE, channel.id, {
+                'guild_id': category.guild.id,
+                'category_id': category.id
+            })
+
+    def track_join(self, state: GuildVoiceState, channel_id: int):
+        """Registra una entrada a un canal temporal"""
+
+        state.occupancy[channel_id] = state.occupancy.get(channel_id, 0) + 1
+        state.empty_since.pop(channel_id, None)
+        self.deletion_scheduler.cancel((state.guild_id, channel_id))
+
+    def track_leave(self, state: GuildVoiceState, channel_id: int):
+        """Registra una salida de un canal temporal"""
+
+        remaining = max(state.occupancy.get(channel_id, 0) - 1, 0)
+        state.occupancy[channel_id] = remaining
+
+        if remaining == 0:
+            # Reinsertar para mantener `empty_since` ordenado por antigüedad
+            state.empty_since.pop(channel_id, None)
+            state.empty_since[channel_id] = asyncio.get_running_loop().time()
+            self.deletion_scheduler.schedule((state.guild_id, channel_id), state.config.cleanup_delay)
+
+    def schedule_channel_deletion(self, state: GuildVoiceState, channel: discord.VoiceChannel):
+        """Programa la eliminación de un canal vacío (reemplaza la anterior si existe)"""
+        self.deletion_scheduler.schedule((state.guild_id, channel.id), state.config.cleanup_delay)
+
+    async def expire_empty_channels(self, keys: List[Tuple[int, int]]):
+        """Elimina en lote los canales cuyo plazo de gracia venció"""
+
+        deletions = []
+
+        for guild_id, channel_id in keys:
+            state = self.guilds.get(guild_id)
+            if state is None:
+                continue
+
+            channel = self.bot.get_channel(channel_id)
+
+            if not channel:
+                self.cleanup_channel_records(state, channel_id)
+            elif state.occupancy.get(channel_id, 0) == 0:
+                deletions.append(self.delete_empty_channel(state, channel))
+
+        if deletions:
+            await asyncio.gather(*deletions)
+
+    async def delete_empty_channel(self, state: GuildVoiceState, channel: discord.VoiceChannel):
+        """Elimina un canal vacío respetando el límite de eliminaciones concurrentes del servidor"""
+
+        async with state.deletion_slots:
+            # Comprobación final contra la caché antes de la llamada REST
+            if channel.voice_states:
+                state.occupancy[channel.id] = len(channel.voice_states)
+                state.empty_since.pop(channel.id, None)
+                return
+
+            await self.delete_temp_channel(state, channel)
+
+    async def delete_temp_channel(self, state: GuildVoiceState, channel: discord.VoiceChannel):
         """Elimina un canal temporal"""
 
         try:
-            # Obtener información del canal
-            channel_info = self.temp_channels.get(channel.id, {})
-            owner_id = channel_info.get('owner_id')
-
             # Eliminar canal
-            await channel.delete(reason="Canal dinámico vacío - eliminación automática")
+            await self.bot.actions.submit(
+                ActionKind.DELETE,
+                f"channel:{channel.id}",
+                lambda: channel.delete(reason="Canal dinámico vacío - eliminación automática"),
+                key=("channel", channel.id)
+            )
 
             # Limpiar registros
-            if channel.id in self.temp_channels:
-                del self.temp_channels[channel.id]
-
-            if owner_id and owner_id in self.user_channels:
-                if self.user_channels[owner_id] == channel.id:
-                    del self.user_channels[owner_id]
+            self.cleanup_channel_records(state, channel.id)
 
-            logger.info(f"🗑️ Canal temporal eliminado: {channel.name}")
+            logger.info("🗑️ Canal temporal eliminado: %s", channel.name)
 
         except discord.NotFound:
             # Canal ya fue eliminado
-            self.cleanup_channel_records(channel.id)
+            self.cleanup_channel_records(state, channel.id)
         except discord.Forbidden:
-            logger.error(f"❌ Sin permisos para eliminar canal: {channel.name}")
+            logger.error("❌ Sin permisos para eliminar canal: %s", channel.name)
         except Exception as e:
-            logger.exception(f"❌ Error eliminando canal {channel.name}: {e}")
+            logger.exception("❌ Error eliminando canal %s: %s", channel.name, e)
 
-    def cleanup_channel_records(self, channel_id: int):
+    def cleanup_channel_records(self, state: GuildVoiceState, channel_id: int):
         """Limpia registros de un canal que ya no existe"""
 
-        if channel_id in self.temp_channels:
-            owner_id = self.temp_channels[channel_id].get('owner_id')
-            del self.temp_channels[channel_id]
+        self.bot.state.delete(STATE_NAMESPACE, channel_id)
+        self.deletion_scheduler.cancel((state.guild_id, channel_id))
+        state.occupancy.pop(channel_id, None)
+        state.empty_since.pop(channel_id, None)
+
+        if channel_id in state.temp_channels:
+            owner_id = state.temp_channels[channel_id].get('owner_id')
+            del state.temp_channels[channel_id]
+
+            if owner_id and owner_id in state.user_channels:
+                if state.user_channels[owner_id] == channel_id:
+                    del state.user_channels[owner_id]
 
-            if owner_id and owner_id in self.user_channels:
-                if self.user_channels[owner_id] == channel_id:
-                    del self.user_channels[owner_id]
+        self.release_if_idle(state)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Limpia registros de canales temporales eliminados fuera del bot"""
+        state = self.guilds.get(channel.guild.id)
+        if state is None:
+            return
+
+        if state.triggers.discard(channel.id):
+            logger.info("🗑️ Canal trigger eliminado: #%s (%s)", channel.name, channel.guild.name)
+            self.release_if_idle(state)
+
+        elif channel.id in state.temp_channels:
+            self.cleanup_channel_records(state, channel.id)
+
+        elif state.pool is not None and channel.id in state.pool:
+            state.pool.discard(channel.id)
+            self.bot.state.delete(POOL_NAMESPACE, channel.id)
+            self.release_if_idle(state)
 
     @tasks.loop(minutes=5)
     async def cleanup_empty_channels(self):
-        """Tarea periódica para limpiar canales olvidados"""
+        """
+        Reconciliación periódica de canales olvidados.
+
+        Solo recorre los canales vacíos cuyo plazo `empty_grace` ya venció
+        (`empty_since` está ordenado por antigüedad) y los elimina en paralelo.
+        """
 
         if not self.bot.is_ready:
             return
 
-        channels_to_delete = []
+        cutoff = asyncio.get_running_loop().time() - self.empty_grace
+        deletions = []
 
-        for channel_id, info in self.temp_channels.items():
-            channel = self.bot.get_channel(channel_id)
+        for state in list(self.guilds.values()):
+            deletions.extend(self.collect_expired(state, cutoff))
 
+        if deletions:
+            await asyncio.gather(*deletions)
+
+    def collect_expired(self, state: GuildVoiceState, cutoff: Optional[float] = None) -> List:
+        """Eliminaciones de los canales vacíos del servidor (desde antes de `cutoff`, si se indica)"""
+
+        deletions = []
+
+        for channel_id, since in list(state.empty_since.items()):
+            if cutoff is not None and since > cutoff:
+                break
+
+            channel = self.bot.get_channel(channel_id)
             if not channel:
                 # Canal no existe, limpiar registros
-                channels_to_delete.append(channel_id)
+                self.cleanup_channel_records(state, channel_id)
                 continue
 
-            # Verificar si está vacío por mucho tiempo
-            if len(channel.members) == 0:
-                created_at = info.get('created_at', datetime.utcnow())
-                if datetime.utcnow() - created_at > timedelta(minutes=2):
-                    await self.delete_temp_channel(channel)
+            deletions.append(self.delete_empty_channel(state, channel))
 
-        # Limpiar registros de canales que no existen
-        for channel_id in channels_to_delete:
-            self.cleanup_channel_records(channel_id)
+        return deletions
 
     @cleanup_empty_channels.before_loop
     async def before_cleanup(self):
@@ -289,28 +1172,10 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
             )
             return False
 
-        member = interaction.user
-
-        # Owner del bot siempre puede
-        if await self.bot.is_owner(member):
-            return True
-
-        # Administradores del servidor pueden
-        if member.guild_permissions.administrator:
-            return True
-
-        # Verificar si tiene permiso de gestionar canales
-        if member.guild_permissions.manage_channels:
-            return True
-
-        # Verificar roles de admin configurados
-        admin_roles = self.bot.settings.ADMIN_ROLE_IDS
-        if admin_roles and any(role.id in admin_roles for role in member.roles):
-            return True
+        perms = self.bot.permissions.resolve(interaction.user)
 
-        # Verificar roles de moderador configurados
-        mod_roles = self.bot.settings.MOD_ROLE_IDS
-        if mod_roles and any(role.id in mod_roles for role in member.roles):
+        # Owner, administradores, roles de admin/moderador o gestionar canales
+        if perms.is_moderator or perms.manage_channels:
             return True
 
         # Si no tiene permisos, enviar mensaje de error
@@ -346,6 +1211,8 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
         if not await self.check_permissions(interaction):
             return
 
+        state = self.view_state(interaction.guild)
+
         embed = discord.Embed(
             title="🔧 Canales de Voz Dinámicos",
             description="Sistema de canales temporales automáticos",
@@ -355,17 +1222,33 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
         # Información básica
         embed.add_field(
             name="📊 Estado Actual",
-            value=f"**Canales trigger:** {len(self.trigger_channels)}\n"
-                  f"**Canales temporales activos:** {len(self.temp_channels)}\n"
-                  f"**Usuarios con canales:** {len(self.user_channels)}",
+            value=f"**Canales trigger:** {len(state.triggers)}\n"
+                  f"**Canales temporales activos:** {len(state.temp_channels)}\n"
+                  f"**Usuarios con canales:** {len(state.user_channels)}\n"
+                  f"**Eliminaciones pendientes (total):** {len(self.deletion_scheduler)}\n"
+                  f"**Servidores activos:** {len(self.guilds)}",
+            inline=True
+        )
+
+        # Cola de acciones REST
+        queue_stats = self.bot.actions.stats()
+        move_stats = queue_stats["kinds"]["move"]
+        embed.add_field(
+            name="📬 Cola REST",
+            value=f"**Pendientes:** {queue_stats['depth']} ({queue_stats['in_flight']} en curso)\n"
+                  f"**Espera media (mover):** {move_stats['wait_avg'] * 1000:.0f}ms\n"
+                  f"**Rate limits:** {queue_stats['rate_limited']}",
             inline=True
         )
 
         # Información técnica
+        pool_status = f"{len(state.pool)} canales listos" if state.pool is not None else "Desactivada"
         embed.add_field(
             name="⚙️ Configuración",
-            value=f"**Prefijo:** {self.temp_channel_prefix}\n"
-                  f"**Delay de limpieza:** {self.cleanup_delay}s\n"
+            value=f"**Activo:** {'✅' if state.config.enabled and self.in_scope(state.guild_id) else '❌'}\n"
+                  f"**Prefijo:** {state.config.channel_prefix}\n"
+                  f"**Delay de limpieza:** {state.config.cleanup_delay}s\n"
+                  f"**Reserva:** {pool_status}\n"
                   f"**Limpieza automática:** ✅ Activa",
             inline=True
         )
@@ -398,7 +1281,7 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
             )
             return
 
-        if not interaction.user.guild_permissions.administrator:
+        if not self.bot.permissions.resolve(interaction.user).administrator:
             await interaction.response.send_message(
                 "❌ Solo los administradores pueden ver esta información.",
                 ephemeral=True
@@ -425,8 +1308,8 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
         )
 
         # Roles configurados
-        admin_roles = self.bot.settings.ADMIN_ROLE_IDS
-        mod_roles = self.bot.settings.MOD_ROLE_IDS
+        admin_roles = self.bot.permissions.admin_role_ids
+        mod_roles = self.bot.permissions.mod_role_ids
 
         roles_info = []
 
@@ -488,7 +1371,9 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
         if not await self.check_permissions(interaction):
             return
 
-        if not self.temp_channels:
+        state = self.view_state(interaction.guild)
+
+        if not state.temp_channels:
             await interaction.response.send_message("📭 No hay canales temporales activos.", ephemeral=True)
             return
 
@@ -497,16 +1382,17 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
             color=discord.Color.green()
         )
 
-        for channel_id, info in self.temp_channels.items():
+        for channel_id, info in state.temp_channels.items():
             channel = self.bot.get_channel(channel_id)
             if channel:
                 owner = self.bot.get_user(info['owner_id'])
+                owner_text = owner.mention if owner else f"<@{info['owner_id']}>"
                 created_time = info['created_at'].strftime("%H:%M:%S")
 
                 embed.add_field(
                     name=f"🎙️ {channel.name}",
-                    value=f"**Owner:** {owner.mention if owner else 'Usuario desconocido'}\n"
-                          f"**Miembros:** {len(channel.members)}\n"
+                    value=f"**Owner:** {owner_text}\n"
+                          f"**Miembros:** {len(channel.voice_states)}\n"
                           f"**Creado:** {created_time}",
                     inline=True
                 )
@@ -524,18 +1410,18 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
         if not await self.check_permissions(interaction):
             return
 
-        self.trigger_channels.clear()
-        await self.setup_trigger_channels()
+        await self.setup_trigger_channels(interaction.guild)
+        state = self.view_state(interaction.guild)
 
         embed = discord.Embed(
             title="✅ Reconfiguración Completada",
-            description=f"Canales trigger encontrados: **{len(self.trigger_channels)}**",
+            description=f"Canales trigger encontrados: **{len(state.triggers)}**",
             color=discord.Color.green()
         )
 
-        if self.trigger_channels:
+        if state.triggers:
             trigger_list = []
-            for channel_id in self.trigger_channels:
+            for channel_id in state.triggers:
                 channel = self.bot.get_channel(channel_id)
                 if channel:
                     trigger_list.append(f"• {channel.mention}")
@@ -562,16 +1448,12 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
 
         await interaction.response.defer(ephemeral=True)  # El proceso puede tomar tiempo
 
-        cleaned = 0
+        state = self.view_state(interaction.guild)
+        cleaned = len(state.empty_since)
+        deletions = self.collect_expired(state)
 
-        for channel_id in list(self.temp_channels.keys()):
-            channel = self.bot.get_channel(channel_id)
-            if not channel:
-                self.cleanup_channel_records(channel_id)
-                cleaned += 1
-            elif len(channel.members) == 0:
-                await self.delete_temp_channel(channel)
-                cleaned += 1
+        if deletions:
+            await asyncio.gather(*deletions)
 
         embed = discord.Embed(
             title="🧹 Limpieza Completada",
@@ -581,7 +1463,7 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
 
         embed.add_field(
             name="📊 Estado Actualizado",
-            value=f"**Canales activos restantes:** {len(self.temp_channels)}",
+            value=f"**Canales activos restantes:** {len(state.temp_channels)}",
             inline=False
         )
 
@@ -599,7 +1481,9 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
         if not await self.check_permissions(interaction):
             return
 
-        if usuario.id not in self.user_channels:
+        state = self.view_state(interaction.guild)
+
+        if usuario.id not in state.user_channels:
             embed = discord.Embed(
                 title="❌ Canal No Encontrado",
                 description=f"{usuario.mention} no tiene un canal dinámico activo.",
@@ -608,12 +1492,12 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        channel_id = self.user_channels[usuario.id]
+        channel_id = state.user_channels[usuario.id]
         channel = self.bot.get_channel(channel_id)
 
         if channel:
             channel_name = channel.name
-            await self.delete_temp_channel(channel)
+            await self.delete_temp_channel(state, channel)
 
             embed = discord.Embed(
                 title="✅ Canal Eliminado",
@@ -621,7 +1505,7 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
                 color=discord.Color.green()
             )
         else:
-            self.cleanup_channel_records(channel_id)
+            self.cleanup_channel_records(state, channel_id)
             embed = discord.Embed(
                 title="✅ Registros Limpiados",
                 description=f"Registros de canal de {usuario.mention} limpiados.",
@@ -642,7 +1526,9 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
         if not await self.check_permissions(interaction):
             return
 
-        if canal.id not in self.temp_channels:
+        state = self.view_state(interaction.guild)
+
+        if canal.id not in state.temp_channels:
             embed = discord.Embed(
                 title="❌ No es un Canal Dinámico",
                 description=f"{canal.mention} no es un canal dinámico o no está registrado.",
@@ -651,7 +1537,7 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        info = self.temp_channels[canal.id]
+        info = state.temp_channels[canal.id]
         owner = self.bot.get_user(info['owner_id'])
         created_at = info['created_at']
 
@@ -663,13 +1549,13 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
 
         embed.add_field(
             name="👤 Propietario",
-            value=owner.mention if owner else "Usuario desconocido",
+            value=owner.mention if owner else f"<@{info['owner_id']}>",
             inline=True
         )
 
         embed.add_field(
             name="👥 Miembros Actuales",
-            value=f"**{len(canal.members)}** conectados",
+            value=f"**{len(canal.voice_states)}** conectados",
             inline=True
         )
 
@@ -687,11 +1573,13 @@ class DynamicVoiceChannels(commands.Cog, name="Canales Dinámicos"):
             inline=False
         )
 
-        if canal.members:
-            members_list = [member.mention for member in canal.members[:10]]  # Máximo 10 para no saturar
+        # Menciones por ID: no requieren que los miembros estén en caché
+        connected = list(canal.voice_states)
+        if connected:
+            members_list = [f"<@{user_id}>" for user_id in connected[:10]]  # Máximo 10 para no saturar
             members_text = "\n".join(members_list)
-            if len(canal.members) > 10:
-                members_text += f"\n... y {len(canal.members) - 10} más"
+            if len(connected) > 10:
+                members_text += f"\n... y {len(connected) - 10} más"
 
             embed.add_field(
                 name="🎧 Miembros Conectados",
@@ -2,6 +2,15 @@
 Configuración del bot
 """
 
-from .settings import get_settings, settings
+from typing import Any
 
-__all__ = ["get_settings", "settings"]
\ No newline at end of file
+from .settings import Settings, get_settings, reload_settings
+
+__all__ = ["Settings", "get_settings", "reload_settings", "settings"]
+
+
+def __getattr__(name: str) -> Any:
+    # La instancia se crea al primer uso para no leer .env al importar
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,236 @@
+"""
+Pipeline de logging no bloqueante
+Informatica UAIn'T Community Bot
+"""
+
+import sys
+import json
+import queue
+import atexit
+import logging
+import configparser
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .settings import Settings
+
+# Atributos propios de LogRecord (el resto viene de `extra=` y se exporta en JSON)
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)8s] %(name)s: %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro, con los campos de `extra=` incluidos"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Conserva 1 de cada N registros DEBUG/INFO por logger.
+
+    Las reglas se aplican por prefijo (`core.events` cubre `core.events.x`) y
+    la resolución de cada nombre se cachea. WARNING y superiores pasan siempre.
+    """
+
+    def __init__(self, rates: Dict[str, int]):
+        super().__init__()
+        self.rates = {name: rate for name, rate in rates.items() if rate > 1}
+        self._resolved: Dict[str, int] = {}
+        self._seen: Dict[str, int] = {}
+
+    def _rate_for(self, name: str) -> int:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+
+        rate = self._rate_for(record.name)
+        if rate == 1:
+            return True
+
+        seen = self._seen.get(record.name, 0)
+        self._seen[record.name] = seen + 1
+        if seen % rate:
+            return False
+
+        record.sample_rate = rate
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler que nunca bloquea al emisor.
+
+    Solo interpola el mensaje (para fijar el valor de los argumentos); el
+    formato y la escritura ocurren en el hilo del QueueListener. Si la cola
+    está llena el registro se descarta y se cuenta.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class DropReporter(logging.Handler):
+    """Avisa (desde el hilo del listener) de los registros descartados"""
+
+    def __init__(self, source: NonBlockingQueueHandler, target: logging.Handler):
+        super().__init__()
+        self.source = source
+        self.target = target
+        self.reported = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        dropped = self.source.dropped
+        if dropped > self.reported:
+            warning = logging.LogRecord(
+                __name__, logging.WARNING, __file__, 0,
+                "⚠️ Cola de logs llena: %d registros descartados", (dropped - self.reported,), None
+            )
+            self.reported = dropped
+            self.target.handle(warning)
+
+
+def _read_config(path: Path) -> configparser.ConfigParser:
+    parser = configparser.ConfigParser()
+    parser.optionxform = str  # los nombres de logger distinguen mayúsculas
+    parser.read_dict({"pipeline": {}, "levels": {}, "levels.production": {}, "sampling": {}})
+    if path.is_file():
+        parser.read(path, encoding="utf-8")
+    return parser
+
+
+def _build_formatter(kind: str, datefmt: str) -> logging.Formatter:
+    if kind == "json":
+        return JsonFormatter()
+
+    if kind == "color":
+        try:
+            import colorlog
+        except ImportError:
+            return logging.Formatter(TEXT_FORMAT, datefmt=datefmt)
+
+        return colorlog.ColoredFormatter(
+            "%(log_color)s" + TEXT_FORMAT,
+            datefmt=datefmt,
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        )
+
+    return logging.Formatter(TEXT_FORMAT, datefmt=datefmt)
+
+
+def _build_output(output: str) -> logging.Handler:
+    if output == "stdout":
+        return logging.StreamHandler(sys.stdout)
+    if output == "stderr":
+        return logging.StreamHandler(sys.stderr)
+
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return logging.FileHandler(path, encoding="utf-8")
+
+
+# Listener activo (se reemplaza al reconfigurar)
+_listener: Optional[QueueListener] = None
+
+
+def stop_logging() -> None:
+    """Vacía la cola y detiene el hilo de escritura"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def configure_logging(settings: "Settings") -> None:
+    """Monta el pipeline QueueHandler -> QueueListener según logging.conf"""
+    global _listener
+
+    config = _read_config(Path(settings.LOG_CONFIG))
+    pipeline = config["pipeline"]
+
+    kind = pipeline.get("format", "auto")
+    if kind == "auto":
+        kind = "color" if settings.IS_DEVELOPMENT else "json"
+
+    output = _build_output(pipeline.get("output", "stderr"))
+    output.setFormatter(_build_formatter(kind, pipeline.get("datefmt", "%Y-%m-%d %H:%M:%S")))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=pipeline.getint("queue_size", 10000))
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter({name: int(rate) for name, rate in config["sampling"].items()}))
+
+    listener = QueueListener(log_queue, output, DropReporter(queue_handler, output))
+    listener.start()
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
+    root_logger.handlers.clear()
+    root_logger.addHandler(queue_handler)
+
+    sections = ["levels"] if settings.IS_DEVELOPMENT else ["levels", "levels.production"]
+    for section in sections:
+        for name, level in config[section].items():
+            logging.getLogger(name).setLevel(level.upper())
+
+    # El listener anterior termina de escribir lo que ya tenía en cola
+    stop_logging()
+    _listener = listener
+
+
+atexit.register(stop_logging)
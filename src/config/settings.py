@@ -4,114 +4,530 @@ Informatica UAIn'T Community Bot
 """
 
 import os
+import json
 import logging
-from typing import List, Optional
-from dotenv import load_dotenv
-
-# Cargar variables de entorno
-load_dotenv()
+from types import MappingProxyType
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+from dotenv import dotenv_values, find_dotenv
+
+logger = logging.getLogger(__name__)
+
+# Nombre de cada tipo en los mensajes de error de la configuración
+TYPE_NAMES: Mapping[type, str] = MappingProxyType({
+    bool: "un booleano (true/false)",
+    int: "un número entero",
+    str: "un texto",
+    tuple: "una lista",
+    frozenset: "una lista",
+})
+
+
+def _read_environment() -> Dict[str, str]:
+    """Lee `.env` y el entorno del proceso (el entorno tiene prioridad)"""
+
+    env_file = find_dotenv()
+    values = {}
+    if env_file:
+        values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+
+    values.update(os.environ)
+    return values
+
+
+class _EnvParser:
+    """Convierte variables de entorno a tipos acumulando los errores"""
+
+    def __init__(self, values: Mapping[str, str]):
+        self.values = values
+        self.errors: List[str] = []
+
+    def _raw(self, name: str, default: str) -> str:
+        return self.values.get(name, default).strip()
+
+    def get_str(self, name: str, default: str = "") -> str:
+        return self._raw(name, default)
+
+    def get_int(self, name: str, default: int) -> int:
+        raw = self._raw(name, str(default))
+        try:
+            return int(raw)
+        except ValueError:
+            self.errors.append(f"{name} debe ser un número entero (valor: {raw!r})")
+            return default
+
+    def optional_int(self, name: str) -> Optional[int]:
+        raw = self._raw(name, "")
+        if not raw:
+            return None
+        try:
+            return int(raw)
+        except ValueError:
+            self.errors.append(f"{name} debe ser un ID numérico (valor: {raw!r})")
+            return None
+
+    def get_float(self, name: str, default: float) -> float:
+        raw = self._raw(name, str(default))
+        try:
+            return float(raw)
+        except ValueError:
+            self.errors.append(f"{name} debe ser un número (valor: {raw!r})")
+            return default
+
+    def get_bool(self, name: str, default: bool = False) -> bool:
+        raw = self._raw(name, "true" if default else "false").lower()
+        if raw in ("1", "true", "yes", "on"):
+            return True
+        if raw in ("0", "false", "no", "off", ""):
+            return False
+        self.errors.append(f"{name} debe ser true/false (valor: {raw!r})")
+        return default
+
+    def names(self, name: str, default: str) -> Tuple[str, ...]:
+        return tuple(item.strip() for item in self._raw(name, default).split(",") if item.strip())
+
+    def guild_overrides(self, name: str, allowed: Mapping[str, type]) -> Mapping[int, Mapping[str, Any]]:
+        """JSON `{"<guild_id>": {"clave": valor}}` con claves y tipos permitidos"""
+
+        raw = self._raw(name, "")
+        if not raw:
+            return MappingProxyType({})
+
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            self.errors.append(f"{name} no es JSON válido: {e}")
+            return MappingProxyType({})
+
+        if not isinstance(data, dict):
+            self.errors.append(f"{name} debe ser un objeto JSON con IDs de servidor como claves")
+            return MappingProxyType({})
+
+        overrides = {}
+        for guild_id, values in data.items():
+            if not str(guild_id).isdigit() or not isinstance(values, dict):
+                self.errors.append(f"{name}: entrada inválida para {guild_id!r}")
+                continue
+
+            parsed = {}
+            for key, value in values.items():
+                expected = allowed.get(key)
+                if expected is None:
+                    self.errors.append(f"{name}: clave desconocida {key!r} en {guild_id}")
+                elif expected is tuple and isinstance(value, list):
+                    invalid = [item for item in value if not isinstance(item, str) or not item.strip()]
+                    if invalid:
+                        self.errors.append(f"{name}: {key!r} en {guild_id} debe ser una lista de nombres "
+                                           f"(inválidos: {invalid!r})")
+                    else:
+                        parsed[key] = tuple(value)
+                elif expected is frozenset and isinstance(value, list):
+                    # Los IDs pueden venir como número o como texto (JSON pierde precisión en snowflakes)
+                    invalid = [item for item in value
+                               if not (isinstance(item, str) and item.isdigit())
+                               and not (type(item) is int and item > 0)]
+                    if invalid:
+                        self.errors.append(f"{name}: {key!r} en {guild_id} debe ser una lista de IDs numéricos "
+                                           f"(inválidos: {invalid!r})")
+                    else:
+                        parsed[key] = frozenset(int(item) for item in value)
+                elif isinstance(value, expected) and not (expected is int and isinstance(value, bool)):
+                    parsed[key] = value
+                else:
+                    self.errors.append(f"{name}: {key!r} en {guild_id} debe ser {TYPE_NAMES.get(expected, expected.__name__)}")
+
+            overrides[int(guild_id)] = MappingProxyType(parsed)
+
+        return MappingProxyType(overrides)
+
+    def int_ranges(self, name: str) -> Tuple[int, ...]:
+        """Lista de enteros con rangos, p.ej. `0-3,8`"""
+        values = set()
+        for item in self.names(name, ""):
+            start, _, end = item.partition("-")
+            try:
+                values.update(range(int(start), int(end or start) + 1))
+            except ValueError:
+                self.errors.append(f"{name} contiene un valor inválido: {item!r}")
+        return tuple(sorted(values))
+
+    def id_set(self, name: str) -> FrozenSet[int]:
+        ids = set()
+        for item in self.names(name, ""):
+            try:
+                ids.add(int(item))
+            except ValueError:
+                self.errors.append(f"{name} contiene un ID no numérico: {item!r}")
+        return frozenset(ids)
 
 
 class Settings:
-    """Configuración principal del bot"""
+    """
+    Configuración principal del bot.
+
+    Es una instantánea inmutable: se construye una sola vez con
+    `Settings.from_env()` y todos los valores quedan ya parseados, de modo que
+    leerla no vuelve a tocar `os.environ`. Para aplicar cambios se crea una
+    instantánea nueva y se intercambia con `reload_settings()`.
+    """
+
+    __slots__ = (
+        # Discord
+        "DISCORD_TOKEN",
+        "GUILD_ID",
+        # Shards
+        "SHARD_MODE",
+        "SHARD_COUNT",
+        "SHARD_IDS",
+        # Caché del gateway
+        "CACHE_PROFILE",
+        "MEMBER_CACHE_TTL",
+        "MEMBER_CACHE_SIZE",
+        "MESSAGE_CACHE_PER_CHANNEL",
+        "MESSAGE_CACHE_MAX_MB",
+        # General
+        "ENVIRONMENT",
+        "LOG_LEVEL",
+        "LOG_CONFIG",
+        "COMMAND_PREFIX",
+        "IS_DEVELOPMENT",
+        "IS_PRODUCTION",
+        # Canales
+        "MOD_LOG_CHANNEL_ID",
+        "MOD_LOG_FLUSH_INTERVAL",
+        "MOD_LOG_BUFFER_SIZE",
+        "WELCOME_CHANNEL_ID",
+        "WELCOME_BURST_THRESHOLD",
+        "WELCOME_BURST_WINDOW",
+        "WELCOME_DIGEST_INTERVAL",
+        # Canales dinámicos
+        "DYNAMIC_VOICE_SCOPE",
+        "DYNAMIC_VOICE_GUILD_OVERRIDES",
+        "DYNAMIC_VOICE_TRIGGER_NAMES",
+        "DYNAMIC_VOICE_TRIGGER_CHANNEL_IDS",
+        "DYNAMIC_VOICE_CHANNEL_PREFIX",
+        "DYNAMIC_VOICE_CLEANUP_DELAY",
+        "DYNAMIC_VOICE_CLEANUP_INTERVAL",
+        "DYNAMIC_VOICE_POOL_ENABLED",
+        "DYNAMIC_VOICE_POOL_MIN",
+        "DYNAMIC_VOICE_POOL_MAX",
+        "DYNAMIC_VOICE_POOL_WINDOW",
+        # Persistencia
+        "DATA_DIR",
+        "STATE_BACKEND",
+        "STATE_FLUSH_INTERVAL",
+        # Cola de acciones REST
+        "ACTION_QUEUE_CONCURRENCY",
+        "RATE_LIMIT_MAX_WAIT",
+        "DRAIN_TIMEOUT",
+        # Monitorización
+        "METRICS_HOST",
+        "METRICS_PORT",
+        "LOOP_WATCHDOG_ENABLED",
+        "LOOP_WATCHDOG_THRESHOLD",
+        # Roles
+        "ADMIN_ROLE_IDS",
+        "MOD_ROLE_IDS",
+        "MEMBER_ROLE_ID",
+        "AUTO_ROLE_RATE",
+    )
+
+    # Valores que solo se aplican al reiniciar el bot
+    RESTART_REQUIRED: FrozenSet[str] = frozenset({
+        "DISCORD_TOKEN",
+        "DATA_DIR",
+        "STATE_BACKEND",
+        "STATE_FLUSH_INTERVAL",
+        "ACTION_QUEUE_CONCURRENCY",
+        "RATE_LIMIT_MAX_WAIT",
+        "SHARD_MODE",
+        "SHARD_COUNT",
+        "SHARD_IDS",
+        "CACHE_PROFILE",
+        "METRICS_HOST",
+        "METRICS_PORT",
+    })
+
+    # Claves admitidas en DYNAMIC_VOICE_GUILD_OVERRIDES y su tipo
+    DYNAMIC_VOICE_OVERRIDE_KEYS: Mapping[str, type] = MappingProxyType({
+        "enabled": bool,
+        "trigger_names": tuple,
+        "trigger_channel_ids": frozenset,
+        "channel_prefix": str,
+        "cleanup_delay": int,
+        "pool_enabled": bool,
+    })
 
     # ====================================
     # CONFIGURACIÓN DISCORD
     # ====================================
 
     # Token del bot (OBLIGATORIO)
-    DISCORD_TOKEN: str = os.getenv("DISCORD_TOKEN", "")
+    DISCORD_TOKEN: str
 
     # Guild principal
-    GUILD_ID: Optional[int] = None
-    if os.getenv("GUILD_ID"):
-        GUILD_ID = int(os.getenv("GUILD_ID"))
+    GUILD_ID: Optional[int]
+
+    # ====================================
+    # SHARDS
+    # ====================================
+
+    # Modo de conexión: single (un shard), auto (Discord decide) o range (shards fijos)
+    SHARD_MODE: str
+
+    # Total de shards del bot (obligatorio en modo range; opcional en auto)
+    SHARD_COUNT: Optional[int]
+
+    # Shards de este proceso en modo range (SHARD_IDS=0-3 o derivados de
+    # SHARDS_PER_REPLICA y SHARD_REPLICA_INDEX en réplicas de Kubernetes)
+    SHARD_IDS: Tuple[int, ...]
+
+    # ====================================
+    # CACHÉ DEL GATEWAY
+    # ====================================
+
+    # Perfil de caché: full (todos los miembros, chunking al iniciar),
+    # voice (solo miembros en voz) o minimal (sin miembros ni mensajes)
+    CACHE_PROFILE: str
+
+    # Miembros obtenidos bajo demanda: segundos de validez y máximo por proceso
+    MEMBER_CACHE_TTL: int
+    MEMBER_CACHE_SIZE: int
+
+    # Historial compacto para los logs de edición y borrado: mensajes por canal y tope total
+    MESSAGE_CACHE_PER_CHANNEL: int
+    MESSAGE_CACHE_MAX_MB: float
 
     # ====================================
     # CONFIGURACIÓN GENERAL
     # ====================================
 
-    # Entorno de ejecución
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
+    # Entorno de ejecución y atajos precalculados
+    ENVIRONMENT: str
+    IS_DEVELOPMENT: bool
+    IS_PRODUCTION: bool
 
     # Logging
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str
+    LOG_CONFIG: str
 
     # Prefijo de comandos tradicionales
-    COMMAND_PREFIX: str = os.getenv("COMMAND_PREFIX", "!")
+    COMMAND_PREFIX: str
 
     # ====================================
     # CONFIGURACIÓN DE CANALES
     # ====================================
 
     # Canal de logs de moderación
-    MOD_LOG_CHANNEL_ID: Optional[int] = None
-    if os.getenv("MOD_LOG_CHANNEL_ID"):
-        MOD_LOG_CHANNEL_ID = int(os.getenv("MOD_LOG_CHANNEL_ID"))
+    MOD_LOG_CHANNEL_ID: Optional[int]
+
+    # Segundos que se acumulan eventos antes de publicarlos en el canal de logs
+    MOD_LOG_FLUSH_INTERVAL: float
+
+    # Eventos pendientes como máximo; con el canal limitado se descartan los nuevos
+    MOD_LOG_BUFFER_SIZE: int
 
     # Canal de bienvenida
-    WELCOME_CHANNEL_ID: Optional[int] = None
-    if os.getenv("WELCOME_CHANNEL_ID"):
-        WELCOME_CHANNEL_ID = int(os.getenv("WELCOME_CHANNEL_ID"))
+    WELCOME_CHANNEL_ID: Optional[int]
+
+    # Entradas en WELCOME_BURST_WINDOW segundos a partir de las que las
+    # bienvenidas se agrupan en un resumen cada WELCOME_DIGEST_INTERVAL segundos
+    WELCOME_BURST_THRESHOLD: int
+    WELCOME_BURST_WINDOW: float
+    WELCOME_DIGEST_INTERVAL: float
 
     # ====================================
     # CONFIGURACIÓN DE CANALES DINÁMICOS
     # ====================================
 
-    # Nombres de canales trigger para canales dinámicos
-    @property
-    def DYNAMIC_VOICE_TRIGGER_NAMES(self) -> List[str]:
-        """Lista de nombres de canales que activan la creación de canales dinámicos"""
-        trigger_names = os.getenv("DYNAMIC_VOICE_TRIGGER_NAMES", "🔧 Crear Canal,Crear Canal,➕ Crear Canal")
-        return [name.strip() for name in trigger_names.split(",") if name.strip()]
+    # Servidores atendidos: "main" (solo GUILD_ID) o "all" (todos)
+    DYNAMIC_VOICE_SCOPE: str
+
+    # Ajustes por servidor que reemplazan a los globales (JSON, ver DYNAMIC_VOICE_OVERRIDE_KEYS)
+    DYNAMIC_VOICE_GUILD_OVERRIDES: Mapping[int, Mapping[str, Any]]
+
+    # Nombres de canales que activan la creación de canales dinámicos
+    DYNAMIC_VOICE_TRIGGER_NAMES: Tuple[str, ...]
+
+    # IDs de canales fijados como trigger sin importar su nombre
+    DYNAMIC_VOICE_TRIGGER_CHANNEL_IDS: FrozenSet[int]
 
     # Prefijo para canales temporales
-    DYNAMIC_VOICE_CHANNEL_PREFIX: str = os.getenv("DYNAMIC_VOICE_CHANNEL_PREFIX", "💬 Canal de")
+    DYNAMIC_VOICE_CHANNEL_PREFIX: str
 
     # Tiempo de espera antes de eliminar canal vacío (segundos)
-    DYNAMIC_VOICE_CLEANUP_DELAY: int = int(os.getenv("DYNAMIC_VOICE_CLEANUP_DELAY", "10"))
+    DYNAMIC_VOICE_CLEANUP_DELAY: int
 
     # Intervalo de limpieza automática (minutos)
-    DYNAMIC_VOICE_CLEANUP_INTERVAL: int = int(os.getenv("DYNAMIC_VOICE_CLEANUP_INTERVAL", "5"))
+    DYNAMIC_VOICE_CLEANUP_INTERVAL: int
+
+    # Reserva de canales ocultos pre-creados por categoría
+    DYNAMIC_VOICE_POOL_ENABLED: bool
+
+    # Tamaño mínimo y máximo de la reserva por categoría
+    DYNAMIC_VOICE_POOL_MIN: int
+    DYNAMIC_VOICE_POOL_MAX: int
+
+    # Ventana para medir la tasa de entradas que ajusta la reserva (segundos)
+    DYNAMIC_VOICE_POOL_WINDOW: int
+
+    # ====================================
+    # PERSISTENCIA
+    # ====================================
+
+    # Directorio de datos persistentes (volumen /app/data en Docker)
+    DATA_DIR: str
+
+    # Backend de estado (sqlite, memory)
+    STATE_BACKEND: str
+
+    # Intervalo de escritura por lotes del estado (segundos)
+    STATE_FLUSH_INTERVAL: float
+
+    # ====================================
+    # COLA DE ACCIONES REST
+    # ====================================
+
+    # Acciones REST simultáneas como máximo (una por ruta de rate limit)
+    ACTION_QUEUE_CONCURRENCY: int
+
+    # Esperas por 429 más largas que esto (segundos) no las hace discord.py:
+    # llegan a la cola de acciones como RateLimited (mínimo admitido: 30)
+    RATE_LIMIT_MAX_WAIT: float
+
+    # Segundos para vaciar la cola al recibir SIGTERM (menos que el periodo de gracia)
+    DRAIN_TIMEOUT: float
+
+    # ====================================
+    # MONITORIZACIÓN
+    # ====================================
+
+    # Servidor HTTP interno de salud y métricas (puerto 0 = desactivado)
+    METRICS_HOST: str
+    METRICS_PORT: int
+    LOOP_WATCHDOG_ENABLED: bool
+    LOOP_WATCHDOG_THRESHOLD: float
 
     # ====================================
     # CONFIGURACIÓN DE ROLES
     # ====================================
 
-    @property
-    def ADMIN_ROLE_IDS(self) -> List[int]:
-        """Lista de IDs de roles de administrador"""
-        ids_str = os.getenv("ADMIN_ROLE_IDS", "")
-        if not ids_str:
-            return []
-        return [int(id.strip()) for id in ids_str.split(",") if id.strip()]
+    # IDs de roles de administrador y moderador
+    ADMIN_ROLE_IDS: FrozenSet[int]
+    MOD_ROLE_IDS: FrozenSet[int]
 
-    @property
-    def MOD_ROLE_IDS(self) -> List[int]:
-        """Lista de IDs de roles de moderador"""
-        ids_str = os.getenv("MOD_ROLE_IDS", "")
-        if not ids_str:
-            return []
-        return [int(id.strip()) for id in ids_str.split(",") if id.strip()]
+    # Rol de miembro (se asigna automáticamente al entrar)
+    MEMBER_ROLE_ID: Optional[int]
 
-    # Rol de miembro
-    MEMBER_ROLE_ID: Optional[int] = None
-    if os.getenv("MEMBER_ROLE_ID"):
-        MEMBER_ROLE_ID = int(os.getenv("MEMBER_ROLE_ID"))
+    # Asignaciones de rol automático por segundo como máximo
+    AUTO_ROLE_RATE: float
 
     # ====================================
-    # CONFIGURACIÓN DE DESARROLLO
+    # CONSTRUCCIÓN
     # ====================================
 
-    @property
-    def IS_DEVELOPMENT(self) -> bool:
-        """Verifica si estamos en modo desarrollo"""
-        return self.ENVIRONMENT.lower() == "development"
+    def __init__(self, **values: Any):
+        missing = [name for name in self.__slots__ if name not in values]
+        if missing:
+            raise TypeError(f"Faltan valores de configuración: {', '.join(missing)}")
+
+        for name in self.__slots__:
+            object.__setattr__(self, name, values.pop(name))
+
+        if values:
+            raise TypeError(f"Valores de configuración desconocidos: {', '.join(values)}")
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Construye la configuración desde `.env` y el entorno del proceso"""
+
+        env = _EnvParser(_read_environment() if environ is None else environ)
+
+        environment = env.get_str("ENVIRONMENT", "development")
+
+        # Shards de la réplica: explícitos o por índice de réplica
+        shard_ids = env.int_ranges("SHARD_IDS")
+        shards_per_replica = env.optional_int("SHARDS_PER_REPLICA")
+        replica_index = env.optional_int("SHARD_REPLICA_INDEX")
+        if not shard_ids and shards_per_replica and replica_index is not None:
+            first = replica_index * shards_per_replica
+            shard_ids = tuple(range(first, first + shards_per_replica))
+
+        values = dict(
+            DISCORD_TOKEN=env.get_str("DISCORD_TOKEN"),
+            GUILD_ID=env.optional_int("GUILD_ID"),
+            SHARD_MODE=env.get_str("SHARD_MODE", "single").lower(),
+            SHARD_COUNT=env.optional_int("SHARD_COUNT"),
+            SHARD_IDS=shard_ids,
+            CACHE_PROFILE=env.get_str("CACHE_PROFILE", "full").lower(),
+            MEMBER_CACHE_TTL=env.get_int("MEMBER_CACHE_TTL", 300),
+            MEMBER_CACHE_SIZE=env.get_int("MEMBER_CACHE_SIZE", 5000),
+            MESSAGE_CACHE_PER_CHANNEL=env.get_int("MESSAGE_CACHE_PER_CHANNEL", 500),
+            MESSAGE_CACHE_MAX_MB=env.get_float("MESSAGE_CACHE_MAX_MB", 8.0),
+            ENVIRONMENT=environment,
+            LOG_LEVEL=env.get_str("LOG_LEVEL", "INFO"),
+            LOG_CONFIG=env.get_str("LOG_CONFIG", str(Path(__file__).resolve().parents[2] / "config" / "logging.conf")),
+            COMMAND_PREFIX=env.get_str("COMMAND_PREFIX", "!"),
+            IS_DEVELOPMENT=environment.lower() == "development",
+            IS_PRODUCTION=environment.lower() == "production",
+            MOD_LOG_CHANNEL_ID=env.optional_int("MOD_LOG_CHANNEL_ID"),
+            MOD_LOG_FLUSH_INTERVAL=env.get_float("MOD_LOG_FLUSH_INTERVAL", 5.0),
+            MOD_LOG_BUFFER_SIZE=env.get_int("MOD_LOG_BUFFER_SIZE", 1000),
+            WELCOME_CHANNEL_ID=env.optional_int("WELCOME_CHANNEL_ID"),
+            WELCOME_BURST_THRESHOLD=env.get_int("WELCOME_BURST_THRESHOLD", 5),
+            WELCOME_BURST_WINDOW=env.get_float("WELCOME_BURST_WINDOW", 10.0),
+            WELCOME_DIGEST_INTERVAL=env.get_float("WELCOME_DIGEST_INTERVAL", 30.0),
+            DYNAMIC_VOICE_SCOPE=env.get_str("DYNAMIC_VOICE_SCOPE", "main").lower(),
+            DYNAMIC_VOICE_GUILD_OVERRIDES=env.guild_overrides(
+                "DYNAMIC_VOICE_GUILD_OVERRIDES", cls.DYNAMIC_VOICE_OVERRIDE_KEYS
+            ),
+            DYNAMIC_VOICE_TRIGGER_NAMES=env.names(
+                "DYNAMIC_VOICE_TRIGGER_NAMES", "🔧 Crear Canal,Crear Canal,➕ Crear Canal"
+            ),
+            DYNAMIC_VOICE_TRIGGER_CHANNEL_IDS=env.id_set("DYNAMIC_VOICE_TRIGGER_CHANNEL_IDS"),
+            DYNAMIC_VOICE_CHANNEL_PREFIX=env.get_str("DYNAMIC_VOICE_CHANNEL_PREFIX", "💬 Canal de"),
+            DYNAMIC_VOICE_CLEANUP_DELAY=env.get_int("DYNAMIC_VOICE_CLEANUP_DELAY", 10),
+            DYNAMIC_VOICE_CLEANUP_INTERVAL=env.get_int("DYNAMIC_VOICE_CLEANUP_INTERVAL", 5),
+            DYNAMIC_VOICE_POOL_ENABLED=env.get_bool("DYNAMIC_VOICE_POOL_ENABLED"),
+            DYNAMIC_VOICE_POOL_MIN=env.get_int("DYNAMIC_VOICE_POOL_MIN", 1),
+            DYNAMIC_VOICE_POOL_MAX=env.get_int("DYNAMIC_VOICE_POOL_MAX", 5),
+            DYNAMIC_VOICE_POOL_WINDOW=env.get_int("DYNAMIC_VOICE_POOL_WINDOW", 300),
+            DATA_DIR=env.get_str("DATA_DIR", str(Path(__file__).resolve().parents[2] / "data")),
+            STATE_BACKEND=env.get_str("STATE_BACKEND", "sqlite"),
+            STATE_FLUSH_INTERVAL=env.get_float("STATE_FLUSH_INTERVAL", 0.5),
+            ACTION_QUEUE_CONCURRENCY=env.get_int("ACTION_QUEUE_CONCURRENCY", 4),
+            RATE_LIMIT_MAX_WAIT=env.get_float("RATE_LIMIT_MAX_WAIT", 30.0),
+            DRAIN_TIMEOUT=env.get_float("DRAIN_TIMEOUT", 20.0),
+            METRICS_HOST=env.get_str("METRICS_HOST", "0.0.0.0"),
+            METRICS_PORT=env.get_int("METRICS_PORT", 0),
+            LOOP_WATCHDOG_ENABLED=env.get_bool("LOOP_WATCHDOG_ENABLED"),
+            LOOP_WATCHDOG_THRESHOLD=env.get_float("LOOP_WATCHDOG_THRESHOLD", 0.25),
+            ADMIN_ROLE_IDS=env.id_set("ADMIN_ROLE_IDS"),
+            MOD_ROLE_IDS=env.id_set("MOD_ROLE_IDS"),
+            MEMBER_ROLE_ID=env.optional_int("MEMBER_ROLE_ID"),
+            AUTO_ROLE_RATE=env.get_float("AUTO_ROLE_RATE", 1.0),
+        )
+
+        if env.errors:
+            raise ValueError(
+                f"Errores de configuración:\n" +
+                "\n".join(f"- {error}" for error in env.errors)
+            )
+
+        return cls(**values)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("La configuración es inmutable; usa reload_settings() para cambiarla")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("La configuración es inmutable; usa reload_settings() para cambiarla")
 
-    @property
-    def IS_PRODUCTION(self) -> bool:
-        """Verifica si estamos en modo producción"""
-        return self.ENVIRONMENT.lower() == "production"
+    def __repr__(self) -> str:
+        return f"<Settings environment={self.ENVIRONMENT!r} guild_id={self.GUILD_ID}>"
+
+    def changed_fields(self, other: "Settings") -> List[str]:
+        """Nombres de los valores que difieren entre dos instantáneas"""
+        return [name for name in self.__slots__ if getattr(self, name) != getattr(other, name)]
 
     # ====================================
     # VALIDACIÓN
@@ -127,13 +543,85 @@ class Settings:
         if self.DISCORD_TOKEN == "your_discord_bot_token_here":
             errors.append("Debes configurar un DISCORD_TOKEN válido")
 
+        # Validar shards
+        if self.SHARD_MODE not in ("single", "auto", "range"):
+            errors.append("SHARD_MODE debe ser 'single', 'auto' o 'range'")
+
+        if self.SHARD_COUNT is not None and self.SHARD_COUNT < 1:
+            errors.append("SHARD_COUNT debe ser mayor a 0")
+
+        if self.SHARD_MODE == "range":
+            if self.SHARD_COUNT is None or not self.SHARD_IDS:
+                errors.append("SHARD_MODE=range requiere SHARD_COUNT y SHARD_IDS (o SHARDS_PER_REPLICA + SHARD_REPLICA_INDEX)")
+            elif self.SHARD_IDS[-1] >= self.SHARD_COUNT:
+                errors.append(f"SHARD_IDS fuera de rango: el máximo es {self.SHARD_COUNT - 1}")
+
+        # Validar caché
+        if self.CACHE_PROFILE not in ("full", "voice", "minimal"):
+            errors.append("CACHE_PROFILE debe ser 'full', 'voice' o 'minimal'")
+
+        if self.MEMBER_CACHE_TTL < 0 or self.MEMBER_CACHE_SIZE < 0:
+            errors.append("MEMBER_CACHE_TTL y MEMBER_CACHE_SIZE no pueden ser negativos")
+
+        if self.MESSAGE_CACHE_PER_CHANNEL < 0 or self.MESSAGE_CACHE_MAX_MB < 0:
+            errors.append("MESSAGE_CACHE_PER_CHANNEL y MESSAGE_CACHE_MAX_MB no pueden ser negativos")
+
+        if self.MOD_LOG_FLUSH_INTERVAL <= 0:
+            errors.append("MOD_LOG_FLUSH_INTERVAL debe ser mayor que 0")
+
+        if self.MOD_LOG_BUFFER_SIZE < 1:
+            errors.append("MOD_LOG_BUFFER_SIZE debe ser mayor a 0")
+
+        if self.WELCOME_BURST_THRESHOLD < 1:
+            errors.append("WELCOME_BURST_THRESHOLD debe ser mayor a 0")
+
+        if self.WELCOME_BURST_WINDOW <= 0 or self.WELCOME_DIGEST_INTERVAL <= 0:
+            errors.append("WELCOME_BURST_WINDOW y WELCOME_DIGEST_INTERVAL deben ser mayores que 0")
+
+        if self.AUTO_ROLE_RATE <= 0:
+            errors.append("AUTO_ROLE_RATE debe ser mayor que 0")
+
+        if not 0 <= self.METRICS_PORT <= 65535:
+            errors.append("METRICS_PORT debe estar entre 0 y 65535")
+
+        if self.LOOP_WATCHDOG_THRESHOLD <= 0:
+            errors.append("LOOP_WATCHDOG_THRESHOLD debe ser mayor que 0")
+
         # Validar configuración de canales dinámicos
+        if self.DYNAMIC_VOICE_SCOPE not in ("main", "all"):
+            errors.append("DYNAMIC_VOICE_SCOPE debe ser 'main' o 'all'")
+
         if self.DYNAMIC_VOICE_CLEANUP_DELAY < 1:
             errors.append("DYNAMIC_VOICE_CLEANUP_DELAY debe ser mayor a 0")
 
+        for guild_id, overrides in self.DYNAMIC_VOICE_GUILD_OVERRIDES.items():
+            if overrides.get("cleanup_delay", 1) < 1:
+                errors.append(f"DYNAMIC_VOICE_GUILD_OVERRIDES: 'cleanup_delay' en {guild_id} debe ser mayor a 0")
+
         if self.DYNAMIC_VOICE_CLEANUP_INTERVAL < 1:
             errors.append("DYNAMIC_VOICE_CLEANUP_INTERVAL debe ser mayor a 0")
 
+        if self.DYNAMIC_VOICE_POOL_MIN < 0 or self.DYNAMIC_VOICE_POOL_MAX < self.DYNAMIC_VOICE_POOL_MIN:
+            errors.append("DYNAMIC_VOICE_POOL_MAX debe ser mayor o igual a DYNAMIC_VOICE_POOL_MIN (>= 0)")
+
+        if self.DYNAMIC_VOICE_POOL_WINDOW < 1:
+            errors.append("DYNAMIC_VOICE_POOL_WINDOW debe ser mayor a 0")
+
+        if self.STATE_BACKEND.lower() not in ("sqlite", "memory"):
+            errors.append("STATE_BACKEND debe ser 'sqlite' o 'memory'")
+
+        if self.STATE_FLUSH_INTERVAL <= 0:
+            errors.append("STATE_FLUSH_INTERVAL debe ser mayor a 0")
+
+        if self.ACTION_QUEUE_CONCURRENCY < 1:
+            errors.append("ACTION_QUEUE_CONCURRENCY debe ser mayor a 0")
+
+        if self.RATE_LIMIT_MAX_WAIT < 30:
+            errors.append("RATE_LIMIT_MAX_WAIT debe ser al menos 30 (mínimo de discord.py)")
+
+        if self.DRAIN_TIMEOUT < 0:
+            errors.append("DRAIN_TIMEOUT no puede ser negativo")
+
         if errors:
             raise ValueError(
                 f"Errores de configuración:\n" +
@@ -154,52 +642,44 @@ class Settings:
     # ====================================
 
     def setup_logging(self) -> None:
-        """Configura el sistema de logging"""
-        import colorlog
-
-        # Configurar el nivel de logging
-        log_level = getattr(logging, self.LOG_LEVEL.upper(), logging.INFO)
-
-        # Formato para desarrollo (con colores)
-        if self.IS_DEVELOPMENT:
-            formatter = colorlog.ColoredFormatter(
-                "%(log_color)s%(asctime)s [%(levelname)8s] %(name)s: %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-                log_colors={
-                    'DEBUG': 'cyan',
-                    'INFO': 'green',
-                    'WARNING': 'yellow',
-                    'ERROR': 'red',
-                    'CRITICAL': 'red,bg_white',
-                }
-            )
-        else:
-            # Formato para producción (sin colores)
-            formatter = logging.Formatter(
-                "%(asctime)s [%(levelname)8s] %(name)s: %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S"
-            )
+        """Configura el pipeline de logging (ver config/logging.conf)"""
+        from .log_pipeline import configure_logging
 
-        # Configurar handler
-        handler = logging.StreamHandler()
-        handler.setFormatter(formatter)
+        configure_logging(self)
 
-        # Configurar logger raíz
-        root_logger = logging.getLogger()
-        root_logger.setLevel(log_level)
-        root_logger.handlers.clear()
-        root_logger.addHandler(handler)
 
-        # Silenciar logs muy verbosos de discord.py en producción
-        if not self.IS_DEVELOPMENT:
-            logging.getLogger('discord').setLevel(logging.WARNING)
-            logging.getLogger('discord.http').setLevel(logging.WARNING)
+# Instancia global de configuración: se crea al primer uso (no al importar)
+# y se reemplaza entera al recargar
+_settings: Optional[Settings] = None
 
 
-# Instancia global de configuración
-settings = Settings()
+def get_settings() -> Settings:
+    """Obtiene la instantánea de configuración vigente"""
+    global _settings
 
+    if _settings is None:
+        _settings = Settings.from_env()
+    return _settings
 
-def get_settings() -> Settings:
-    """Obtiene la instancia de configuración"""
-    return settings
\ No newline at end of file
+
+def reload_settings() -> Settings:
+    """
+    Vuelve a leer `.env` y el entorno y reemplaza la instantánea vigente.
+
+    Si la nueva configuración no es válida se lanza ValueError y la anterior
+    sigue en uso.
+    """
+    global _settings
+
+    new_settings = Settings.from_env()
+    new_settings.validate()
+
+    _settings = new_settings
+    return new_settings
+
+
+def __getattr__(name: str) -> Any:
+    # `settings` sigue disponible como atributo del módulo
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
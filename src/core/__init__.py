@@ -2,7 +2,18 @@
 Núcleo del bot - Funcionalidades centrales
 """
 
-from .client import UaintBot
-from .exceptions import BotException, ConfigurationError
+from typing import Any
 
-__all__ = ["UaintBot", "BotException", "ConfigurationError"]
\ No newline at end of file
+__all__ = ["UaintBot", "BotException", "ConfigurationError"]
+
+
+def __getattr__(name: str) -> Any:
+    # Se importan al usarse (arrastran discord.py), para que submódulos
+    # ligeros como core.startup puedan cargarse antes que el resto del bot
+    if name == "UaintBot":
+        from .client import UaintBot
+        return UaintBot
+    if name in ("BotException", "ConfigurationError"):
+        from . import exceptions
+        return getattr(exceptions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,362 @@
+"""
+Cola central de acciones REST con control de rate limits
+Informatica UAIn'T Community Bot
+"""
+
+import heapq
+import logging
+import asyncio
+import itertools
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+ActionFactory = Callable[[], Awaitable[Any]]
+
+
+class ActionKind(IntEnum):
+    """Tipos de acción; el valor es la prioridad (menor = antes)"""
+
+    MOVE = 0
+    CREATE = 1
+    EDIT = 2
+    SEND = 3
+    DELETE = 4
+
+
+class Action:
+    """Acción REST pendiente"""
+
+    __slots__ = ("kind", "route", "key", "factory", "future", "enqueued_at", "attempts")
+
+    def __init__(self, kind: ActionKind, route: str, key: Optional[Hashable],
+                 factory: ActionFactory, future: asyncio.Future, enqueued_at: float):
+        self.kind = kind
+        self.route = route
+        self.key = key
+        self.factory = factory
+        self.future = future
+        self.enqueued_at = enqueued_at
+        self.attempts = 0
+
+
+class RouteBucket:
+    """Estado de un bucket de rate limit (una acción en vuelo por ruta)"""
+
+    __slots__ = ("busy", "blocked_until")
+
+    def __init__(self):
+        self.busy = False
+        self.blocked_until = 0.0
+
+
+class KindStats:
+    """Métricas acumuladas por tipo de acción"""
+
+    __slots__ = ("completed", "failed", "wait_total", "wait_max")
+
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        executed = self.completed + self.failed
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "wait_avg": self.wait_total / executed if executed else 0.0,
+            "wait_max": self.wait_max,
+        }
+
+
+class ActionQueue:
+    """
+    Cola priorizada de acciones REST (crear, mover, eliminar...).
+
+    - Cada ruta (p.ej. `guild:<id>:channels`) es un bucket con una sola acción
+      en vuelo, y se bloquea durante `retry_after` si Discord responde 429.
+      discord.py espera por su cuenta los 429 cortos; solo los que superan
+      RATE_LIMIT_MAX_WAIT llegan aquí como `discord.RateLimited`, y mientras
+      tanto la cola sigue con las demás rutas.
+    - Las acciones se ejecutan por prioridad: los movimientos antes que las
+      eliminaciones.
+    - Las acciones con `key` se coalescen: repetir (tipo, key) reemplaza a la
+      pendiente. Un canal solo se puede eliminar cuando ya existe (su CREATE
+      terminó), así que "crear y eliminar" se evita anulando el CREATE
+      pendiente con `cancel` cuando deja de hacer falta.
+    """
+
+    MAX_RATE_LIMIT_RETRIES = 3
+
+    def __init__(self, max_concurrency: int = 4):
+        self.max_concurrency = max_concurrency
+
+        self._heap: List[Tuple[int, int, Action]] = []
+        self._pending: Dict[Tuple[ActionKind, Hashable], Action] = {}
+        self._routes: Dict[str, RouteBucket] = {}
+        self._seq = itertools.count()
+
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._running: set = set()
+
+        # Métricas
+        self.kind_stats: Dict[ActionKind, KindStats] = {kind: KindStats() for kind in ActionKind}
+        self.coalesced = 0
+        self.rate_limited = 0
+
+    @property
+    def depth(self) -> int:
+        """Acciones pendientes (sin contar las que están en vuelo)"""
+        return sum(1 for _, _, action in self._heap if not action.future.done())
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._running)
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    # ====================================
+    # ENCOLADO
+    # ====================================
+
+    def submit(
+            self,
+            kind: ActionKind,
+            route: str,
+            factory: ActionFactory,
+            key: Optional[Hashable] = None
+    ) -> asyncio.Future:
+        """Encola una acción y devuelve un future con su resultado"""
+
+        if key is not None:
+            # Repetición de la misma acción: la última gana
+            existing = self._pending.get((kind, key))
+            if existing is not None and not existing.future.done():
+                existing.factory = factory
+                self.coalesced += 1
+                return existing.future
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        action = Action(kind, route, key, factory, future, self._now())
+
+        if key is not None:
+            self._pending[(kind, key)] = action
+
+        self._push(action)
+        return future
+
+    def cancel(self, kind: ActionKind, key: Hashable) -> bool:
+        """Anula una acción pendiente; su future se resuelve con None"""
+
+        action = self._pending.pop((kind, key), None)
+        if action is None or action.future.done():
+            return False
+
+        action.future.set_result(None)
+        self.coalesced += 1
+        return True
+
+    def _push(self, action: Action) -> None:
+        heapq.heappush(self._heap, (int(action.kind), next(self._seq), action))
+        self._wakeup.set()
+
+    # ====================================
+    # EJECUCIÓN
+    # ====================================
+
+    def start(self) -> None:
+        """Inicia el despachador"""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_loop(), name="action-queue")
+
+    async def stop(self) -> None:
+        """Detiene el despachador y cancela las acciones pendientes"""
+
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+
+        for _, _, action in self._heap:
+            if not action.future.done():
+                action.future.cancel()
+
+        self._heap.clear()
+        self._pending.clear()
+
+    async def drain(self, timeout: float) -> bool:
+        """Espera a que terminen las acciones pendientes y en vuelo; False si vence `timeout`"""
+
+        deadline = self._now() + timeout
+        while self.depth or self._running:
+            if self._now() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    def _route(self, name: str) -> RouteBucket:
+        bucket = self._routes.get(name)
+        if bucket is None:
+            bucket = self._routes[name] = RouteBucket()
+        return bucket
+
+    def _take_runnable(self) -> Tuple[Optional[Action], Optional[float]]:
+        """
+        Extrae la acción más prioritaria cuya ruta está libre.
+
+        Devuelve también el próximo momento en que una ruta bloqueada se libera.
+        """
+
+        now = self._now()
+        skipped = []
+        found = None
+        next_unblock = None
+
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            action = entry[2]
+
+            if action.future.done():
+                continue
+
+            bucket = self._route(action.route)
+            if bucket.busy:
+                skipped.append(entry)
+                continue
+
+            if bucket.blocked_until > now:
+                skipped.append(entry)
+                if next_unblock is None or bucket.blocked_until < next_unblock:
+                    next_unblock = bucket.blocked_until
+                continue
+
+            found = action
+            break
+
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+
+        return found, next_unblock
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            await self._slots.acquire()
+
+            action = None
+            while action is None:
+                self._wakeup.clear()
+                action, next_unblock = self._take_runnable()
+
+                if action is None:
+                    timeout = None if next_unblock is None else max(next_unblock - self._now(), 0)
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+
+            if action.key is not None and self._pending.get((action.kind, action.key)) is action:
+                del self._pending[(action.kind, action.key)]
+
+            task = asyncio.create_task(self._execute(action))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _execute(self, action: Action) -> None:
+        bucket = self._route(action.route)
+        bucket.busy = True
+        action.attempts += 1
+
+        stats = self.kind_stats[action.kind]
+        wait = self._now() - action.enqueued_at
+        requeue = False
+
+        try:
+            result = await action.factory()
+
+        except Exception as e:
+            retry_after = _retry_after(e)
+
+            if retry_after is not None and action.attempts <= self.MAX_RATE_LIMIT_RETRIES:
+                self.rate_limited += 1
+                bucket.blocked_until = self._now() + retry_after
+                logger.warning(
+                    "⏰ Rate limit en %s (%s), reintentando en %.2fs", action.route, action.kind.name, retry_after
+                )
+                requeue = True
+            else:
+                stats.failed += 1
+                if not action.future.done():
+                    action.future.set_exception(e)
+
+        else:
+            stats.completed += 1
+            if not action.future.done():
+                action.future.set_result(result)
+
+        finally:
+            bucket.busy = False
+            self._slots.release()
+
+            # Un bucket libre y sin bloqueo no guarda estado: se descarta para
+            # no acumular uno por cada canal que existió (p.ej. `channel:<id>`)
+            if bucket.blocked_until <= self._now():
+                self._routes.pop(action.route, None)
+
+        if requeue:
+            if action.key is not None:
+                self._pending.setdefault((action.kind, action.key), action)
+            self._push(action)
+        else:
+            stats.wait_total += wait
+            stats.wait_max = max(stats.wait_max, wait)
+
+        self._wakeup.set()
+
+    # ====================================
+    # MÉTRICAS
+    # ====================================
+
+    def stats(self) -> Dict[str, Any]:
+        """Resumen de métricas de la cola"""
+        return {
+            "depth": self.depth,
+            "in_flight": self.in_flight,
+            "coalesced": self.coalesced,
+            "rate_limited": self.rate_limited,
+            "kinds": {kind.name.lower(): stats.as_dict() for kind, stats in self.kind_stats.items()},
+        }
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Obtiene el tiempo de espera de un error 429, si lo es"""
+
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+
+    if isinstance(error, discord.HTTPException) and error.status == 429:
+        header = error.response.headers.get("Retry-After") if error.response is not None else None
+        try:
+            return float(header) if header else 1.0
+        except ValueError:
+            return 1.0
+
+    return None
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    """Evita avisos de excepciones no recuperadas en acciones sin esperar"""
+    if not future.cancelled():
+        future.exception()
@@ -0,0 +1,244 @@
+"""
+Difusión de embeds a varios canales (inmediata o programada)
+Informatica UAIn'T Community Bot
+"""
+
+import time
+import logging
+import asyncio
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+import discord
+
+from .actions import ActionKind
+from .scheduler import DeadlineScheduler
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+# Namespace de los envíos programados en el almacenamiento de estado
+BROADCAST_NAMESPACE = "broadcast.jobs"
+
+
+class BroadcastOutcome(NamedTuple):
+    """Resultado del envío a un canal"""
+
+    channel_id: int
+    error: Optional[str] = None  # None si se envió
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BroadcastResult(NamedTuple):
+    """Resultado de una difusión, canal por canal"""
+
+    outcomes: Tuple[BroadcastOutcome, ...]
+
+    @property
+    def sent(self) -> List[int]:
+        return [outcome.channel_id for outcome in self.outcomes if outcome.ok]
+
+    @property
+    def failed(self) -> List[BroadcastOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+
+def _describe_error(error: BaseException) -> str:
+    if isinstance(error, asyncio.CancelledError):
+        return "cancelado"
+    if isinstance(error, discord.Forbidden):
+        return "sin permisos"
+    if isinstance(error, discord.NotFound):
+        return "canal no encontrado"
+    if isinstance(error, discord.HTTPException):
+        return f"error HTTP {error.status}"
+    return type(error).__name__
+
+
+class BroadcastService:
+    """
+    Envía un mismo embed a muchos canales a través de la cola de acciones.
+
+    Cada canal es su propia ruta de rate limit, así que los envíos a canales
+    distintos van en paralelo (hasta ACTION_QUEUE_CONCURRENCY) y un 429 solo
+    retrasa al canal afectado. Los envíos programados se guardan en el
+    almacenamiento de estado y se retoman al reiniciar; cada canal entregado
+    se anota en el registro para no repetirlo si el proceso cae a mitad.
+    """
+
+    def __init__(self, bot: "UaintBot"):
+        self.bot = bot
+        self.jobs: Dict[int, Dict[str, Any]] = {}  # job_id -> registro persistido
+        self.scheduler = DeadlineScheduler(self._run_due, name="broadcast-jobs")
+
+        self.messages = bot.metrics.registry.counter(
+            "broadcast_messages_total",
+            "Mensajes enviados por difusión según resultado",
+            ("outcome",)
+        )
+
+    async def start(self) -> None:
+        """Carga los envíos programados e inicia el planificador"""
+
+        try:
+            self.jobs = await self.bot.state.load(BROADCAST_NAMESPACE)
+        except Exception as e:
+            logger.error("❌ No se pudieron cargar los envíos programados: %s", e)
+            self.jobs = {}
+
+        now = time.time()
+        for job_id, record in self.jobs.items():
+            self.scheduler.schedule(job_id, max(record["run_at"] - now, 0))
+
+        if self.jobs:
+            logger.info("📅 %s envío(s) programado(s) pendientes", len(self.jobs))
+
+        self.scheduler.start()
+
+    async def stop(self) -> None:
+        await self.scheduler.stop()
+
+    # ====================================
+    # ENVÍO
+    # ====================================
+
+    async def send(
+            self,
+            channels: Iterable[discord.abc.Messageable],
+            embed: discord.Embed,
+            job_id: Optional[int] = None
+    ) -> BroadcastResult:
+        """Envía `embed` a todos los canales y devuelve el resultado de cada uno"""
+
+        outcomes: Dict[int, BroadcastOutcome] = {}
+        futures: List[Tuple[int, asyncio.Future]] = []
+
+        for channel in channels:
+            # Sin permisos en la caché: ni siquiera se intenta la llamada REST
+            if isinstance(channel, discord.abc.GuildChannel):
+                permissions = channel.permissions_for(channel.guild.me)
+                if not (permissions.send_messages and permissions.embed_links):
+                    outcomes[channel.id] = BroadcastOutcome(channel.id, "sin permisos")
+                    continue
+
+            future = self.bot.actions.submit(
+                ActionKind.SEND,
+                f"channel:{channel.id}:messages",
+                lambda channel=channel: channel.send(embed=embed),
+                key=None if job_id is None else ("broadcast", job_id, channel.id)
+            )
+            if job_id is not None:
+                future.add_done_callback(lambda done, channel_id=channel.id: self._mark_done(job_id, channel_id, done))
+            futures.append((channel.id, future))
+
+        results = await asyncio.gather(*(future for _, future in futures), return_exceptions=True)
+        for (channel_id, _), result in zip(futures, results):
+            error = _describe_error(result) if isinstance(result, BaseException) else None
+            outcomes[channel_id] = BroadcastOutcome(channel_id, error)
+
+        result = BroadcastResult(tuple(outcomes.values()))
+        self.messages.inc("sent", amount=len(result.sent))
+        self.messages.inc("failed", amount=len(result.failed))
+        return result
+
+    # ====================================
+    # ENVÍOS PROGRAMADOS
+    # ====================================
+
+    def schedule(
+            self,
+            guild_id: int,
+            channel_ids: Iterable[int],
+            embed: discord.Embed,
+            run_at: float,
+            author_id: int
+    ) -> int:
+        """Programa una difusión para `run_at` (epoch) y devuelve su id"""
+
+        job_id = max(self.jobs, default=0) + 1
+        record = {
+            "guild_id": guild_id,
+            "channel_ids": list(channel_ids),
+            "embed": embed.to_dict(),
+            "run_at": run_at,
+            "author_id": author_id,
+            "created_at": time.time(),
+        }
+
+        self.jobs[job_id] = record
+        self.bot.state.put(BROADCAST_NAMESPACE, job_id, record)
+        self.scheduler.schedule(job_id, max(run_at - time.time(), 0))
+        return job_id
+
+    def cancel(self, job_id: int, guild_id: int) -> bool:
+        """Anula un envío programado de un servidor"""
+
+        record = self.jobs.get(job_id)
+        if record is None or record["guild_id"] != guild_id:
+            return False
+
+        del self.jobs[job_id]
+        self.bot.state.delete(BROADCAST_NAMESPACE, job_id)
+        self.scheduler.cancel(job_id)
+        return True
+
+    def pending(self, guild_id: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """Envíos programados de un servidor, del más próximo al más lejano"""
+        jobs = [(job_id, record) for job_id, record in self.jobs.items() if record["guild_id"] == guild_id]
+        return sorted(jobs, key=lambda job: job[1]["run_at"])
+
+    def _mark_done(self, job_id: int, channel_id: int, future: asyncio.Future) -> None:
+        """Quita un canal del registro al terminar su envío (salvo si se canceló)"""
+
+        record = self.jobs.get(job_id)
+        if record is None or future.cancelled() or channel_id not in record["channel_ids"]:
+            return
+
+        record["channel_ids"].remove(channel_id)
+        self.bot.state.put(BROADCAST_NAMESPACE, job_id, record)
+
+    async def _run_due(self, job_ids: List[int]) -> None:
+        await self.bot.wait_until_ready()
+        await asyncio.gather(*(self._run_job(job_id) for job_id in job_ids))
+
+    async def _run_job(self, job_id: int) -> None:
+        record = self.jobs.get(job_id)
+        if record is None:
+            return
+
+        # Cerrando: queda guardado y el siguiente proceso lo envía al iniciar
+        if self.bot.draining:
+            return
+
+        channels = []
+        missing = []
+        for channel_id in list(record["channel_ids"]):
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                missing.append(BroadcastOutcome(channel_id, "canal no encontrado"))
+            else:
+                channels.append(channel)
+
+        embed = discord.Embed.from_dict(record["embed"])
+        if embed.timestamp:
+            embed.timestamp = discord.utils.utcnow()
+
+        result = await self.send(channels, embed, job_id=job_id)
+
+        # Canales cancelados por un cierre: se reintentan en el siguiente proceso
+        if any(outcome.error == "cancelado" for outcome in result.outcomes):
+            return
+
+        self.jobs.pop(job_id, None)
+        self.bot.state.delete(BROADCAST_NAMESPACE, job_id)
+
+        failed = result.failed + missing
+        logger.info(
+            "📣 Envío programado #%s: %s canal(es) OK, %s con error%s",
+            job_id, len(result.sent), len(failed),
+            "".join(f"\n   #{outcome.channel_id}: {outcome.error}" for outcome in failed)
+        )
@@ -0,0 +1,372 @@
+"""
+Perfiles de caché del gateway, caché de miembros bajo demanda y caché
+compacta de mensajes
+Informatica UAIn'T Community Bot
+"""
+
+import sys
+import time
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from datetime import datetime
+from types import MappingProxyType
+from typing import Deque, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+# Intents por defecto cuyos eventos no escucha ningún cog
+UNUSED_INTENTS: Tuple[str, ...] = (
+    "guild_typing",
+    "dm_typing",
+    "dm_reactions",
+    "invites",
+    "webhooks",
+    "integrations",
+    "guild_scheduled_events",
+    "auto_moderation_configuration",
+    "auto_moderation_execution",
+    "guild_polls",
+    "dm_polls",
+)
+
+
+class CacheProfile(NamedTuple):
+    """Qué guarda en memoria la conexión con Discord"""
+
+    name: str
+    member_flags: Tuple[str, ...]  # flags activas de discord.MemberCacheFlags
+    chunk_guilds_at_startup: bool
+    max_messages: Optional[int]
+    disabled_intents: Tuple[str, ...] = ()
+
+    @property
+    def caches_members(self) -> bool:
+        """Si discord.py mantiene a todos los miembros (y emite on_member_update)"""
+        return "joined" in self.member_flags
+
+    def member_cache_flags(self) -> discord.MemberCacheFlags:
+        return discord.MemberCacheFlags(**{flag: flag in self.member_flags for flag in ("voice", "joined")})
+
+    def apply(self, intents: discord.Intents) -> discord.Intents:
+        """Desactiva en `intents` los que el perfil no necesita"""
+        for name in self.disabled_intents:
+            setattr(intents, name, False)
+        return intents
+
+
+CACHE_PROFILES: Mapping[str, CacheProfile] = MappingProxyType({
+    # Comportamiento por defecto de discord.py: todos los miembros desde el arranque
+    "full": CacheProfile("full", ("voice", "joined"), True, 1000),
+    # Solo quien está en voz (lo que necesitan los canales dinámicos)
+    "voice": CacheProfile("voice", ("voice",), False, 250, UNUSED_INTENTS),
+    # Nada en caché: los miembros llegan en cada evento o se piden por REST.
+    # Sin caché de mensajes las reacciones no generan eventos, así que tampoco se piden.
+    "minimal": CacheProfile("minimal", (), False, None, UNUSED_INTENTS + ("guild_reactions", "expressions")),
+})
+
+
+class MemberCache:
+    """
+    Miembros obtenidos bajo demanda, con caducidad.
+
+    Primero se consulta la caché del gateway (con el perfil `full` siempre
+    acierta). Si el miembro no está, se pide por REST y se guarda
+    MEMBER_CACHE_TTL segundos en un LRU de MEMBER_CACHE_SIZE entradas; las
+    peticiones simultáneas del mismo miembro comparten una sola llamada.
+    """
+
+    def __init__(self, bot: "UaintBot"):
+        self.bot = bot
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[float, discord.Member]]" = OrderedDict()
+        self._pending: Dict[Tuple[int, int], asyncio.Future] = {}
+
+        # Resultado de cada consulta: gateway, ttl, rest, ausente
+        self.lookups: Dict[str, int] = dict.fromkeys(("gateway", "ttl", "rest", "missing"), 0)
+
+        bot.metrics.registry.counter(
+            "member_cache_lookups_total",
+            "Consultas de miembros según dónde se resolvieron",
+            ("source",),
+            collect=lambda: [((source,), count) for source, count in self.lookups.items()]
+        )
+        bot.metrics.registry.gauge(
+            "member_cache_entries",
+            "Miembros guardados en la caché bajo demanda",
+            collect=lambda: [((), len(self._entries))]
+        )
+
+    def attach(self) -> None:
+        """Registra los listeners de invalidación en el bot"""
+        self.bot.add_listener(self.on_member_update)
+        self.bot.add_listener(self.on_raw_member_remove)
+        self.bot.add_listener(self.on_guild_remove)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ====================================
+    # CONSULTA
+    # ====================================
+
+    def get(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """Miembro en memoria (gateway o caché con TTL vigente), sin llamadas REST"""
+
+        member = guild.get_member(user_id)
+        if member is not None:
+            self.lookups["gateway"] += 1
+            return member
+
+        key = (guild.id, user_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, member = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        self.lookups["ttl"] += 1
+        return member
+
+    async def fetch(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """Miembro de `guild`, pidiéndolo por REST si no está en memoria (None si no es miembro)"""
+
+        member = self.get(guild, user_id)
+        if member is not None:
+            return member
+
+        key = (guild.id, user_id)
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            member = None
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # nadie más esperaba: evitar el aviso de excepción no recuperada
+            raise
+        finally:
+            del self._pending[key]
+
+        self.lookups["rest" if member is not None else "missing"] += 1
+        if member is not None:
+            self.remember(member)
+        future.set_result(member)
+        return member
+
+    def remember(self, member: discord.Member) -> None:
+        """Guarda un miembro recibido en un evento o interacción"""
+
+        ttl = self.bot.settings.MEMBER_CACHE_TTL
+        size = self.bot.settings.MEMBER_CACHE_SIZE
+        if not ttl or not size:
+            return
+
+        key = (member.guild.id, member.id)
+        self._entries[key] = (time.monotonic() + ttl, member)
+        self._entries.move_to_end(key)
+        while len(self._entries) > size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, guild_id: int, user_id: int) -> None:
+        self._entries.pop((guild_id, user_id), None)
+
+    # ====================================
+    # INVALIDACIÓN
+    # ====================================
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        self.invalidate(after.guild.id, after.id)
+
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        self.invalidate(payload.guild_id, payload.user.id)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        for key in [key for key in self._entries if key[0] == guild.id]:
+            del self._entries[key]
+
+
+# Caracteres de contenido que se guardan por mensaje (los logs muestran menos)
+MESSAGE_CONTENT_LIMIT = 200
+
+
+class CachedMessage:
+    """Lo que necesitan los logs de un mensaje: sin autor, embeds ni adjuntos"""
+
+    __slots__ = ("id", "author_id", "content")
+
+    def __init__(self, message_id: int, author_id: int, content: str):
+        self.id = message_id
+        self.author_id = author_id
+        self.content = content
+
+    @property
+    def created_at(self) -> datetime:
+        # El ID (snowflake) ya codifica el instante de creación
+        return discord.utils.snowflake_time(self.id)
+
+    def __repr__(self) -> str:
+        return f"<CachedMessage id={self.id} author_id={self.author_id} content={self.content!r}>"
+
+
+# Memoria de un mensaje sin contar el texto: objeto, dos enteros y la celda del deque
+_ENTRY_SIZE = sys.getsizeof(CachedMessage(1 << 62, 1 << 62, "")) + 2 * sys.getsizeof(1 << 62) + 8
+
+
+class MessageCache:
+    """
+    Historial reciente de mensajes para los logs de edición y borrado.
+
+    Cada canal tiene un buffer circular de `per_channel` mensajes compactos
+    (CachedMessage). Sobre el total hay un tope de memoria: al superarlo se
+    descartan los mensajes más antiguos del canal con actividad menos
+    reciente. Se alimenta desde on_message y se consulta con los eventos raw,
+    así que no depende de la caché de discord.py (max_messages).
+    """
+
+    def __init__(self, per_channel: int, max_bytes: int):
+        self.per_channel = per_channel
+        self.max_bytes = max_bytes
+        self.size = 0  # bytes estimados en uso
+
+        # channel_id -> mensajes (del más antiguo al más reciente); orden LRU por actividad
+        self._channels: "OrderedDict[int, Deque[CachedMessage]]" = OrderedDict()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def _sizeof(entry: CachedMessage) -> int:
+        return _ENTRY_SIZE + sys.getsizeof(entry.content)
+
+    # ====================================
+    # ESCRITURA
+    # ====================================
+
+    def add(self, message: discord.Message) -> None:
+        """Guarda un mensaje recibido"""
+
+        if not self.per_channel or not self.max_bytes:
+            return
+
+        ring = self._channels.get(message.channel.id)
+        if ring is None:
+            ring = self._channels[message.channel.id] = deque(maxlen=self.per_channel)
+        else:
+            self._channels.move_to_end(message.channel.id)
+
+        # El deque descarta el más antiguo al llenarse: descontarlo antes
+        if len(ring) == ring.maxlen:
+            self._forget(ring[0])
+
+        entry = CachedMessage(message.id, message.author.id, message.content[:MESSAGE_CONTENT_LIMIT])
+        ring.append(entry)
+        self._count += 1
+        self.size += self._sizeof(entry)
+
+        if self.size > self.max_bytes:
+            self._trim()
+
+    def update(self, channel_id: int, message_id: int, content: str) -> Optional[str]:
+        """Actualiza el contenido tras una edición y devuelve el anterior (None si no estaba)"""
+
+        entry = self._find(channel_id, message_id)
+        if entry is None:
+            return None
+
+        previous = entry.content
+        entry.content = content[:MESSAGE_CONTENT_LIMIT]
+        self.size += sys.getsizeof(entry.content) - sys.getsizeof(previous)
+        return previous
+
+    def pop(self, channel_id: int, message_id: int) -> Optional[CachedMessage]:
+        """Extrae un mensaje borrado"""
+
+        entry = self._find(channel_id, message_id)
+        if entry is not None:
+            ring = self._channels[channel_id]
+            ring.remove(entry)
+            self._forget(entry)
+            if not ring:
+                del self._channels[channel_id]
+        return entry
+
+    def pop_many(self, channel_id: int, message_ids: Iterable[int]) -> List[CachedMessage]:
+        """Extrae los mensajes de un borrado masivo que estaban guardados"""
+
+        ring = self._channels.get(channel_id)
+        if ring is None:
+            return []
+
+        ids = set(message_ids)
+        removed = [entry for entry in ring if entry.id in ids]
+        if removed:
+            kept = [entry for entry in ring if entry.id not in ids]
+            ring.clear()
+            ring.extend(kept)
+            for entry in removed:
+                self._forget(entry)
+            if not ring:
+                del self._channels[channel_id]
+        return removed
+
+    def drop_channel(self, channel_id: int) -> None:
+        ring = self._channels.pop(channel_id, None)
+        if ring:
+            for entry in ring:
+                self._forget(entry)
+
+    def configure(self, per_channel: int, max_bytes: int) -> None:
+        """Aplica límites nuevos (al recargar la configuración)"""
+
+        self.max_bytes = max_bytes
+        if per_channel != self.per_channel:
+            self.per_channel = per_channel
+            for channel_id, ring in list(self._channels.items()):
+                while len(ring) > per_channel:
+                    self._forget(ring.popleft())
+                self._channels[channel_id] = deque(ring, maxlen=per_channel or None)
+                if not ring:
+                    del self._channels[channel_id]
+        self._trim()
+
+    # ====================================
+    # INTERNOS
+    # ====================================
+
+    def _find(self, channel_id: int, message_id: int) -> Optional[CachedMessage]:
+        ring = self._channels.get(channel_id)
+        if ring is None:
+            return None
+
+        # Lo habitual es editar o borrar mensajes recientes: buscar desde el final
+        for entry in reversed(ring):
+            if entry.id == message_id:
+                return entry
+        return None
+
+    def _forget(self, entry: CachedMessage) -> None:
+        self._count -= 1
+        self.size -= self._sizeof(entry)
+
+    def _trim(self) -> None:
+        """Descarta mensajes del canal menos activo hasta quedar bajo el tope"""
+
+        while self.size > self.max_bytes and self._channels:
+            channel_id, ring = next(iter(self._channels.items()))
+            self._forget(ring.popleft())
+            if not ring:
+                del self._channels[channel_id]
@@ -3,24 +3,52 @@ Cliente personalizado del bot de Discord
 Informatica UAIn'T Community Bot
 """
 
+import json
+import time
+import asyncio
+import hashlib
+import signal
 import logging
-from typing import Optional, List
+from pathlib import Path
+from typing import Any, Dict, Optional, List, TYPE_CHECKING
 import discord
 from discord.ext import commands
 
-from config import get_settings
-from .exceptions import ConfigurationError, format_discord_error, should_log_error
+from config import Settings, get_settings, reload_settings
+from .exceptions import ConfigurationError, DatabaseError, format_discord_error, should_log_error
+from .state_store import StateBackend, create_state_backend
+from .actions import ActionQueue
+from .permissions import PermissionService
+from .shards import ShardMonitor
+from .metrics import BotMetrics, InstrumentedCommandTree, RateLimitTrace
+from .watchdog import LoopWatchdog
+from .extensions import ExtensionLoader
+from .broadcast import BroadcastService
+from .modlog import ModLogSink
+from .welcome import JoinPipeline
+from .cache import CACHE_PROFILES, MemberCache, MessageCache
+from .startup import timeline
+from .snapshot import read_snapshot, write_snapshot
+
+if TYPE_CHECKING:
+    from .status_server import StatusServer
 
 logger = logging.getLogger(__name__)
 
+# Hash del árbol de comandos por destino (0 = global, si no ID del guild)
+COMMAND_SYNC_NAMESPACE = "command_sync"
 
-class UaintBot(commands.Bot):
-    """Cliente personalizado del bot con funcionalidades específicas"""
 
-    def __init__(self):
-        # Obtener configuración
-        self.settings = get_settings()
+class UaintBot(commands.AutoShardedBot):
+    """
+    Cliente personalizado del bot con funcionalidades específicas.
 
+    Siempre es un cliente con shards: en modo `single` usa un único shard,
+    en `auto` deja que Discord decida cuántos y en `range` conecta solo los
+    shards asignados a esta réplica.
+    """
+
+    def __init__(self, force_sync: bool = False):
         # Configurar intents
         intents = discord.Intents.default()
         intents.message_content = True  # Necesario para comandos de texto
@@ -29,6 +57,13 @@ class UaintBot(commands.Bot):
         intents.guild_messages = True  # Para mensajes en servidores
         intents.guild_reactions = True  # Para reacciones
 
+        # Qué se guarda en memoria (miembros, mensajes) según CACHE_PROFILE
+        self.cache_profile = CACHE_PROFILES.get(self.settings.CACHE_PROFILE, CACHE_PROFILES["full"])
+        self.cache_profile.apply(intents)
+
+        # Respuestas 429 (se cuentan en BotMetrics; el trace se fija al crear la sesión HTTP)
+        self.rate_limit_trace = RateLimitTrace()
+
         # Inicializar bot
         super().__init__(
             command_prefix=self._get_prefix,
@@ -36,17 +71,222 @@ class UaintBot(commands.Bot):
             description=self.settings.BOT_DESCRIPTION,
             help_command=None,  # Usaremos comando personalizado
             case_insensitive=True,
-            strip_after_prefix=True
+            strip_after_prefix=True,
+            tree_cls=InstrumentedCommandTree,
+            member_cache_flags=self.cache_profile.member_cache_flags(),
+            chunk_guilds_at_startup=self.cache_profile.chunk_guilds_at_startup,
+            max_messages=self.cache_profile.max_messages,
+            # Sin límite discord.py reintenta cualquier 429 por su cuenta y la
+            # cola de acciones nunca se entera de esperas largas
+            max_ratelimit_timeout=self.settings.RATE_LIMIT_MAX_WAIT,
+            http_trace=self.rate_limit_trace.config,
+            **self._shard_options()
         )
 
         # Estado del bot
         self.is_ready = False
+        self.force_sync = force_sync
+        self.draining = False
         self.start_time = discord.utils.utcnow()
 
+        # Instantánea de traspaso entre procesos (se escribe al recibir SIGTERM)
+        self.snapshot_path = Path(self.settings.DATA_DIR) / "handoff.snap"
+        self.snapshot: Dict[str, Any] = {}
+
         # Guild principal
         self.main_guild: Optional[discord.Guild] = None
 
-        logger.info(f"Inicializando {self.settings.BOT_NAME} v{self.settings.BOT_VERSION}")
+        # Estado persistente compartido por los cogs
+        self.state: StateBackend = create_state_backend(self.settings)
+
+        # Cola de acciones REST (crear/mover/eliminar canales)
+        self.actions = ActionQueue(max_concurrency=self.settings.ACTION_QUEUE_CONCURRENCY)
+
+        # Permisos compartidos por todos los cogs
+        self.permissions = PermissionService(self)
+        self.permissions.attach()
+
+        # Estado de los shards y servidor HTTP interno de salud
+        self.shard_monitor = ShardMonitor(self)
+        self.shard_monitor.attach()
+
+        # Métricas en proceso (exportadas en /metrics del servidor de estado)
+        self.metrics = BotMetrics(self)
+
+        # Miembros fuera de la caché del gateway, pedidos por REST y guardados con TTL
+        self.members = MemberCache(self)
+        self.members.attach()
+
+        # Historial compacto de mensajes para los logs de edición y borrado
+        self.message_cache = MessageCache(
+            self.settings.MESSAGE_CACHE_PER_CHANNEL,
+            int(self.settings.MESSAGE_CACHE_MAX_MB * 1024 * 1024)
+        )
+
+        # Difusión de mensajes a varios canales (inmediata o programada)
+        self.broadcasts = BroadcastService(self)
+
+        # Registro de moderación agrupado en MOD_LOG_CHANNEL_ID
+        self.modlog = ModLogSink(self)
+
+        # Rol automático y bienvenida de los miembros nuevos
+        self.welcome = JoinPipeline(self)
+
+        # Descubrimiento y carga (también diferida) de extensiones
+        self.extension_loader = ExtensionLoader(self)
+
+        # Vigilancia de bloqueos del event loop (se activa en setup_hook o por comando)
+        self.watchdog = LoopWatchdog(self, threshold=self.settings.LOOP_WATCHDOG_THRESHOLD)
+
+        # aiohttp.web solo se importa si el servidor está activado
+        self.status_server: Optional["StatusServer"] = None
+        if self.settings.METRICS_PORT:
+            from .status_server import StatusServer
+            self.status_server = StatusServer(self, self.settings.METRICS_HOST, self.settings.METRICS_PORT)
+
+        logger.info("Inicializando %s v%s", self.settings.BOT_NAME, self.settings.BOT_VERSION)
+        logger.info("🗃️ Perfil de caché: %s", self.cache_profile.name)
+
+    def _shard_options(self) -> Dict[str, Any]:
+        """Argumentos de shards según SHARD_MODE"""
+        settings = self.settings
+
+        if settings.SHARD_MODE == "auto":
+            return {"shard_count": settings.SHARD_COUNT}
+
+        if settings.SHARD_MODE == "range":
+            return {"shard_count": settings.SHARD_COUNT, "shard_ids": list(settings.SHARD_IDS)}
+
+        return {"shard_count": 1, "shard_ids": [0]}
+
+    @property
+    def settings(self) -> Settings:
+        """Instantánea de configuración vigente (cambia al recargar)"""
+        return get_settings()
+
+    def reload_settings(self) -> List[str]:
+        """
+        Recarga la configuración y la aplica sin reiniciar.
+
+        Devuelve los nombres de los valores que cambiaron. Si la configuración
+        nueva no es válida se lanza ValueError y se mantiene la anterior.
+        """
+        old = self.settings
+        new = reload_settings()
+        changed = old.changed_fields(new)
+
+        if not changed:
+            logger.info("🔄 Configuración recargada sin cambios")
+            return changed
+
+        if {"LOG_LEVEL", "LOG_CONFIG", "ENVIRONMENT"}.intersection(changed):
+            new.setup_logging()
+
+        self.permissions.reload()
+        self.message_cache.configure(new.MESSAGE_CACHE_PER_CHANNEL, int(new.MESSAGE_CACHE_MAX_MB * 1024 * 1024))
+
+        self.watchdog.threshold = new.LOOP_WATCHDOG_THRESHOLD
+        if new.LOOP_WATCHDOG_ENABLED and not old.LOOP_WATCHDOG_ENABLED:
+            self.watchdog.start()
+        elif old.LOOP_WATCHDOG_ENABLED and not new.LOOP_WATCHDOG_ENABLED:
+            asyncio.create_task(self.watchdog.stop())
+
+        logger.info("🔄 Configuración recargada: %s", ', '.join(changed))
+
+        pending_restart = [name for name in changed if name in Settings.RESTART_REQUIRED]
+        if pending_restart:
+            logger.warning("⚠️ Estos cambios requieren reiniciar el bot: %s", ', '.join(pending_restart))
+
+        self.dispatch("settings_reload", old, new)
+        return changed
+
+    def _handle_sighup(self) -> None:
+        """Recarga la configuración al recibir SIGHUP"""
+        logger.info("📨 SIGHUP recibido, recargando configuración...")
+        try:
+            self.reload_settings()
+        except ValueError as e:
+            logger.error("❌ Configuración nueva inválida, se mantiene la anterior: %s", e)
+
+    def _handle_sigterm(self) -> None:
+        """Empieza el vaciado ordenado al recibir SIGTERM"""
+        if self.draining:
+            return
+        logger.info("📨 SIGTERM recibido, vaciando antes de cerrar...")
+        asyncio.create_task(self.drain(), name="bot-drain")
+
+    async def drain(self) -> None:
+        """
+        Cierre ordenado: deja de aceptar trabajo nuevo, termina las acciones
+        REST pendientes y guarda el estado volátil de los cogs para que el
+        siguiente proceso lo retome.
+        """
+
+        self.draining = True
+        start = time.perf_counter()
+
+        # Un solo plazo para todas las etapas: la instantánea tiene que escribirse
+        # antes de que venza terminationGracePeriodSeconds
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings.DRAIN_TIMEOUT
+
+        # Roles, bienvenidas y registro de moderación pendientes pasan a la cola antes de vaciarla
+        self.welcome.flush()
+        await self.modlog.drain(max(deadline - loop.time(), 0))
+
+        if not await self.actions.drain(max(deadline - loop.time(), 0)):
+            logger.warning(
+                "⚠️ Quedaron %s acciones sin ejecutar tras %ss",
+                self.actions.depth + self.actions.in_flight, self.settings.DRAIN_TIMEOUT
+            )
+
+        sections: Dict[str, Any] = {}
+        for name, cog in self.cogs.items():
+            snapshot_state = getattr(cog, "snapshot_state", None)
+            if snapshot_state is None:
+                continue
+            try:
+                sections[name] = snapshot_state()
+            except Exception as e:
+                logger.error("❌ Error guardando el estado de %s: %s", name, e)
+
+        if sections:
+            try:
+                size = write_snapshot(self.snapshot_path, sections)
+            except (OSError, ValueError) as e:
+                logger.error("❌ No se pudo escribir la instantánea: %s", e)
+            else:
+                logger.info(
+                    "💾 Instantánea de %s cogs guardada (%s bytes) en %.0fms",
+                    len(sections), size, (time.perf_counter() - start) * 1000
+                )
+
+        await self.close()
+
+    def take_snapshot(self, section: str) -> Any:
+        """Devuelve (una sola vez) el estado que guardó un cog en el proceso anterior"""
+        return self.snapshot.pop(section, None)
+
+    async def _run_event(self, coro, event_name: str, *args, **kwargs) -> None:
+        """Ejecuta un listener midiendo su duración por evento y cog"""
+        start = time.perf_counter()
+        try:
+            await super()._run_event(coro, event_name, *args, **kwargs)
+        finally:
+            self.metrics.observe_event(event_name, coro, time.perf_counter() - start)
+
+    # Al cargar o descargar un cog el watchdog rehace su mapa de código aquí,
+    # en el loop, y su hilo solo lo lee durante un bloqueo (los listeners de
+    # los servicios se registran en __init__, antes de activarlo)
+
+    async def add_cog(self, cog: commands.Cog, /, **kwargs: Any) -> None:
+        await super().add_cog(cog, **kwargs)
+        self.watchdog.refresh_targets()
+
+    async def remove_cog(self, name: str, /, **kwargs: Any) -> Optional[commands.Cog]:
+        cog = await super().remove_cog(name, **kwargs)
+        self.watchdog.refresh_targets()
+        return cog
 
     async def _get_prefix(self, bot, message: discord.Message) -> List[str]:
         """Determina el prefijo de comandos"""
@@ -62,6 +302,7 @@ class UaintBot(commands.Bot):
 
     async def setup_hook(self) -> None:
         """Se ejecuta durante la configuración inicial del bot"""
+        timeline.mark("login")
         logger.info("Configurando bot...")
 
         # Validar configuración
@@ -70,62 +311,115 @@ class UaintBot(commands.Bot):
         except ValueError as e:
             raise ConfigurationError(str(e))
 
-        # Configurar logging
-        self.settings.setup_logging()
+        # Abrir almacenamiento de estado
+        await self.state.open()
 
-        logger.info("Bot configurado correctamente")
+        # Estado volátil que dejó el proceso anterior (si salió con SIGTERM)
+        self.snapshot = read_snapshot(self.snapshot_path)
+
+        # Iniciar cola de acciones REST y los envíos programados
+        self.actions.start()
+        await self.broadcasts.start()
+        self.modlog.start()
+        self.welcome.start()
+
+        # Owners del bot para el servicio de permisos
+        await self.permissions.load_owners()
 
-    async def sync_commands(self) -> None:
-        """Sincroniza los comandos slash con Discord"""
+        # Métricas y servidor HTTP interno (sondas de Kubernetes y Prometheus)
+        self.metrics.start()
+        if self.status_server:
+            await self.status_server.start()
+
+        if self.settings.LOOP_WATCHDOG_ENABLED:
+            self.watchdog.start()
+
+        # Recargar configuración con SIGHUP (no disponible en Windows)
+        try:
+            self.loop.add_signal_handler(signal.SIGHUP, self._handle_sighup)
+        except (AttributeError, NotImplementedError, RuntimeError):
+            logger.debug("SIGHUP no disponible, la recarga solo se puede hacer por comando")
+
+        # Cierre ordenado con SIGTERM (actualizaciones de Kubernetes, systemd, docker stop)
         try:
-            logger.info("🔄 Sincronizando comandos...")
+            self.loop.add_signal_handler(signal.SIGTERM, self._handle_sigterm)
+        except (AttributeError, NotImplementedError, RuntimeError):
+            logger.debug("SIGTERM no disponible, no habrá instantánea de traspaso")
 
-            # Ver comandos disponibles
-            tree_commands = self.tree.get_commands()
-            logger.info(f"📋 Comandos disponibles: {[cmd.name for cmd in tree_commands]}")
+        timeline.mark("setup")
+        logger.info("Bot configurado correctamente")
 
-            # En desarrollo: sync para guild específico para rapidez
-            # En producción: sync global para alcance completo
-            if self.settings.IS_DEVELOPMENT and self.settings.GUILD_ID:
-                # Copiar comandos globales al guild específico
-                guild = discord.Object(id=self.settings.GUILD_ID)
+    def command_fingerprint(self, guild: Optional[discord.abc.Snowflake] = None) -> str:
+        """
+        Hash canónico del árbol de comandos que se enviaría a Discord.
+
+        Los comandos de extensiones diferidas sin cargar se representan por el
+        hash de su código fuente, así no hace falta importarlas para saber si
+        algo cambió.
+        """
+
+        loader = self.extension_loader
+        payload = [
+            command.to_dict(self.tree)
+            for command in self.tree.get_commands(guild=guild)
+            if command.name not in loader.lazy_commands
+        ]
+        payload.sort(key=lambda command: (command.get("type", 1), command["name"]))
+
+        digest = hashlib.sha256()
+        digest.update(json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode())
+        for name in sorted(set(loader.lazy_commands.values())):
+            digest.update(name.encode())
+            digest.update(loader.source_hash(name).encode())
+        return digest.hexdigest()
+
+    async def sync_commands(self, force: bool = False) -> bool:
+        """
+        Sincroniza los comandos slash con Discord solo si cambiaron.
+
+        El hash del árbol se guarda en el estado persistente por destino (guild
+        de desarrollo o global); si coincide con el de la última sincronización
+        no se llama a `tree.sync`, que tiene un rate limit muy estricto.
+        Devuelve True si se sincronizó.
+        """
+
+        # En desarrollo: sync para guild específico para rapidez
+        # En producción: sync global para alcance completo
+        guild: Optional[discord.Object] = None
+        if self.settings.IS_DEVELOPMENT and self.settings.GUILD_ID:
+            guild = discord.Object(id=self.settings.GUILD_ID)
+            self.tree.copy_global_to(guild=guild)
+
+        key = guild.id if guild else 0
+        scope = f"guild {guild.id}" if guild else "global"
 
-                # Limpiar comandos del guild primero
-                self.tree.clear_commands(guild=guild)
+        try:
+            fingerprint = self.command_fingerprint(guild)
+            stored = (await self.state.load(COMMAND_SYNC_NAMESPACE)).get(key, {})
 
-                # Copiar cada comando global al guild
-                for cmd in tree_commands:
-                    self.tree.add_command(cmd, guild=guild)
-                    logger.debug(f"📋 Comando {cmd.name} copiado al guild")
+            if not force and stored.get("hash") == fingerprint:
+                logger.info("✅ Comandos sin cambios (%s), no se sincronizan", scope)
+                return False
 
-                # Sincronizar el guild
-                synced = await self.tree.sync(guild=guild)
-                logger.info(f"✅ Sincronizados {len(synced)} comandos en guild {self.settings.GUILD_ID} (desarrollo)")
-                logger.info("⚡ Comandos disponibles inmediatamente en el servidor de desarrollo")
+            logger.info("🔄 Sincronizando comandos (%s)%s...", scope, " [forzado]" if force else "")
 
-            else:
-                # Sincronización global para producción
-                synced = await self.tree.sync()
-                logger.info(f"✅ Sincronizados {len(synced)} comandos globalmente")
-                logger.info("⏰ Los comandos pueden tardar hasta 1 hora en aparecer")
-
-            # Mostrar comandos sincronizados
-            if synced:
-                names = []
-                for cmd in synced:
-                    if isinstance(cmd, dict):
-                        names.append(cmd.get('name', 'unknown'))
-                    else:
-                        names.append(getattr(cmd, 'name', str(cmd)))
-                logger.info(f"🎯 Comandos sincronizados: {names}")
-            else:
-                logger.warning("⚠️ No se sincronizaron comandos")
+            # El árbol enviado debe incluir los comandos de las extensiones diferidas
+            await self.extension_loader.load_pending()
+            if guild:
+                self.tree.copy_global_to(guild=guild)
 
-        except Exception as e:
-            logger.error(f"❌ Error sincronizando comandos: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            synced = await self.tree.sync(guild=guild)
 
+        except (discord.HTTPException, DatabaseError) as e:
+            logger.error("❌ Error sincronizando comandos: %s", e)
+            return False
+
+        self.state.put(COMMAND_SYNC_NAMESPACE, key, {"hash": fingerprint, "synced_at": time.time()})
+
+        logger.info("✅ Sincronizados %s comandos (%s): %s", len(synced), scope, [cmd.name for cmd in synced])
+        if guild is None:
+            logger.info("⏰ Los comandos pueden tardar hasta 1 hora en aparecer")
+        return True
 
     async def on_ready(self) -> None:
         """Se ejecuta cuando el bot está listo"""
@@ -133,33 +427,28 @@ class UaintBot(commands.Bot):
             return  # Evitar múltiples ejecuciones
 
         self.is_ready = True
+        timeline.mark("READY")
 
         # Obtener guild principal
         if self.settings.GUILD_ID:
             self.main_guild = self.get_guild(self.settings.GUILD_ID)
             if not self.main_guild:
-                logger.warning(f"No se pudo encontrar el guild {self.settings.GUILD_ID}")
+                logger.warning("No se pudo encontrar el guild %s", self.settings.GUILD_ID)
 
         # Información del bot
-        logger.info(f"🤖 {self.user.name} está listo!")
-        logger.info(f"📊 Conectado a {len(self.guilds)} servidor(es)")
-        logger.info(f"👥 Sirviendo a {len(self.users)} usuario(s)")
+        logger.info("🤖 %s está listo!", self.user.name)
+        logger.info("🧩 Shards: %s de %s (modo %s)", sorted(self.shards), self.shard_count, self.settings.SHARD_MODE)
+        logger.info("📊 Conectado a %s servidor(es)", len(self.guilds))
+        logger.info("👥 Sirviendo a %s usuario(s)", len(self.users))
 
         if self.main_guild:
-            logger.info(f"🏠 Guild principal: {self.main_guild.name} ({self.main_guild.member_count} miembros)")
-
-        # SINCRONIZAR COMANDOS AQUÍ (cuando el bot ya está listo)
-        if self.settings.IS_DEVELOPMENT:
-            logger.info("🔄 Sincronizando comandos slash...")
-
-            # Cambiar temporalmente a DEBUG para ver más detalles
-            original_level = logging.getLogger().level
-            logging.getLogger().setLevel(logging.DEBUG)
+            logger.info("🏠 Guild principal: %s (%s miembros)", self.main_guild.name, self.main_guild.member_count)
 
-            await self.sync_commands()
-
-            # Restaurar nivel original
-            logging.getLogger().setLevel(original_level)
+        # Sincronizar comandos si cambiaron (solo el proceso con el shard 0,
+        # para que las réplicas no repitan la misma llamada)
+        if 0 in self.shards or self.force_sync:
+            await self.sync_commands(force=self.force_sync)
+            timeline.mark("sync")
 
         # Establecer estado del bot
         await self.change_presence(
@@ -171,10 +460,11 @@ class UaintBot(commands.Bot):
         )
 
         logger.info("✅ Bot inicializado completamente")
+        timeline.finish()
 
     async def on_error(self, event_method: str, *args, **kwargs) -> None:
         """Maneja errores globales del bot"""
-        logger.exception(f"Error en evento {event_method}")
+        logger.exception("Error en evento %s", event_method)
 
     async def on_command_error(self, ctx: commands.Context, error: commands.CommandError) -> None:
         """Maneja errores de comandos"""
@@ -216,11 +506,11 @@ class UaintBot(commands.Bot):
                 await ctx.reply(message, delete_after=10)
 
                 if should_log_error(original):
-                    logger.error(f"Error de Discord en comando {ctx.command}: {original}")
+                    logger.error("Error de Discord en comando %s: %s", ctx.command, original)
                 return
 
         # Error genérico
-        logger.exception(f"Error no manejado en comando {ctx.command}")
+        logger.exception("Error no manejado en comando %s", ctx.command)
         await ctx.reply(
             "❌ Ocurrió un error inesperado. Por favor, inténtalo más tarde.",
             delete_after=10
@@ -228,21 +518,30 @@ class UaintBot(commands.Bot):
 
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """Se ejecuta cuando el bot se une a un servidor"""
-        logger.info(f"🎉 Unido al servidor: {guild.name} ({guild.id}) - {guild.member_count} miembros")
+        logger.info("🎉 Unido al servidor: %s (%s) - %s miembros", guild.name, guild.id, guild.member_count)
 
     async def on_guild_remove(self, guild: discord.Guild) -> None:
         """Se ejecuta cuando el bot es removido de un servidor"""
-        logger.info(f"👋 Removido del servidor: {guild.name} ({guild.id})")
+        logger.info("👋 Removido del servidor: %s (%s)", guild.name, guild.id)
 
     async def on_member_join(self, member: discord.Member) -> None:
         """Se ejecuta cuando un miembro se une al servidor"""
         if member.guild == self.main_guild:
-            logger.info(f"👋 Nuevo miembro en {member.guild.name}: {member.name}")
+            logger.info("👋 Nuevo miembro en %s: %s", member.guild.name, member.name)
 
     async def close(self) -> None:
         """Cierra el bot de forma limpia"""
         logger.info("🔄 Cerrando bot...")
         await super().close()
+        if self.status_server:
+            await self.status_server.stop()
+        await self.watchdog.stop()
+        await self.metrics.stop()
+        await self.broadcasts.stop()
+        await self.modlog.stop()
+        await self.welcome.stop()
+        await self.actions.stop()
+        await self.state.close()
         logger.info("✅ Bot cerrado correctamente")
 
     # ====================================
@@ -267,21 +566,8 @@ class UaintBot(commands.Bot):
 
     def is_owner_or_admin(self, user: discord.Member) -> bool:
         """Verifica si el usuario es owner o administrador"""
-        if user.id in self.owner_ids:
-            return True
-
-        if user.guild_permissions.administrator:
-            return True
-
-        # Verificar roles de admin configurados
-        admin_roles = self.settings.ADMIN_ROLE_IDS
-        return any(role.id in admin_roles for role in user.roles)
+        return self.permissions.is_admin(user)
 
     def is_moderator(self, user: discord.Member) -> bool:
         """Verifica si el usuario es moderador"""
-        if self.is_owner_or_admin(user):
-            return True
-
-        # Verificar roles de moderador configurados
-        mod_roles = self.settings.MOD_ROLE_IDS
-        return any(role.id in mod_roles for role in user.roles)
\ No newline at end of file
+        return self.permissions.is_moderator(user)
\ No newline at end of file
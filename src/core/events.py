@@ -8,6 +8,8 @@ import discord
 from discord.ext import commands
 from typing import TYPE_CHECKING
 
+from .cache import MESSAGE_CONTENT_LIMIT
+
 if TYPE_CHECKING:
     from .client import UaintBot
 
@@ -28,44 +30,85 @@ class BotEvents(commands.Cog):
         if message.author.bot:
             return
 
+        # Historial para los logs de edición y borrado
+        if message.guild:
+            self.bot.message_cache.add(message)
+
         # Log de mensajes en el guild principal (solo en desarrollo)
         if (self.bot.settings.IS_DEVELOPMENT and
                 message.guild == self.bot.main_guild):
             logger.debug(
-                f"Mensaje en #{message.channel.name}: "
-                f"{message.author.name}: {message.content[:50]}..."
+                "Mensaje en #%s: %s: %s...", message.channel.name, message.author.name, message.content[:50]
             )
 
     @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
-        """Se ejecuta cuando se edita un mensaje"""
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """Se ejecuta cuando se edita un mensaje (esté o no en la caché de discord.py)"""
+
+        after = payload.message
 
         # Ignorar mensajes del bot
-        if before.author.bot:
+        if after.author.bot:
+            return
+
+        # Sin el texto anterior no se sabe si cambió (p.ej. solo se añadió la vista previa de un enlace)
+        before = self.bot.message_cache.update(payload.channel_id, payload.message_id, after.content)
+        if before is None:
             return
 
         # Re-procesar comandos si el mensaje editado ahora es un comando
-        if before.content != after.content:
+        if before != after.content[:MESSAGE_CONTENT_LIMIT]:
             await self.bot.process_commands(after)
 
     @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message) -> None:
-        """Se ejecuta cuando se elimina un mensaje"""
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """Se ejecuta cuando se elimina un mensaje (esté o no en la caché de discord.py)"""
 
-        # Solo loggear en el guild principal
-        if message.guild != self.bot.main_guild:
+        # Los mensajes del bot no se guardan en el historial
+        message = self.bot.message_cache.pop(payload.channel_id, payload.message_id)
+        if message is None:
             return
 
-        # Ignorar mensajes del bot
-        if message.author.bot:
+        # Solo loggear en el guild principal
+        if not self.bot.main_guild or payload.guild_id != self.bot.main_guild.id:
             return
 
-        # Log básico (en el futuro esto irá a un sistema de moderación)
         if len(message.content) > 0:
             logger.info(
-                f"Mensaje eliminado en #{message.channel.name} por {message.author.name}: "
-                f"{message.content[:100]}..."
+                "Mensaje eliminado en #%s por %s: %s...",
+                self._channel_name(payload.channel_id), self._user_name(message.author_id), message.content[:100]
             )
+            self.bot.modlog.record(
+                "message_delete",
+                f"<#{payload.channel_id}> <@{message.author_id}>: {discord.utils.escape_markdown(message.content[:100])}"
+            )
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """Se ejecuta cuando se eliminan mensajes en bloque (purgas)"""
+
+        messages = self.bot.message_cache.pop_many(payload.channel_id, payload.message_ids)
+
+        # Solo loggear en el guild principal
+        if not self.bot.main_guild or payload.guild_id != self.bot.main_guild.id:
+            return
+
+        logger.info(
+            "🧹 %s mensajes eliminados en #%s (%s en el historial)",
+            len(payload.message_ids), self._channel_name(payload.channel_id), len(messages)
+        )
+        self.bot.modlog.record(
+            "message_delete", f"🧹 {len(payload.message_ids)} mensajes eliminados en <#{payload.channel_id}>"
+        )
+
+    def _channel_name(self, channel_id: int) -> str:
+        channel = self.bot.get_channel(channel_id)
+        return channel.name if channel else str(channel_id)
+
+    def _user_name(self, user_id: int) -> str:
+        # Con los perfiles de caché voice/minimal el autor puede no estar en memoria
+        user = self.bot.get_user(user_id)
+        return user.name if user else str(user_id)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
@@ -75,50 +118,68 @@ class BotEvents(commands.Cog):
         if member.guild != self.bot.main_guild:
             return
 
-        logger.info(f"👋 {member.name} se unió a {member.guild.name}")
+        logger.info("👋 %s se unió a %s", member.name, member.guild.name)
+        created = discord.utils.format_dt(member.created_at, "R")
+        self.bot.modlog.record("member_join", f"{member.mention} ({member.name}), cuenta creada {created}")
 
-        # TODO: En futuras fases aquí se implementará:
-        # - Mensaje de bienvenida
-        # - Asignación de roles automáticos
-        # - Log en canal de moderación
+        # Rol automático y bienvenida (en modo resumen durante una oleada)
+        self.bot.welcome.member_joined(member)
 
     @commands.Cog.listener()
-    async def on_member_remove(self, member: discord.Member) -> None:
-        """Se ejecuta cuando un miembro deja el servidor"""
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        """Se ejecuta cuando un miembro deja el servidor (esté o no en caché)"""
 
         # Solo procesar el guild principal
-        if member.guild != self.bot.main_guild:
+        if not self.bot.main_guild or payload.guild_id != self.bot.main_guild.id:
             return
 
-        logger.info(f"👋 {member.name} dejó {member.guild.name}")
+        logger.info("👋 %s dejó %s", payload.user.name, self.bot.main_guild.name)
+        self.bot.modlog.record("member_remove", f"{payload.user.mention} ({payload.user.name})")
+        self.bot.welcome.member_left(payload.guild_id, payload.user.id)
 
         # TODO: En futuras fases aquí se implementará:
         # - Mensaje de despedida
-        # - Log en canal de moderación
 
     @commands.Cog.listener()
     async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
         """Se ejecuta cuando se crea un canal"""
         if channel.guild == self.bot.main_guild:
-            logger.info(f"📝 Canal creado: #{channel.name} en {channel.guild.name}")
+            logger.info("📝 Canal creado: #%s en %s", channel.name, channel.guild.name)
+            if not self._managed_by_bot(channel):
+                self.bot.modlog.record("channel", f"Creado {channel.mention}")
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
         """Se ejecuta cuando se elimina un canal"""
+        self.bot.message_cache.drop_channel(channel.id)
         if channel.guild == self.bot.main_guild:
-            logger.info(f"🗑️ Canal eliminado: #{channel.name} en {channel.guild.name}")
+            logger.info("🗑️ Canal eliminado: #%s en %s", channel.name, channel.guild.name)
+            if not self._managed_by_bot(channel):
+                self.bot.modlog.record("channel", f"Eliminado #{channel.name}")
+
+    def _managed_by_bot(self, channel: discord.abc.GuildChannel) -> bool:
+        """Canales que crea y borra el propio bot (canales dinámicos y reserva): no van al registro"""
+
+        dynamic_voice = self.bot.get_cog("Canales Dinámicos")
+        if dynamic_voice is None or not isinstance(channel, discord.VoiceChannel):
+            return False
+
+        excluded = dynamic_voice.view_state(channel.guild).triggers.excluded_prefixes
+        return channel.name.casefold().startswith(excluded)
 
     @commands.Cog.listener()
     async def on_guild_role_create(self, role: discord.Role) -> None:
         """Se ejecuta cuando se crea un rol"""
         if role.guild == self.bot.main_guild:
-            logger.info(f"🎭 Rol creado: @{role.name} en {role.guild.name}")
+            logger.info("🎭 Rol creado: @%s en %s", role.name, role.guild.name)
+            self.bot.modlog.record("role", f"Creado {role.mention}")
 
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role: discord.Role) -> None:
         """Se ejecuta cuando se elimina un rol"""
         if role.guild == self.bot.main_guild:
-            logger.info(f"🗑️ Rol eliminado: @{role.name} en {role.guild.name}")
+            logger.info("🗑️ Rol eliminado: @%s en %s", role.name, role.guild.name)
+            self.bot.modlog.record("role", f"Eliminado @{role.name}")
 
     @commands.Cog.listener()
     async def on_voice_state_update(
@@ -135,15 +196,15 @@ class BotEvents(commands.Cog):
 
         # Entró a un canal de voz
         if before.channel is None and after.channel is not None:
-            logger.debug(f"🔊 {member.name} se conectó a {after.channel.name}")
+            logger.debug("🔊 %s se conectó a %s", member.name, after.channel.name)
 
         # Salió de un canal de voz
         elif before.channel is not None and after.channel is None:
-            logger.debug(f"🔇 {member.name} se desconectó de {before.channel.name}")
+            logger.debug("🔇 %s se desconectó de %s", member.name, before.channel.name)
 
         # Cambió de canal
         elif before.channel != after.channel and after.channel is not None:
-            logger.debug(f"🔄 {member.name} se movió de {before.channel.name} a {after.channel.name}")
+            logger.debug("🔄 %s se movió de %s a %s", member.name, before.channel.name, after.channel.name)
 
     @commands.Cog.listener()
     async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User) -> None:
@@ -180,7 +241,7 @@ class BotEvents(commands.Cog):
     async def on_slash_command_error(self, interaction: discord.Interaction, error: Exception) -> None:
         """Maneja errores de comandos slash"""
 
-        logger.exception(f"Error en comando slash: {error}")
+        logger.exception("Error en comando slash: %s", error)
 
         # Responder al usuario si la interacción aún no ha sido respondida
         if not interaction.response.is_done():
@@ -0,0 +1,309 @@
+"""
+Descubrimiento y carga de extensiones (cogs)
+Informatica UAIn'T Community Bot
+"""
+
+import ast
+import time
+import hashlib
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, TYPE_CHECKING
+
+from discord.ext import commands
+
+from .exceptions import ConfigurationError
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+# Directorio src/ (raíz de los nombres de módulo)
+SOURCE_ROOT = Path(__file__).resolve().parents[1]
+
+# Extensiones fuera de cogs/ que siempre se cargan
+CORE_EXTENSIONS = ("core.events",)
+
+
+class ExtensionSpec(NamedTuple):
+    """
+    Metadatos de una extensión leídos del código sin importarla.
+
+    Un módulo puede declarar a nivel superior:
+        EXTENSION_DEPENDS = ("core.events",)  # se carga después de estas
+        EXTENSION_LAZY = True                 # se importa al usar uno de sus comandos
+    """
+
+    name: str
+    depends: Tuple[str, ...]
+    lazy: bool
+    commands: Tuple[str, ...]  # comandos slash de primer nivel (para la carga diferida)
+
+
+def _literal(node: ast.AST, default):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return default
+
+
+def _keyword(call: ast.Call, name: str) -> Optional[str]:
+    for keyword in call.keywords:
+        if keyword.arg == name and isinstance(keyword.value, ast.Constant):
+            return keyword.value.value
+    return None
+
+
+def _is_app_commands_call(node: ast.AST, *attrs: str) -> bool:
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in attrs
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "app_commands"
+    )
+
+
+def _is_listener(decorator: ast.AST) -> bool:
+    """`@commands.Cog.listener()` o `@tasks.loop(...)`"""
+    func = decorator.func if isinstance(decorator, ast.Call) else decorator
+    return isinstance(func, ast.Attribute) and func.attr in ("listener", "loop")
+
+
+def parse_extension(path: Path, name: str) -> Optional[ExtensionSpec]:
+    """Lee los metadatos de una extensión; None si el módulo no tiene setup()"""
+
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    has_setup = False
+    has_listeners = False
+    depends: Tuple[str, ...] = ()
+    lazy = False
+    command_names: List[str] = []
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "setup":
+            has_setup = True
+
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            target = node.targets[0].id
+            if target == "EXTENSION_DEPENDS":
+                depends = tuple(_literal(node.value, ()))
+            elif target == "EXTENSION_LAZY":
+                lazy = bool(_literal(node.value, False))
+
+        elif isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, ast.Assign) and _is_app_commands_call(item.value, "Group"):
+                    group_name = _keyword(item.value, "name")
+                    if group_name:
+                        command_names.append(group_name)
+
+                elif isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    for decorator in item.decorator_list:
+                        if _is_app_commands_call(decorator, "command", "context_menu"):
+                            command_names.append(_keyword(decorator, "name") or item.name)
+                        elif _is_listener(decorator):
+                            has_listeners = True
+
+    if not has_setup:
+        return None
+
+    if lazy and (has_listeners or not command_names):
+        logger.warning(
+            "⚠️ %s no puede cargarse de forma diferida (tiene listeners o no tiene comandos); se carga al iniciar",
+            name
+        )
+        lazy = False
+
+    return ExtensionSpec(name, depends, lazy, tuple(command_names))
+
+
+def discover_extensions(root: Path = SOURCE_ROOT) -> List[ExtensionSpec]:
+    """Extensiones principales más todos los módulos con setup() bajo cogs/"""
+
+    paths = [(root.joinpath(*name.split(".")).with_suffix(".py"), name) for name in CORE_EXTENSIONS]
+
+    for path in sorted((root / "cogs").rglob("*.py")):
+        if path.name.startswith("_") or "__pycache__" in path.parts:
+            continue
+        paths.append((path, ".".join(path.relative_to(root).with_suffix("").parts)))
+
+    specs = []
+    for path, name in paths:
+        spec = parse_extension(path, name)
+        if spec is not None:
+            specs.append(spec)
+    return specs
+
+
+def load_levels(specs: List[ExtensionSpec]) -> List[List[ExtensionSpec]]:
+    """
+    Agrupa las extensiones en niveles según sus dependencias.
+
+    Las extensiones de un mismo nivel no dependen entre sí y pueden cargarse a
+    la vez. Una dependencia diferida se carga al iniciar junto a quien la usa.
+    """
+
+    by_name = {spec.name: spec for spec in specs}
+
+    for spec in specs:
+        unknown = [dependency for dependency in spec.depends if dependency not in by_name]
+        if unknown:
+            raise ConfigurationError(f"{spec.name} depende de extensiones inexistentes: {', '.join(unknown)}")
+
+    # Las dependencias de extensiones al iniciar no pueden ser diferidas
+    eager: Set[str] = set()
+    pending = [spec.name for spec in specs if not spec.lazy]
+    while pending:
+        name = pending.pop()
+        if name not in eager:
+            eager.add(name)
+            pending.extend(by_name[name].depends)
+
+    remaining = {name: set(by_name[name].depends) for name in eager}
+    levels: List[List[ExtensionSpec]] = []
+    while remaining:
+        ready = sorted(name for name, depends in remaining.items() if not depends)
+        if not ready:
+            raise ConfigurationError(f"Dependencias circulares entre extensiones: {', '.join(sorted(remaining))}")
+
+        levels.append([by_name[name] for name in ready])
+        for name in ready:
+            del remaining[name]
+        for depends in remaining.values():
+            depends.difference_update(ready)
+
+    return levels
+
+
+class ExtensionLoader:
+    """
+    Carga las extensiones descubiertas midiendo cuánto tarda cada una.
+
+    Las extensiones diferidas no se importan al iniciar: el árbol de comandos
+    las carga con la primera interacción de uno de sus comandos y la
+    sincronización de comandos las carga todas antes de enviar el árbol.
+    """
+
+    def __init__(self, bot: "UaintBot"):
+        self.bot = bot
+        self.specs: Dict[str, ExtensionSpec] = {}
+        self.lazy_commands: Dict[str, str] = {}  # comando -> extensión diferida
+        self.loaded: List[str] = []
+        self.timings: Dict[str, float] = {}
+        self._lazy_lock = asyncio.Lock()
+
+    def discover(self) -> List[List[ExtensionSpec]]:
+        specs = discover_extensions()
+        self.specs = {spec.name: spec for spec in specs}
+
+        levels = load_levels(specs)
+        eager = {spec.name for level in levels for spec in level}
+
+        self.lazy_commands = {
+            command: spec.name
+            for spec in specs if spec.name not in eager
+            for command in spec.commands
+        }
+        return levels
+
+    def source_hash(self, name: str) -> str:
+        """Hash del código fuente de una extensión (sin importarla)"""
+        path = SOURCE_ROOT.joinpath(*name.split(".")).with_suffix(".py")
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    async def _load(self, name: str) -> float:
+        start = time.perf_counter()
+        await self.bot.load_extension(name)
+        elapsed = time.perf_counter() - start
+
+        self.timings[name] = elapsed
+        self.loaded.append(name)
+        return elapsed
+
+    async def load_all(self, strict: bool = True) -> None:
+        """Carga por niveles de dependencias; dentro de cada nivel, en paralelo"""
+
+        start = time.perf_counter()
+        levels = self.discover()
+        failed: Set[str] = set()
+
+        logger.info(
+            "Cargando %s extensiones (%s diferidas)...",
+            sum(len(level) for level in levels), len(set(self.lazy_commands.values()))
+        )
+
+        for level in levels:
+            runnable = []
+            for spec in level:
+                missing = failed.intersection(spec.depends)
+                if missing:
+                    logger.error("❌ %s omitida: falló su dependencia %s", spec.name, ", ".join(sorted(missing)))
+                    failed.add(spec.name)
+                else:
+                    runnable.append(spec)
+
+            results = await asyncio.gather(
+                *(self._load(spec.name) for spec in runnable),
+                return_exceptions=True
+            )
+
+            for spec, result in zip(runnable, results):
+                if isinstance(result, BaseException):
+                    failed.add(spec.name)
+                    logger.error("❌ Error cargando extensión %s: %s", spec.name, result)
+                    if strict:
+                        raise result
+                else:
+                    logger.info("✅ Cargada extensión: %s (%.1fms)", spec.name, result * 1000)
+
+        for name in sorted(set(self.lazy_commands.values())):
+            logger.info("💤 Extensión diferida: %s (/%s)", name, ", /".join(self.specs[name].commands))
+
+        logger.info(
+            "🎉 Cargadas %s extensiones en %.1fms",
+            len(self.loaded), (time.perf_counter() - start) * 1000
+        )
+
+    async def _load_lazy(self, name: str) -> float:
+        """Carga una extensión diferida y las dependencias que falten"""
+
+        elapsed = 0.0
+        for dependency in self.specs[name].depends:
+            if dependency not in self.bot.extensions:
+                elapsed += await self._load_lazy(dependency)
+
+        if name not in self.bot.extensions:
+            elapsed += await self._load(name)
+        return elapsed
+
+    async def load_for_command(self, command_name: Optional[str]) -> None:
+        """Carga la extensión diferida que define un comando (si hace falta)"""
+
+        name = self.lazy_commands.get(command_name)
+        if name is None or name in self.bot.extensions:
+            return
+
+        async with self._lazy_lock:
+            if name in self.bot.extensions:
+                return
+            try:
+                elapsed = await self._load_lazy(name)
+            except commands.ExtensionError as e:
+                logger.error("❌ Error cargando extensión diferida %s: %s", name, e)
+                return
+
+        logger.info("💤 Extensión diferida cargada por /%s: %s (%.1fms)", command_name, name, elapsed * 1000)
+
+    async def load_pending(self) -> None:
+        """Carga todas las extensiones diferidas que aún no se usaron"""
+
+        async with self._lazy_lock:
+            for name in sorted(set(self.lazy_commands.values())):
+                try:
+                    await self._load_lazy(name)
+                except commands.ExtensionError as e:
+                    logger.error("❌ Error cargando extensión diferida %s: %s", name, e)
@@ -0,0 +1,467 @@
+"""
+Métricas en proceso con formato de exposición de Prometheus
+Informatica UAIn'T Community Bot
+"""
+
+import math
+import time
+import asyncio
+import logging
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import aiohttp
+import discord
+from discord import app_commands
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[Labels, float]
+Collector = Callable[[], Iterable[Sample]]
+
+# Buckets de latencia (segundos): de 100µs a 10s
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Metric:
+    """Base de las métricas: nombre, ayuda y nombres de etiquetas"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """
+    Contador monótono.
+
+    Sin locks: el bot actualiza las métricas desde un único hilo (el event
+    loop), así que un incremento es una búsqueda en un dict y una suma.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 collect: Optional[Collector] = None):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+        self._collect = collect
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def _render_samples(self) -> List[str]:
+        samples = self._collect() if self._collect else self._values.items()
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in samples]
+
+
+class Gauge(Metric):
+    """Valor instantáneo; con `collect` se calcula solo al exportar"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 collect: Optional[Collector] = None):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+        self._collect = collect
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def _render_samples(self) -> List[str]:
+        samples = self._collect() if self._collect else self._values.items()
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in samples]
+
+
+class HistogramSeries:
+    """Conteos por bucket (no acumulados) de una combinación de etiquetas"""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """Histograma de buckets fijos; observar es una bisección y tres sumas"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Labels, HistogramSeries] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = HistogramSeries(len(self.buckets))
+        series.counts[bisect_left(self.buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series.counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(series.sum)}")
+            lines.append(f"{self.name}_count{label_str} {series.count}")
+        return lines
+
+
+class LatencyHistogram:
+    """
+    Histograma de latencias estilo HDR con tamaño fijo.
+
+    Los valores se guardan en microsegundos en buckets log-lineales: exactos
+    por debajo de 128µs y, a partir de ahí, 64 sub-buckets por potencia de dos
+    (error relativo < 1,6%). Cubre hasta ~134s en 1408 contadores, así que la
+    memoria no crece con el número de muestras y registrar es O(1).
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)  # 64
+    HIGHEST_VALUE = (1 << 27) - 1  # µs
+    SIZE = (27 - SUB_BUCKET_BITS + 2) * SUB_BUCKET_HALF
+
+    def __init__(self):
+        self.counts = [0] * self.SIZE
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        shift = micros.bit_length() - cls.SUB_BUCKET_BITS
+        if shift <= 0:
+            return micros
+        return shift * cls.SUB_BUCKET_HALF + (micros >> shift)
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> int:
+        """Mayor valor (µs) que cae en el bucket"""
+        if index < 2 * cls.SUB_BUCKET_HALF:
+            return index
+        shift = index // cls.SUB_BUCKET_HALF - 1
+        mantissa = index - shift * cls.SUB_BUCKET_HALF
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        micros = int(seconds * 1_000_000)
+        self.counts[self._index(min(max(micros, 0), self.HIGHEST_VALUE))] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        """Valor (segundos) por debajo del cual queda `percent`% de las muestras"""
+        if not self.count:
+            return 0.0
+
+        target = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._upper_bound(index) / 1_000_000, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsRegistry:
+    """Conjunto de métricas exportadas en `/metrics`"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        self._metrics.pop(name, None)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                collect: Optional[Collector] = None) -> Counter:
+        return self.register(Counter(name, documentation, labelnames, collect))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              collect: Optional[Collector] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, collect))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                logger.error("❌ Error exportando la métrica %s: %s", metric.name, e)
+        return "\n".join(lines) + "\n"
+
+
+class RateLimitTrace:
+    """
+    Cuenta las respuestas 429 de la API REST leyendo sus cabeceras.
+
+    Se pasa al cliente como `http_trace`, así que ve cada respuesta una sola
+    vez, la reintente discord.py o no. El ámbito sale de X-RateLimit-Global
+    y X-RateLimit-Scope (`user`, `shared`); sin cabecera `Via` la respuesta
+    viene de Cloudflare y no de la API.
+    """
+
+    def __init__(self):
+        self.counts: Dict[Labels, int] = {}
+        self.config = aiohttp.TraceConfig()
+        self.config.on_request_end.append(self._on_request_end)
+
+    async def _on_request_end(self, session: aiohttp.ClientSession, context,
+                              params: aiohttp.TraceRequestEndParams) -> None:
+        response = params.response
+        if response.status != 429:
+            return
+
+        headers = response.headers
+        if not headers.get("Via"):
+            scope = "cloudflare"
+        elif headers.get("X-RateLimit-Global", "").lower() == "true":
+            scope = "global"
+        else:
+            scope = headers.get("X-RateLimit-Scope", "user")
+
+        self.counts[(scope,)] = self.counts.get((scope,), 0) + 1
+
+
+class BotMetrics:
+    """Métricas del bot: eventos, comandos, gateway, cola REST y loop"""
+
+    # Intervalo de medición del retraso del event loop (segundos)
+    LOOP_LAG_INTERVAL = 0.5
+
+    def __init__(self, bot: "UaintBot"):
+        self.bot = bot
+        self.registry = MetricsRegistry()
+        registry = self.registry
+
+        self.event_duration = registry.histogram(
+            "discord_event_handler_seconds",
+            "Duración de los listeners de eventos del gateway",
+            ("event", "listener")
+        )
+        self.command_duration = registry.histogram(
+            "discord_app_command_seconds",
+            "Duración de los comandos slash",
+            ("command", "status")
+        )
+        registry.counter(
+            "discord_http_rate_limits_total",
+            "Respuestas 429 de la API REST por ámbito",
+            ("scope",),
+            collect=lambda: list(bot.rate_limit_trace.counts.items())
+        )
+        self.loop_lag = registry.histogram(
+            "event_loop_lag_seconds",
+            "Retraso del event loop respecto a un temporizador periódico",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+        )
+
+        registry.gauge(
+            "discord_gateway_latency_seconds",
+            "Latencia del heartbeat del gateway por shard",
+            ("shard",),
+            collect=self._gateway_latency
+        )
+        registry.gauge(
+            "discord_guilds",
+            "Servidores por shard",
+            ("shard",),
+            collect=self._guilds_per_shard
+        )
+        registry.counter(
+            "discord_shard_reconnects_total",
+            "Reconexiones por shard",
+            ("shard",),
+            collect=self._shard_reconnects
+        )
+        registry.gauge(
+            "action_queue_depth",
+            "Acciones REST pendientes y en curso",
+            ("state",),
+            collect=self._queue_depth
+        )
+        registry.counter(
+            "action_queue_rate_limited_total",
+            "Respuestas 429 recibidas por la cola de acciones",
+            collect=lambda: [((), self.bot.actions.rate_limited)]
+        )
+        registry.counter(
+            "action_queue_completed_total",
+            "Acciones REST finalizadas por tipo y resultado",
+            ("kind", "result"),
+            collect=self._queue_completed
+        )
+        registry.gauge(
+            "action_queue_wait_seconds_max",
+            "Mayor espera en cola por tipo de acción",
+            ("kind",),
+            collect=lambda: [((kind.name.lower(),), stats.wait_max) for kind, stats in self.bot.actions.kind_stats.items()]
+        )
+
+        registry.gauge(
+            "message_cache_entries",
+            "Mensajes guardados para los logs de edición y borrado",
+            collect=lambda: [((), len(self.bot.message_cache))]
+        )
+        registry.gauge(
+            "message_cache_bytes",
+            "Memoria estimada de la caché de mensajes",
+            collect=lambda: [((), self.bot.message_cache.size)]
+        )
+
+        # (evento, cog) -> histograma HDR para /perf (se puede reiniciar)
+        self.dispatch_stats: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.dispatch_stats_since = time.time()
+
+        self._lag_task: Optional[asyncio.Task] = None
+
+    # ====================================
+    # INSTRUMENTACIÓN
+    # ====================================
+
+    def observe_event(self, event_name: str, listener: Callable, duration: float) -> None:
+        owner = getattr(listener, "__self__", None)
+        name = type(owner).__name__ if owner is not None else getattr(listener, "__qualname__", "?")
+        self.event_duration.observe(duration, event_name, name)
+
+        key = (event_name, name)
+        stats = self.dispatch_stats.get(key)
+        if stats is None:
+            stats = self.dispatch_stats[key] = LatencyHistogram()
+        stats.record(duration)
+
+    def reset_dispatch_stats(self) -> None:
+        """Vacía los histogramas de /perf (no afecta a /metrics)"""
+        self.dispatch_stats = {}
+        self.dispatch_stats_since = time.time()
+
+    def start(self) -> None:
+        """Inicia la medición del loop"""
+        if self._lag_task is None or self._lag_task.done():
+            self._lag_task = asyncio.create_task(self._measure_loop_lag(), name="loop-lag")
+
+    async def stop(self) -> None:
+        if self._lag_task:
+            self._lag_task.cancel()
+            try:
+                await self._lag_task
+            except asyncio.CancelledError:
+                pass
+            self._lag_task = None
+
+    async def _measure_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.LOOP_LAG_INTERVAL
+            await asyncio.sleep(self.LOOP_LAG_INTERVAL)
+            self.loop_lag.observe(max(loop.time() - expected, 0.0))
+
+    # ====================================
+    # COLECTORES (se ejecutan solo al exportar)
+    # ====================================
+
+    def _gateway_latency(self) -> Iterable[Sample]:
+        return [((str(shard_id),), latency) for shard_id, latency in self.bot.latencies
+                if latency != float("inf")]
+
+    def _guilds_per_shard(self) -> Iterable[Sample]:
+        return [((str(shard["shard_id"]),), shard["guilds"]) for shard in self.bot.shard_monitor.snapshot()]
+
+    def _shard_reconnects(self) -> Iterable[Sample]:
+        return [((str(shard_id),), stats.reconnects) for shard_id, stats in self.bot.shard_monitor.shards.items()]
+
+    def _queue_depth(self) -> Iterable[Sample]:
+        return [(("pending",), self.bot.actions.depth), (("in_flight",), self.bot.actions.in_flight)]
+
+    def _queue_completed(self) -> Iterable[Sample]:
+        samples = []
+        for kind, stats in self.bot.actions.kind_stats.items():
+            samples.append(((kind.name.lower(), "ok"), stats.completed))
+            samples.append(((kind.name.lower(), "error"), stats.failed))
+        return samples
+
+
+class InstrumentedCommandTree(app_commands.CommandTree):
+    """Árbol de comandos que mide la duración de cada comando slash y carga extensiones diferidas"""
+
+    async def _call(self, interaction: discord.Interaction) -> None:
+        start = time.perf_counter()
+        try:
+            # Extensiones diferidas: se importan con el primer uso de su comando
+            loader = getattr(self.client, "extension_loader", None)
+            if loader is not None and interaction.data:
+                await loader.load_for_command(interaction.data.get("name"))
+
+            await super()._call(interaction)
+        finally:
+            metrics = getattr(self.client, "metrics", None)
+            if metrics is not None:
+                command = interaction.command
+                metrics.command_duration.observe(
+                    time.perf_counter() - start,
+                    command.qualified_name if command else "unknown",
+                    "error" if interaction.command_failed else "ok"
+                )
@@ -0,0 +1,254 @@
+"""
+Registro de moderación por lotes en el canal MOD_LOG_CHANNEL_ID
+Informatica UAIn'T Community Bot
+"""
+
+import logging
+import asyncio
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+import discord
+
+from .actions import ActionKind
+from .scheduler import DeadlineScheduler
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+# Tipos de evento: (título del embed, color)
+MOD_LOG_KINDS: Mapping[str, Tuple[str, int]] = MappingProxyType({
+    "message_delete": ("🗑️ Mensajes eliminados", 0xE74C3C),
+    "member_join": ("👋 Entradas", 0x2ECC71),
+    "member_remove": ("🚪 Salidas", 0xE67E22),
+    "channel": ("📝 Canales", 0x3498DB),
+    "role": ("🎭 Roles", 0x9B59B6),
+})
+
+# Límites de Discord por mensaje
+MAX_EMBEDS = 10
+EMBED_DESCRIPTION_LIMIT = 4096
+MESSAGE_TEXT_LIMIT = 6000  # suma de títulos, descripciones y footers de todos los embeds
+
+# Margen para títulos y footer: con este texto pendiente se envía sin esperar
+FLUSH_TEXT_THRESHOLD = MESSAGE_TEXT_LIMIT - 500
+
+# Longitud máxima de una línea del registro
+ENTRY_LIMIT = 300
+
+
+class ModLogEntry(NamedTuple):
+    """Evento pendiente de publicar"""
+
+    kind: str  # clave de MOD_LOG_KINDS
+    line: str  # texto ya formateado (con la hora)
+
+
+class ModLogSink:
+    """
+    Publica los eventos de moderación en el canal de logs agrupados.
+
+    Los eventos se acumulan en un buffer y se envían juntos cuando hay texto
+    para llenar un mensaje o cuando pasan MOD_LOG_FLUSH_INTERVAL segundos
+    desde el primero. Cada mensaje lleva hasta 10 embeds, uno por tipo de
+    evento con varias líneas cada uno.
+
+    Solo hay un envío en vuelo: si Discord limita el canal, la cola de
+    acciones espera el Retry-After y mientras tanto los eventos se siguen
+    acumulando. Si el buffer llega a MOD_LOG_BUFFER_SIZE los nuevos se
+    descartan y se cuentan; el siguiente mensaje indica cuántos se perdieron.
+    """
+
+    def __init__(self, bot: "UaintBot"):
+        self.bot = bot
+        self.buffer: Deque[ModLogEntry] = deque()
+        self.pending_text = 0  # caracteres de las líneas en el buffer
+        self.unreported_drops = 0  # descartes aún no avisados en el canal
+
+        self.scheduler = DeadlineScheduler(self._flush_due, name="mod-log")
+        self._sending: Optional[asyncio.Future] = None
+
+        self.events = bot.metrics.registry.counter(
+            "mod_log_events_total",
+            "Eventos del registro de moderación según resultado",
+            ("outcome",)
+        )
+        self.messages = bot.metrics.registry.counter(
+            "mod_log_messages_total",
+            "Mensajes enviados al canal de moderación según resultado",
+            ("outcome",)
+        )
+        bot.metrics.registry.gauge(
+            "mod_log_buffer",
+            "Eventos del registro de moderación pendientes de enviar",
+            collect=lambda: [((), len(self.buffer))]
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.bot.settings.MOD_LOG_CHANNEL_ID is not None
+
+    def start(self) -> None:
+        self.scheduler.start()
+
+    async def stop(self) -> None:
+        await self.scheduler.stop()
+
+    async def drain(self, timeout: float) -> None:
+        """Envía todo lo acumulado antes de cerrar (mensaje a mensaje, hasta `timeout`)"""
+
+        async def send_all() -> None:
+            while self.buffer or self._sending is not None:
+                future = self.flush()
+                if future is None:
+                    break
+                await asyncio.wait([future])
+
+        try:
+            await asyncio.wait_for(send_all(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("⚠️ Quedaron %s eventos del registro de moderación sin enviar", len(self.buffer))
+
+    # ====================================
+    # REGISTRO
+    # ====================================
+
+    def record(self, kind: str, text: str) -> None:
+        """Añade un evento al buffer (no hace nada sin MOD_LOG_CHANNEL_ID)"""
+
+        if not self.enabled:
+            return
+
+        if len(self.buffer) >= self.bot.settings.MOD_LOG_BUFFER_SIZE:
+            self.unreported_drops += 1
+            self.events.inc("dropped_overflow")
+            return
+
+        timestamp = discord.utils.format_dt(discord.utils.utcnow(), "T")
+        line = f"{timestamp} {text}"
+        if len(line) > ENTRY_LIMIT:
+            line = line[:ENTRY_LIMIT - 1] + "…"
+
+        self.buffer.append(ModLogEntry(kind, line))
+        self.pending_text += len(line) + 1
+
+        if self.pending_text >= FLUSH_TEXT_THRESHOLD:
+            self.flush()
+        elif "flush" not in self.scheduler:
+            self.scheduler.schedule("flush", self.bot.settings.MOD_LOG_FLUSH_INTERVAL)
+
+    # ====================================
+    # ENVÍO
+    # ====================================
+
+    def flush(self) -> Optional[asyncio.Future]:
+        """Envía lo acumulado que quepa en un mensaje, salvo si ya hay un envío en vuelo"""
+
+        if self._sending is not None or not self.buffer:
+            return self._sending
+
+        self.scheduler.cancel("flush")
+
+        channel = self.bot.get_channel(self.bot.settings.MOD_LOG_CHANNEL_ID or 0)
+        if not isinstance(channel, discord.abc.Messageable):
+            count = len(self.buffer)
+            self._clear()
+            self.events.inc("dropped_no_channel", amount=count)
+            logger.warning("⚠️ Canal de moderación %s no encontrado, %s evento(s) descartados",
+                           self.bot.settings.MOD_LOG_CHANNEL_ID, count)
+            return None
+
+        embeds, count = self._build_embeds()
+        self._sending = self.bot.actions.submit(
+            ActionKind.SEND,
+            f"channel:{channel.id}:messages",
+            lambda: channel.send(embeds=embeds)
+        )
+        self._sending.add_done_callback(lambda done: self._sent(done, count))
+        return self._sending
+
+    def _sent(self, future: asyncio.Future, count: int) -> None:
+        self._sending = None
+
+        if future.cancelled() or future.exception() is not None:
+            error = "cancelado" if future.cancelled() else future.exception()
+            self.events.inc("dropped_failed", amount=count)
+            self.messages.inc("failed")
+            logger.error("❌ No se pudo enviar el registro de moderación (%s eventos): %s", count, error)
+        else:
+            self.events.inc("sent", amount=count)
+            self.messages.inc("sent")
+
+        # Lo que llegó mientras tanto: ya si llena un mensaje, si no en el plazo normal
+        if self.pending_text >= FLUSH_TEXT_THRESHOLD:
+            self.flush()
+        elif self.buffer and "flush" not in self.scheduler:
+            self.scheduler.schedule("flush", self.bot.settings.MOD_LOG_FLUSH_INTERVAL)
+
+    async def _flush_due(self, keys: List[str]) -> None:
+        self.flush()
+
+    def _clear(self) -> None:
+        self.buffer.clear()
+        self.pending_text = 0
+
+    def _build_embeds(self) -> Tuple[List[discord.Embed], int]:
+        """
+        Extrae del buffer las entradas que caben en un mensaje y las agrupa en
+        embeds por tipo (en el orden en que aparecieron). Devuelve los embeds y
+        cuántas entradas contienen.
+        """
+
+        notice = ""
+        if self.unreported_drops:
+            notice = f"⚠️ {self.unreported_drops} evento(s) descartados por saturación"
+            self.unreported_drops = 0
+
+        groups: Dict[str, List[List[str]]] = {}  # kind -> bloques de líneas (uno por embed)
+        block_sizes: Dict[str, int] = {}
+        embeds_used = 0
+        budget = MESSAGE_TEXT_LIMIT - len(notice)
+        count = 0
+
+        while self.buffer:
+            kind, line = self.buffer[0]
+            title = MOD_LOG_KINDS[kind][0]
+            size = len(line) + 1
+
+            blocks = groups.get(kind)
+            new_block = blocks is None or block_sizes[kind] + size > EMBED_DESCRIPTION_LIMIT
+            cost = size + (len(title) + 12 if new_block else 0)
+
+            if cost > budget or (new_block and embeds_used == MAX_EMBEDS):
+                break
+
+            if new_block:
+                groups.setdefault(kind, []).append([])
+                block_sizes[kind] = 0
+                embeds_used += 1
+
+            groups[kind][-1].append(line)
+            block_sizes[kind] += size
+            budget -= cost
+
+            self.buffer.popleft()
+            self.pending_text -= size
+            count += 1
+
+        embeds = []
+        for kind, blocks in groups.items():
+            title, color = MOD_LOG_KINDS[kind]
+            for index, lines in enumerate(blocks):
+                embeds.append(discord.Embed(
+                    title=f"{title} ({len(lines)})" if index == 0 else f"{title} (cont.)",
+                    description="\n".join(lines),
+                    color=color
+                ))
+
+        if notice:
+            embeds[-1].set_footer(text=notice)
+
+        return embeds, count
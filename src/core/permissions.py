@@ -0,0 +1,195 @@
+"""
+Resolución centralizada de permisos
+Informatica UAIn'T Community Bot
+"""
+
+import logging
+from typing import Dict, FrozenSet, NamedTuple, Tuple, TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+
+class MemberPermissions(NamedTuple):
+    """Decisión de permisos precalculada para un miembro"""
+
+    bot_owner: bool
+    administrator: bool
+    manage_channels: bool
+    manage_messages: bool
+    admin_role: bool
+    mod_role: bool
+
+    @property
+    def is_admin(self) -> bool:
+        """Owner del bot, administrador del servidor o rol de admin configurado"""
+        return self.bot_owner or self.administrator or self.admin_role
+
+    @property
+    def is_moderator(self) -> bool:
+        """Administrador o rol de moderador configurado"""
+        return self.is_admin or self.mod_role
+
+
+class PermissionService:
+    """
+    Servicio de permisos compartido por todos los cogs.
+
+    Los IDs de roles configurados se parsean una sola vez a frozensets. Las
+    decisiones se cachean por miembro y, en un segundo nivel, por conjunto de
+    roles (miembros con los mismos roles comparten decisión). La caché se
+    invalida con los eventos de miembros, roles y servidores.
+
+    El nivel por miembro solo se usa si discord.py guarda a todos los
+    miembros (perfil de caché `full`): con otro perfil no hay on_member_update
+    de quien no está en caché y una decisión podría quedar desactualizada.
+    """
+
+    # Tamaño máximo de la caché por miembro en cada servidor
+    MAX_CACHED_MEMBERS = 10_000
+
+    def __init__(self, bot: "UaintBot"):
+        self.bot = bot
+
+        self.admin_role_ids: FrozenSet[int] = frozenset()
+        self.mod_role_ids: FrozenSet[int] = frozenset()
+        self.owner_ids: FrozenSet[int] = frozenset()
+
+        # guild_id -> member_id -> decisión (solo si se reciben todas las actualizaciones)
+        self.per_member = bot.cache_profile.caches_members
+        self._by_member: Dict[int, Dict[int, MemberPermissions]] = {}
+        # guild_id -> (roles, es owner del servidor) -> decisión
+        self._by_roles: Dict[int, Dict[Tuple[FrozenSet[int], bool], MemberPermissions]] = {}
+
+        self.reload()
+
+    def reload(self) -> None:
+        """Vuelve a leer los roles configurados y vacía la caché"""
+        self.admin_role_ids = frozenset(self.bot.settings.ADMIN_ROLE_IDS)
+        self.mod_role_ids = frozenset(self.bot.settings.MOD_ROLE_IDS)
+        self.clear()
+
+    def clear(self) -> None:
+        self._by_member.clear()
+        self._by_roles.clear()
+
+    def attach(self) -> None:
+        """Registra los listeners de invalidación en el bot"""
+        self.bot.add_listener(self.on_member_update)
+        self.bot.add_listener(self.on_raw_member_remove)
+        self.bot.add_listener(self.on_guild_update)
+        self.bot.add_listener(self.on_guild_remove)
+        self.bot.add_listener(self.on_guild_role_update)
+        self.bot.add_listener(self.on_guild_role_delete)
+
+    async def load_owners(self) -> None:
+        """Obtiene los owners del bot (una llamada REST al iniciar)"""
+
+        if self.bot.owner_id:
+            self.owner_ids = frozenset({self.bot.owner_id})
+            return
+
+        if self.bot.owner_ids:
+            self.owner_ids = frozenset(self.bot.owner_ids)
+            return
+
+        try:
+            app = await self.bot.application_info()
+        except discord.HTTPException as e:
+            logger.warning("⚠️ No se pudo obtener el owner del bot: %s", e)
+            return
+
+        if app.team:
+            self.owner_ids = frozenset(member.id for member in app.team.members)
+        else:
+            self.owner_ids = frozenset({app.owner.id})
+
+        self.clear()
+
+    # ====================================
+    # RESOLUCIÓN
+    # ====================================
+
+    def resolve(self, member: discord.Member) -> MemberPermissions:
+        """Obtiene la decisión de permisos de un miembro"""
+
+        guild_id = member.guild.id
+        members = None
+        if self.per_member:
+            members = self._by_member.get(guild_id)
+            if members is None:
+                members = self._by_member[guild_id] = {}
+
+            cached = members.get(member.id)
+            if cached is not None:
+                return cached
+
+        roles = frozenset(role.id for role in member.roles)
+        role_key = (roles, member.id == member.guild.owner_id)
+
+        by_roles = self._by_roles.setdefault(guild_id, {})
+        decision = by_roles.get(role_key)
+        if decision is None:
+            guild_permissions = member.guild_permissions
+            decision = by_roles[role_key] = MemberPermissions(
+                bot_owner=False,
+                administrator=guild_permissions.administrator,
+                manage_channels=guild_permissions.manage_channels,
+                manage_messages=guild_permissions.manage_messages,
+                admin_role=not self.admin_role_ids.isdisjoint(roles),
+                mod_role=not self.mod_role_ids.isdisjoint(roles)
+            )
+
+        if member.id in self.owner_ids:
+            decision = decision._replace(bot_owner=True)
+
+        if members is not None:
+            if len(members) >= self.MAX_CACHED_MEMBERS:
+                members.clear()
+            members[member.id] = decision
+
+        return decision
+
+    def is_admin(self, member: discord.Member) -> bool:
+        return self.resolve(member).is_admin
+
+    def is_moderator(self, member: discord.Member) -> bool:
+        return self.resolve(member).is_moderator
+
+    # ====================================
+    # INVALIDACIÓN
+    # ====================================
+
+    def invalidate_member(self, guild_id: int, member_id: int) -> None:
+        members = self._by_member.get(guild_id)
+        if members:
+            members.pop(member_id, None)
+
+    def invalidate_guild(self, guild_id: int) -> None:
+        self._by_member.pop(guild_id, None)
+        self._by_roles.pop(guild_id, None)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if before.roles != after.roles:
+            self.invalidate_member(after.guild.id, after.id)
+
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        self.invalidate_member(payload.guild_id, payload.user.id)
+
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild) -> None:
+        if before.owner_id != after.owner_id:
+            self.invalidate_guild(after.id)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.invalidate_guild(guild.id)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        if before.permissions != after.permissions:
+            self.invalidate_guild(after.guild.id)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self.invalidate_guild(role.guild.id)
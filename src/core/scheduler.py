@@ -0,0 +1,141 @@
+"""
+Planificador de vencimientos basado en heap
+Informatica UAIn'T Community Bot
+"""
+
+import heapq
+import logging
+import asyncio
+import itertools
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+ExpiryCallback = Callable[[List[Hashable]], Awaitable[None]]
+
+
+class DeadlineScheduler:
+    """
+    Mantiene como máximo un vencimiento pendiente por clave con un único timer.
+
+    Reprogramar o cancelar una clave no toca el heap: la entrada anterior queda
+    obsoleta y se descarta al llegar a la cima (o al compactar), de modo que las
+    ráfagas de entradas/salidas no generan corrutinas ni despertares extra.
+    Las claves vencidas se entregan en lote a `callback`.
+    """
+
+    # Compactar el heap cuando las entradas obsoletas superen este margen
+    COMPACT_THRESHOLD = 64
+
+    def __init__(self, callback: ExpiryCallback, name: str = "scheduler"):
+        self.name = name
+        self._callback = callback
+
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._deadlines: Dict[Hashable, Tuple[float, int]] = {}  # key -> (deadline, seq)
+        self._seq = itertools.count()
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._callbacks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def schedule(self, key: Hashable, delay: float) -> None:
+        """Programa (o reprograma) el vencimiento de `key` en `delay` segundos"""
+
+        deadline = self._now() + delay
+        seq = next(self._seq)
+        self._deadlines[key] = (deadline, seq)
+
+        wake = not self._heap or deadline < self._heap[0][0]
+        heapq.heappush(self._heap, (deadline, seq, key))
+
+        if len(self._heap) > 2 * len(self._deadlines) + self.COMPACT_THRESHOLD:
+            self._compact()
+
+        # Solo despertar si el nuevo vencimiento es el más próximo
+        if wake:
+            self._wakeup.set()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancela el vencimiento pendiente de `key`"""
+        return self._deadlines.pop(key, None) is not None
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Momento (reloj del loop) en que vence `key`, si está programada"""
+        entry = self._deadlines.get(key)
+        return entry[0] if entry else None
+
+    def _is_current(self, entry: Tuple[float, int, Hashable]) -> bool:
+        deadline, seq, key = entry
+        return self._deadlines.get(key) == (deadline, seq)
+
+    def _compact(self) -> None:
+        """Reconstruye el heap sin entradas obsoletas"""
+        self._heap = [entry for entry in self._heap if self._is_current(entry)]
+        heapq.heapify(self._heap)
+
+    def _pop_expired(self, now: float) -> List[Hashable]:
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_current(entry):
+                del self._deadlines[entry[2]]
+                expired.append(entry[2])
+        return expired
+
+    def start(self) -> None:
+        """Inicia el timer del planificador"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Detiene el timer (los vencimientos pendientes se conservan)"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+
+            # Descartar entradas obsoletas en la cima
+            while self._heap and not self._is_current(self._heap[0]):
+                heapq.heappop(self._heap)
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - self._now()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            expired = self._pop_expired(self._now())
+            if expired:
+                task = asyncio.create_task(self._dispatch(expired))
+                self._callbacks.add(task)
+                task.add_done_callback(self._callbacks.discard)
+
+    async def _dispatch(self, keys: List[Hashable]) -> None:
+        try:
+            await self._callback(keys)
+        except Exception as e:
+            logger.exception("❌ Error procesando vencimientos de %s: %s", self.name, e)
@@ -0,0 +1,122 @@
+"""
+Seguimiento del estado de los shards del gateway
+Informatica UAIn'T Community Bot
+"""
+
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+
+class ShardStats:
+    """Contadores de conexión de un shard"""
+
+    __slots__ = ("connects", "resumes", "disconnects", "connected", "last_change")
+
+    def __init__(self):
+        self.connects = 0
+        self.resumes = 0
+        self.disconnects = 0
+        self.connected = False
+        self.last_change: Optional[float] = None
+
+    @property
+    def reconnects(self) -> int:
+        """Reconexiones tras la primera conexión (nuevas sesiones y reanudaciones)"""
+        return max(self.connects - 1, 0) + self.resumes
+
+
+class ShardMonitor:
+    """
+    Registra conexiones, reanudaciones y desconexiones de cada shard.
+
+    Los contadores se actualizan con los eventos `on_shard_*`; la latencia y el
+    número de servidores se leen del cliente al pedir un resumen.
+    """
+
+    def __init__(self, bot: "UaintBot"):
+        self.bot = bot
+        self.shards: Dict[int, ShardStats] = {}
+
+    def attach(self) -> None:
+        """Registra los listeners de shards en el bot"""
+        self.bot.add_listener(self.on_shard_connect)
+        self.bot.add_listener(self.on_shard_resumed)
+        self.bot.add_listener(self.on_shard_disconnect)
+        self.bot.add_listener(self.on_shard_ready)
+
+    def _stats(self, shard_id: int) -> ShardStats:
+        stats = self.shards.get(shard_id)
+        if stats is None:
+            stats = self.shards[shard_id] = ShardStats()
+        return stats
+
+    def _mark(self, shard_id: int, connected: bool) -> ShardStats:
+        stats = self._stats(shard_id)
+        stats.connected = connected
+        stats.last_change = discord.utils.utcnow().timestamp()
+        return stats
+
+    async def on_shard_connect(self, shard_id: int) -> None:
+        stats = self._mark(shard_id, True)
+        stats.connects += 1
+        if stats.connects > 1:
+            logger.info("🔌 Shard %s reconectado (sesión nueva #%s)", shard_id, stats.connects)
+
+    async def on_shard_resumed(self, shard_id: int) -> None:
+        stats = self._mark(shard_id, True)
+        stats.resumes += 1
+        logger.info("🔌 Shard %s reanudado", shard_id)
+
+    async def on_shard_disconnect(self, shard_id: int) -> None:
+        stats = self._mark(shard_id, False)
+        stats.disconnects += 1
+        logger.warning("⚠️ Shard %s desconectado", shard_id)
+
+    async def on_shard_ready(self, shard_id: int) -> None:
+        self._mark(shard_id, True)
+        logger.info("✅ Shard %s listo", shard_id)
+
+    # ====================================
+    # RESUMEN
+    # ====================================
+
+    @property
+    def shard_ids(self) -> List[int]:
+        """Shards asignados a este proceso"""
+        return sorted(self.bot.shards) if self.bot.shards else sorted(self.shards)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Estado de cada shard del proceso (una sola pasada por los servidores)"""
+
+        guild_counts = Counter(guild.shard_id for guild in self.bot.guilds)
+        latencies = dict(self.bot.latencies)
+
+        result = []
+        for shard_id in self.shard_ids:
+            stats = self._stats(shard_id)
+            latency = latencies.get(shard_id)
+            result.append({
+                "shard_id": shard_id,
+                "connected": stats.connected,
+                "latency_ms": round(latency * 1000, 1) if latency is not None and latency != float("inf") else None,
+                "guilds": guild_counts.get(shard_id, 0),
+                "connects": stats.connects,
+                "reconnects": stats.reconnects,
+                "disconnects": stats.disconnects,
+            })
+
+        return result
+
+    @property
+    def healthy(self) -> bool:
+        """Todos los shards del proceso están conectados"""
+        shard_ids = self.shard_ids
+        return bool(shard_ids) and all(self._stats(shard_id).connected for shard_id in shard_ids)
@@ -0,0 +1,94 @@
+"""
+Instantánea binaria de estado para reinicios sin pérdida
+Informatica UAIn'T Community Bot
+"""
+
+import os
+import time
+import zlib
+import struct
+import marshal
+import logging
+from pathlib import Path
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+# Cabecera: magic, versión de formato, versión de marshal, creada (epoch), CRC32 del cuerpo
+MAGIC = b"UAIS"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHdI")
+
+# Una instantánea más antigua que esto ya no describe el estado real
+MAX_AGE = 600
+
+
+def write_snapshot(path: Path, sections: Dict[str, Any]) -> int:
+    """
+    Escribe las secciones (solo tipos básicos: dict, list, tuple, int, float,
+    str, bool, None) de forma atómica. Devuelve el tamaño en bytes.
+    """
+
+    body = zlib.compress(marshal.dumps(sections), 6)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version, time.time(), zlib.crc32(body))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    with open(temporary, "wb") as file:
+        file.write(header)
+        file.write(body)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+    return HEADER.size + len(body)
+
+
+def read_snapshot(path: Path, max_age: float = MAX_AGE) -> Dict[str, Any]:
+    """
+    Lee y consume una instantánea (el fichero se elimina aunque no sea válida,
+    para no reutilizarla en el siguiente arranque). Devuelve {} si no hay una
+    utilizable.
+    """
+
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        logger.warning("⚠️ No se pudo leer la instantánea %s: %s", path, e)
+        return {}
+
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+    if len(data) < HEADER.size:
+        logger.warning("⚠️ Instantánea truncada, se ignora")
+        return {}
+
+    magic, version, marshal_version, created, checksum = HEADER.unpack_from(data)
+    body = data[HEADER.size:]
+
+    if magic != MAGIC or version != FORMAT_VERSION or marshal_version != marshal.version:
+        logger.warning("⚠️ Instantánea con formato incompatible, se ignora")
+        return {}
+
+    if zlib.crc32(body) != checksum:
+        logger.warning("⚠️ Instantánea corrupta (CRC), se ignora")
+        return {}
+
+    age = time.time() - created
+    if age > max_age:
+        logger.info("Instantánea de hace %.0fs descartada (máximo %ss)", age, max_age)
+        return {}
+
+    try:
+        sections = marshal.loads(zlib.decompress(body))
+    except (ValueError, EOFError, TypeError, zlib.error) as e:
+        logger.warning("⚠️ Instantánea ilegible: %s", e)
+        return {}
+
+    logger.info("📥 Instantánea de hace %.1fs cargada (%s bytes)", age, len(data))
+    return sections
@@ -0,0 +1,154 @@
+"""
+Medición del tiempo de arranque
+Informatica UAIn'T Community Bot
+
+Este módulo solo usa la librería estándar: se importa antes que discord.py
+para poder medir el resto de imports.
+"""
+
+import sys
+import time
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _ProfilingLoader:
+    """Envuelve el loader de un módulo para medir su ejecución"""
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._profiler.exec_module(self._loader, module)
+
+
+class ImportProfiler:
+    """
+    Tiempo de import por módulo (propio y acumulado), como `-X importtime`.
+
+    Se instala al principio de `sys.meta_path` y envuelve el loader de cada
+    módulo encontrado. Solo se usa con --profile-startup.
+    """
+
+    def __init__(self):
+        self.modules: Dict[str, Tuple[float, float]] = {}  # módulo -> (propio, acumulado)
+        self._children: List[float] = []
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _ProfilingLoader(spec.loader, self)
+            return spec
+        return None
+
+    def exec_module(self, loader: Any, module) -> None:
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            self.modules[module.__name__] = (elapsed - children, elapsed)
+
+    def by_package(self) -> List[Tuple[str, float]]:
+        """Tiempo propio agregado por paquete de primer nivel"""
+        totals: Dict[str, float] = {}
+        for name, (own, _) in self.modules.items():
+            package = name.partition(".")[0]
+            totals[package] = totals.get(package, 0.0) + own
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+    def slowest(self, limit: int = 15) -> List[Tuple[str, float, float]]:
+        """Módulos con más tiempo propio"""
+        rows = [(name, own, cumulative) for name, (own, cumulative) in self.modules.items()]
+        return sorted(rows, key=lambda row: row[1], reverse=True)[:limit]
+
+
+class StartupTimeline:
+    """
+    Fases del arranque hasta estar operativo.
+
+    Cada `mark()` cierra la fase en curso. Las fases que usa el bot son:
+    imports, extensiones, login, setup, READY y sync.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.profiler: Optional[ImportProfiler] = None
+        self.finished = False
+        self._last = self.started
+
+    def enable_profiling(self) -> None:
+        """Empieza a medir imports (llamar antes de importar discord.py)"""
+        self.profiler = ImportProfiler()
+        self.profiler.install()
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        return self._last - self.started
+
+    def finish(self) -> None:
+        """Registra el resumen del arranque (una sola vez)"""
+
+        if self.finished:
+            return
+        self.finished = True
+
+        logger.info(
+            "⏱️ Operativo en %.2fs (%s)",
+            self.total, ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in self.phases)
+        )
+
+        if self.profiler is None:
+            return
+        self.profiler.uninstall()
+
+        lines = ["📦 Tiempo de import por paquete (propio):"]
+        for package, seconds in self.profiler.by_package()[:15]:
+            lines.append(f"   {seconds * 1000:8.1f}ms  {package}")
+
+        lines.append("🐢 Módulos más lentos (propio / acumulado):")
+        for name, own, cumulative in self.profiler.slowest():
+            lines.append(f"   {own * 1000:8.1f}ms / {cumulative * 1000:8.1f}ms  {name}")
+
+        logger.info("%s", "\n".join(lines))
+
+
+# Línea de tiempo del proceso (el punto de entrada marca la primera fase)
+timeline = StartupTimeline()
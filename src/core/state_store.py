@@ -0,0 +1,209 @@
+"""
+Almacenamiento persistente de estado
+Informatica UAIn'T Community Bot
+"""
+
+import json
+import logging
+import asyncio
+import sqlite3
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+from .exceptions import DatabaseError
+
+if TYPE_CHECKING:
+    from config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class StateBackend(ABC):
+    """
+    Backend asíncrono de estado clave-valor agrupado por namespace.
+
+    Las escrituras (`put`/`delete`) son síncronas y solo encolan el cambio:
+    nunca bloquean el event loop. Cada backend decide cuándo persistirlas.
+    """
+
+    async def open(self) -> None:
+        """Prepara el backend para su uso"""
+
+    async def close(self) -> None:
+        """Persiste cambios pendientes y libera recursos"""
+
+    async def flush(self) -> None:
+        """Fuerza la escritura de los cambios pendientes"""
+
+    @abstractmethod
+    async def load(self, namespace: str) -> Dict[int, Dict[str, Any]]:
+        """Obtiene todos los registros de un namespace"""
+
+    @abstractmethod
+    def put(self, namespace: str, key: int, value: Dict[str, Any]) -> None:
+        """Encola la escritura de un registro"""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: int) -> None:
+        """Encola la eliminación de un registro"""
+
+
+class MemoryStateBackend(StateBackend):
+    """Backend en memoria (tests y entornos sin disco)"""
+
+    def __init__(self):
+        self._data: Dict[str, Dict[int, Dict[str, Any]]] = {}
+
+    async def load(self, namespace: str) -> Dict[int, Dict[str, Any]]:
+        return {key: dict(value) for key, value in self._data.get(namespace, {}).items()}
+
+    def put(self, namespace: str, key: int, value: Dict[str, Any]) -> None:
+        self._data.setdefault(namespace, {})[key] = dict(value)
+
+    def delete(self, namespace: str, key: int) -> None:
+        self._data.get(namespace, {}).pop(key, None)
+
+
+class SQLiteStateBackend(StateBackend):
+    """
+    Backend SQLite en modo WAL.
+
+    Los cambios se acumulan en memoria (el último valor por clave gana) y se
+    escriben en una sola transacción cada `flush_interval` segundos, desde un
+    hilo dedicado para no bloquear el event loop.
+    """
+
+    def __init__(self, path: Path, flush_interval: float = 0.5):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-store")
+        self._pending: Dict[Tuple[str, int], Optional[str]] = {}  # None = eliminar
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    async def _run(self, func, *args):
+        """Ejecuta una operación bloqueante en el hilo del backend"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            "namespace TEXT NOT NULL, "
+            "key INTEGER NOT NULL, "
+            "value TEXT NOT NULL, "
+            "PRIMARY KEY (namespace, key)"
+            ") WITHOUT ROWID"
+        )
+        self._connection = connection
+
+    def _write_batch(self, batch: Dict[Tuple[str, int], Optional[str]]) -> None:
+        upserts = [(ns, key, value) for (ns, key), value in batch.items() if value is not None]
+        deletes = [(ns, key) for (ns, key), value in batch.items() if value is None]
+
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            if upserts:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO state (namespace, key, value) VALUES (?, ?, ?)",
+                    upserts
+                )
+            if deletes:
+                connection.executemany("DELETE FROM state WHERE namespace = ? AND key = ?", deletes)
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _read_namespace(self, namespace: str) -> Dict[int, Dict[str, Any]]:
+        rows = self._connection.execute(
+            "SELECT key, value FROM state WHERE namespace = ?", (namespace,)
+        ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    async def open(self) -> None:
+        if self._connection is not None:
+            return
+
+        try:
+            await self._run(self._connect)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"No se pudo abrir el estado en {self.path}: {e}")
+
+        self._flush_task = asyncio.create_task(self._flush_loop(), name="state-store-flush")
+        logger.info("💾 Estado persistente en %s", self.path)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._pending:
+                await self.flush()
+
+    async def flush(self) -> None:
+        if self._connection is None or not self._pending:
+            return
+
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            try:
+                await self._run(self._write_batch, batch)
+            except sqlite3.Error as e:
+                logger.error("❌ Error escribiendo estado (%s cambios): %s", len(batch), e)
+                # Reintentar en el próximo flush sin pisar cambios más recientes
+                for item_key, value in batch.items():
+                    self._pending.setdefault(item_key, value)
+
+    async def close(self) -> None:
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        if self._connection is not None:
+            await self.flush()
+            await self._run(self._connection.close)
+            self._connection = None
+
+        self._executor.shutdown(wait=False)
+
+    async def load(self, namespace: str) -> Dict[int, Dict[str, Any]]:
+        if self._connection is None:
+            raise DatabaseError("El backend de estado no está abierto")
+
+        await self.flush()
+        try:
+            return await self._run(self._read_namespace, namespace)
+        except (sqlite3.Error, ValueError) as e:
+            raise DatabaseError(f"Error leyendo estado '{namespace}': {e}")
+
+    def put(self, namespace: str, key: int, value: Dict[str, Any]) -> None:
+        self._pending[(namespace, key)] = json.dumps(value, separators=(",", ":"))
+
+    def delete(self, namespace: str, key: int) -> None:
+        self._pending[(namespace, key)] = None
+
+
+def create_state_backend(settings: "Settings") -> StateBackend:
+    """Crea el backend de estado configurado"""
+
+    backend = settings.STATE_BACKEND.lower()
+
+    if backend == "sqlite":
+        return SQLiteStateBackend(
+            Path(settings.DATA_DIR) / "state.db",
+            flush_interval=settings.STATE_FLUSH_INTERVAL
+        )
+
+    if backend == "memory":
+        return MemoryStateBackend()
+
+    raise DatabaseError(f"Backend de estado desconocido: {settings.STATE_BACKEND}")
@@ -0,0 +1,87 @@
+"""
+Servidor HTTP interno de salud y métricas
+Informatica UAIn'T Community Bot
+"""
+
+import logging
+from typing import Awaitable, Callable, Optional, TYPE_CHECKING
+
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class StatusServer:
+    """
+    Servidor HTTP interno para sondas y monitorización (no se expone a Internet).
+
+    - `GET /health`: 200 si todos los shards del proceso están conectados, 503 si no
+      (o si el bot se está vaciando para cerrar).
+    - `GET /shards`: estado de cada shard en JSON.
+    - `GET /metrics`: métricas en formato de exposición de Prometheus.
+
+    Otros módulos pueden añadir rutas con `add_route` antes de `start`.
+    """
+
+    def __init__(self, bot: "UaintBot", host: str, port: int):
+        self.bot = bot
+        self.host = host
+        self.port = port
+
+        self.app = web.Application()
+        self._runner: Optional[web.AppRunner] = None
+
+        self.add_route("/health", self.health)
+        self.add_route("/shards", self.shards)
+        self.add_route("/metrics", self.metrics)
+
+    def add_route(self, path: str, handler: Handler) -> None:
+        self.app.router.add_get(path, handler)
+
+    async def start(self) -> None:
+        if self._runner is not None:
+            return
+
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info("📡 Servidor de estado escuchando en %s:%s", self.host, self.port)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # ====================================
+    # RUTAS
+    # ====================================
+
+    async def health(self, request: web.Request) -> web.Response:
+        healthy = self.bot.is_ready and self.bot.shard_monitor.healthy and not self.bot.draining
+        return web.json_response(
+            {
+                "status": "ok" if healthy else "unavailable",
+                "ready": self.bot.is_ready,
+                "draining": self.bot.draining,
+            },
+            status=200 if healthy else 503
+        )
+
+    async def shards(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "mode": self.bot.settings.SHARD_MODE,
+            "shard_count": self.bot.shard_count,
+            "shards": self.bot.shard_monitor.snapshot(),
+        })
+
+    async def metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=self.bot.metrics.registry.render(),
+            content_type="text/plain",
+            headers={"X-Prometheus-Format": "0.0.4"}
+        )
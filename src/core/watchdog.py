@@ -0,0 +1,243 @@
+"""
+Vigilancia de bloqueos del event loop
+Informatica UAIn'T Community Bot
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from collections import Counter, deque
+from types import CodeType, FrameType
+from typing import Any, Deque, Dict, List, Optional, TYPE_CHECKING
+
+from discord import app_commands
+from discord.ext import tasks
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+
+class StallReport:
+    """Un bloqueo del loop con sus muestras de pila"""
+
+    __slots__ = ("started_at", "duration", "task", "samples", "culprits", "stack")
+
+    def __init__(self, started_at: float, task: Optional[str]):
+        self.started_at = started_at  # time.time() del inicio estimado
+        self.duration = 0.0
+        self.task = task
+        self.samples = 0
+        self.culprits: Counter = Counter()  # "Cog.listener" -> muestras
+        self.stack: List[str] = []  # pila completa de la primera muestra
+
+    @property
+    def culprit(self) -> str:
+        if not self.culprits:
+            return "desconocido"
+        return self.culprits.most_common(1)[0][0]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "task": self.task,
+            "culprit": self.culprit,
+            "samples": self.samples,
+        }
+
+
+class LoopWatchdog:
+    """
+    Detecta bloqueos del event loop y los atribuye a un cog y listener.
+
+    Un latido en el loop marca la hora cada `interval` segundos y un hilo
+    aparte comprueba su antigüedad. Si el retraso supera `threshold`, el hilo
+    toma muestras de la pila del hilo del loop (`sys._current_frames`) y busca
+    en ella el primer código que pertenezca a un listener, comando slash o
+    tarea de un cog. Al reanudarse el latido se registra el informe.
+
+    El mapa código -> responsable se construye en el loop al activar la
+    vigilancia y cada vez que se carga o descarga un cog; el hilo solo lo
+    lee, así que muestrear un bloqueo no recorre los cogs.
+
+    Desactivado no hay latido ni hilo, así que no tiene coste.
+    """
+
+    MAX_REPORTS = 20
+    STACK_LIMIT = 25
+
+    def __init__(self, bot: "UaintBot", threshold: float = 0.25, interval: float = 0.05):
+        self.bot = bot
+        self.threshold = threshold
+        self.interval = interval
+
+        self.reports: Deque[StallReport] = deque(maxlen=self.MAX_REPORTS)
+        self.targets: Dict[CodeType, str] = {}  # código -> "Cog.nombre" (se reemplaza entero)
+
+        self._beat = 0.0
+        self._stall: Optional[StallReport] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.stalls = bot.metrics.registry.counter(
+            "event_loop_stalls_total",
+            "Bloqueos del event loop por encima del umbral, por responsable",
+            ("culprit",)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._heartbeat is not None and not self._heartbeat.done()
+
+    def start(self) -> None:
+        """Activa la vigilancia (debe llamarse desde el loop)"""
+
+        if self.enabled:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._stop.clear()
+        self.targets = self._build_targets()
+
+        self._heartbeat = asyncio.create_task(self._run_heartbeat(), name="loop-watchdog")
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+        logger.info("🐕 Vigilancia del event loop activada (umbral %.0fms)", self.threshold * 1000)
+
+    async def stop(self) -> None:
+        """Desactiva la vigilancia"""
+
+        if self._heartbeat is None:
+            return
+
+        self._stop.set()
+        self._heartbeat.cancel()
+        try:
+            await self._heartbeat
+        except asyncio.CancelledError:
+            pass
+
+        self._heartbeat = None
+        self._thread = None
+        self._stall = None
+        self.targets = {}
+        logger.info("🐕 Vigilancia del event loop desactivada")
+
+    def refresh_targets(self) -> None:
+        """Rehace el mapa de responsables tras cargar o descargar cogs (desde el loop)"""
+        if self.enabled:
+            self.targets = self._build_targets()
+
+    # ====================================
+    # LATIDO (event loop)
+    # ====================================
+
+    async def _run_heartbeat(self) -> None:
+        while True:
+            self._beat = time.perf_counter()
+            await asyncio.sleep(self.interval)
+
+            stall = self._stall
+            if stall is not None:
+                self._stall = None
+                self._finish(stall)
+
+    def _finish(self, stall: StallReport) -> None:
+        stall.duration = time.time() - stall.started_at
+        self.reports.append(stall)
+        self.stalls.inc(stall.culprit)
+
+        logger.warning(
+            "🐢 Event loop bloqueado %.0fms por %s (tarea: %s, %s muestras)\n%s",
+            stall.duration * 1000, stall.culprit, stall.task or "?", stall.samples, "".join(stall.stack)
+        )
+
+    # ====================================
+    # MUESTREO (hilo aparte)
+    # ====================================
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            lag = time.perf_counter() - self._beat - self.interval
+            if lag < self.threshold:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            stall = self._stall
+            if stall is None:
+                stall = StallReport(time.time() - lag, self._current_task_name())
+                stall.stack = traceback.format_list(traceback.extract_stack(frame, limit=self.STACK_LIMIT))
+                self._stall = stall
+
+            stall.samples += 1
+            stall.culprits[self._attribute(frame)] += 1
+
+    def _current_task_name(self) -> Optional[str]:
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return None
+        return task.get_name() if task else None
+
+    def _attribute(self, frame: Optional[FrameType]) -> str:
+        """Primer listener, comando o tarea de un cog en la pila (de dentro hacia fuera)"""
+
+        targets = self.targets
+        innermost = frame
+
+        while frame is not None:
+            name = targets.get(frame.f_code)
+            if name is not None:
+                return name
+            frame = frame.f_back
+
+        if innermost is not None:
+            code = innermost.f_code
+            return f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}"
+        return "desconocido"
+
+    # ====================================
+    # MAPA DE RESPONSABLES (event loop)
+    # ====================================
+
+    def _build_targets(self) -> Dict[CodeType, str]:
+        """Mapa código -> "Cog.nombre" de listeners, comandos slash y tareas"""
+
+        targets: Dict[CodeType, str] = {}
+
+        for cog_name, cog in list(self.bot.cogs.items()):
+            for name, listener in cog.get_listeners():
+                code = getattr(getattr(listener, "__func__", listener), "__code__", None)
+                if code is not None:
+                    targets[code] = f"{cog_name}.{name}"
+
+            for command in cog.walk_app_commands():
+                if isinstance(command, app_commands.Command):
+                    targets[command.callback.__code__] = f"{cog_name}./{command.qualified_name}"
+
+            for value in vars(type(cog)).values():
+                if isinstance(value, tasks.Loop):
+                    targets[value.coro.__code__] = f"{cog_name}.{value.coro.__name__}"
+
+        for event_name, listeners in list(self.bot.extra_events.items()):
+            for listener in listeners:
+                code = getattr(getattr(listener, "__func__", listener), "__code__", None)
+                owner = getattr(listener, "__self__", None)
+                if code is not None and code not in targets:
+                    targets[code] = f"{type(owner).__name__ if owner is not None else 'bot'}.{event_name}"
+
+        return targets
@@ -0,0 +1,285 @@
+"""
+Entradas de miembros: rol automático y bienvenida resistentes a raids
+Informatica UAIn'T Community Bot
+"""
+
+import logging
+import asyncio
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import discord
+
+from .actions import ActionKind
+from .metrics import LatencyHistogram
+from .scheduler import DeadlineScheduler
+
+if TYPE_CHECKING:
+    from .client import UaintBot
+
+logger = logging.getLogger(__name__)
+
+# Buckets de la latencia por entrada: en una oleada el rol puede tardar minutos
+JOIN_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Menciones como máximo en un resumen de bienvenida (el resto se cuenta)
+DIGEST_MENTION_LIMIT = 50
+
+WELCOME_COLOR = 0x2ECC71
+
+
+class JoinPipeline:
+    """
+    Procesa las entradas al servidor principal.
+
+    - Rol automático (MEMBER_ROLE_ID): las asignaciones se encolan y un único
+      worker las envía a la cola de acciones a AUTO_ROLE_RATE por segundo,
+      en la misma ruta que los movimientos de voz (que tienen prioridad).
+      Si el miembro sale antes de recibir el rol, se descarta sin llamada.
+    - Bienvenida (WELCOME_CHANNEL_ID): un mensaje por miembro mientras las
+      entradas de los últimos WELCOME_BURST_WINDOW segundos no lleguen a
+      WELCOME_BURST_THRESHOLD. A partir de ahí se pasa a modo resumen: los
+      nuevos se acumulan y cada WELCOME_DIGEST_INTERVAL segundos se envía un
+      solo mensaje que los menciona a todos.
+
+    La latencia desde la entrada hasta el rol y hasta la bienvenida se
+    exporta en `member_join_latency_seconds{stage}`.
+    """
+
+    def __init__(self, bot: "UaintBot"):
+        self.bot = bot
+
+        # (guild_id, user_id) -> (miembro, momento de la entrada en el reloj del loop)
+        self.pending_roles: "OrderedDict[Tuple[int, int], Tuple[discord.Member, float]]" = OrderedDict()
+        self.digest: "OrderedDict[Tuple[int, int], Tuple[discord.Member, float]]" = OrderedDict()
+        self.recent_joins: Deque[float] = deque()  # ventana deslizante de entradas
+
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self.scheduler = DeadlineScheduler(self._send_digest, name="welcome-digest")
+
+        # Percentiles exactos (diagnóstico y simulador), sin depender de los buckets
+        self.latency: Dict[str, LatencyHistogram] = {"role": LatencyHistogram(), "welcome": LatencyHistogram()}
+        self.results: Dict[Tuple[str, str], int] = {}
+
+        registry = bot.metrics.registry
+        self.latency_metric = registry.histogram(
+            "member_join_latency_seconds",
+            "Tiempo desde la entrada de un miembro hasta recibir el rol o la bienvenida",
+            ("stage",),
+            buckets=JOIN_LATENCY_BUCKETS
+        )
+        registry.counter(
+            "member_join_actions_total",
+            "Roles automáticos y bienvenidas según resultado",
+            ("stage", "result"),
+            collect=lambda: list(self.results.items())
+        )
+        registry.gauge(
+            "member_join_pending",
+            "Entradas pendientes de rol o de bienvenida en resumen",
+            ("stage",),
+            collect=lambda: [(("role",), len(self.pending_roles)), (("welcome",), len(self.digest))]
+        )
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    @property
+    def in_burst(self) -> bool:
+        """Si las entradas recientes superan el umbral de oleada"""
+        self._prune(self._now())
+        return len(self.recent_joins) >= self.bot.settings.WELCOME_BURST_THRESHOLD
+
+    def start(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._role_worker(), name="auto-roles")
+        self.scheduler.start()
+
+    async def stop(self) -> None:
+        """Detiene el worker y el resumen (antes del cierre ordenado se llama a `flush`)"""
+
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        await self.scheduler.stop()
+
+    def flush(self) -> None:
+        """Al cerrar: pasa a la cola de acciones lo pendiente sin esperar al ritmo ni al resumen"""
+
+        while self.pending_roles:
+            _, (member, joined_at) = self.pending_roles.popitem(last=False)
+            self._assign_role(member, joined_at)
+
+        self.scheduler.cancel("digest")
+        if self.digest:
+            newcomers = list(self.digest.values())
+            self.digest.clear()
+            self._welcome(newcomers)
+
+    # ====================================
+    # EVENTOS
+    # ====================================
+
+    def member_joined(self, member: discord.Member) -> None:
+        """Punto de entrada desde on_member_join"""
+
+        if member.bot:
+            return
+
+        now = self._now()
+        key = (member.guild.id, member.id)
+        self.recent_joins.append(now)
+
+        if self.bot.settings.MEMBER_ROLE_ID is not None:
+            self.pending_roles[key] = (member, now)
+            self._wakeup.set()
+
+        if self.bot.settings.WELCOME_CHANNEL_ID is None:
+            return
+
+        if self.in_burst:
+            if not self.digest:
+                logger.warning("🚨 Oleada de entradas en %s: bienvenidas en modo resumen", member.guild.name)
+            self.digest[key] = (member, now)
+            if "digest" not in self.scheduler:
+                self.scheduler.schedule("digest", self.bot.settings.WELCOME_DIGEST_INTERVAL)
+        else:
+            self._welcome([(member, now)])
+
+    def member_left(self, guild_id: int, user_id: int) -> None:
+        """Punto de entrada desde on_raw_member_remove: descarta lo que aún no se hizo"""
+        self.pending_roles.pop((guild_id, user_id), None)
+        self.digest.pop((guild_id, user_id), None)
+
+    def _prune(self, now: float) -> None:
+        window = self.bot.settings.WELCOME_BURST_WINDOW
+        while self.recent_joins and now - self.recent_joins[0] > window:
+            self.recent_joins.popleft()
+
+    def _count(self, stage: str, result: str, amount: int = 1) -> None:
+        self.results[(stage, result)] = self.results.get((stage, result), 0) + amount
+
+    def _observe(self, stage: str, joined_at: float) -> None:
+        elapsed = self._now() - joined_at
+        self.latency[stage].record(elapsed)
+        self.latency_metric.observe(elapsed, stage)
+
+    # ====================================
+    # ROL AUTOMÁTICO
+    # ====================================
+
+    async def _role_worker(self) -> None:
+        while True:
+            if not self.pending_roles:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            _, (member, joined_at) = self.pending_roles.popitem(last=False)
+            future = self._assign_role(member, joined_at)
+            if future is not None:
+                await asyncio.wait([future])
+
+            # Ritmo fijo: en una oleada deja sitio en la ruta a los movimientos de voz
+            await asyncio.sleep(1 / self.bot.settings.AUTO_ROLE_RATE)
+
+    def _assign_role(self, member: discord.Member, joined_at: float) -> Optional[asyncio.Future]:
+        role = member.guild.get_role(self.bot.settings.MEMBER_ROLE_ID or 0)
+        if role is None:
+            self._count("role", "missing_role")
+            logger.warning("⚠️ MEMBER_ROLE_ID %s no existe en %s", self.bot.settings.MEMBER_ROLE_ID, member.guild.name)
+            return None
+
+        future = self.bot.actions.submit(
+            ActionKind.EDIT,
+            f"guild:{member.guild.id}:members",
+            lambda: member.add_roles(role, reason="Rol automático de entrada")
+        )
+        future.add_done_callback(lambda done: self._role_assigned(done, member, role, joined_at))
+        return future
+
+    def _role_assigned(self, future: asyncio.Future, member: discord.Member, role: discord.Role,
+                       joined_at: float) -> None:
+        if future.cancelled():
+            self._count("role", "cancelled")
+            return
+
+        error = future.exception()
+        if error is None:
+            self._count("role", "assigned")
+            self._observe("role", joined_at)
+        elif isinstance(error, discord.NotFound):
+            self._count("role", "left")  # salió mientras se asignaba
+        else:
+            self._count("role", "failed")
+            logger.error("❌ No se pudo asignar %s a %s: %s", role.name, member.name, error)
+
+    # ====================================
+    # BIENVENIDA
+    # ====================================
+
+    def _welcome(self, newcomers: List[Tuple[discord.Member, float]]) -> None:
+        """Envía una bienvenida (individual o resumen) por la cola de acciones"""
+
+        channel = self.bot.get_channel(self.bot.settings.WELCOME_CHANNEL_ID or 0)
+        if not isinstance(channel, discord.abc.Messageable):
+            self._count("welcome", "missing_channel", len(newcomers))
+            logger.warning("⚠️ Canal de bienvenida %s no encontrado", self.bot.settings.WELCOME_CHANNEL_ID)
+            return
+
+        guild = newcomers[0][0].guild
+        if len(newcomers) == 1:
+            member = newcomers[0][0]
+            content = member.mention
+            embed = discord.Embed(
+                title=f"👋 ¡Bienvenido/a a {guild.name}!",
+                description=f"Hola {member.mention}, esperamos que disfrutes de la comunidad.",
+                color=WELCOME_COLOR
+            )
+            embed.set_thumbnail(url=member.display_avatar.url)
+            embed.set_footer(text=f"Miembro #{guild.member_count}")
+        else:
+            # Sin ping en el resumen: una mención masiva es justo lo que busca un raid
+            content = None
+            mentions = ", ".join(member.mention for member, _ in newcomers[:DIGEST_MENTION_LIMIT])
+            extra = len(newcomers) - DIGEST_MENTION_LIMIT
+            if extra > 0:
+                mentions += f" y {extra} más"
+            embed = discord.Embed(
+                title=f"👋 ¡Bienvenidos/as a {guild.name}!",
+                description=f"Damos la bienvenida a {len(newcomers)} nuevos miembros: {mentions}",
+                color=WELCOME_COLOR
+            )
+
+        future = self.bot.actions.submit(
+            ActionKind.SEND,
+            f"channel:{channel.id}:messages",
+            lambda: channel.send(content=content, embed=embed)
+        )
+        future.add_done_callback(lambda done: self._welcomed(done, newcomers))
+
+    def _welcomed(self, future: asyncio.Future, newcomers: List[Tuple[discord.Member, float]]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            self._count("welcome", "failed", len(newcomers))
+            if not future.cancelled():
+                logger.error("❌ No se pudo enviar la bienvenida: %s", future.exception())
+            return
+
+        self._count("welcome", "digest" if len(newcomers) > 1 else "sent", len(newcomers))
+        for _, joined_at in newcomers:
+            self._observe("welcome", joined_at)
+
+    async def _send_digest(self, keys: List[str]) -> None:
+        if not self.digest:
+            return
+
+        newcomers = list(self.digest.values())
+        self.digest.clear()
+        self._welcome(newcomers)
+        logger.info("📨 Resumen de bienvenida: %s nuevos miembros", len(newcomers))
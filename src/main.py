@@ -10,19 +10,37 @@ Versión: 1.0.0
 import sys
 import asyncio
 import logging
+import argparse
 from pathlib import Path
 
 # Configurar path del proyecto
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / "src" / "bot"))
 
-# Ahora podemos importar nuestros módulos
-from bot import run_bot
-from config.settings import get_settings
+# Solo librería estándar: discord.py y los cogs se importan después del banner
+from core.startup import timeline
+
+
+def parse_args() -> argparse.Namespace:
+    """Opciones de línea de comandos"""
+
+    parser = argparse.ArgumentParser(description="Bot de Discord de Informatica UAIn'T")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Mide el tiempo de import por módulo y las fases hasta estar operativo"
+    )
+    parser.add_argument(
+        "--force-sync",
+        action="store_true",
+        help="Sincroniza los comandos slash aunque su hash no haya cambiado"
+    )
+    return parser.parse_args()
 
 
 def print_banner() -> None:
     """Muestra el banner del bot"""
+    from config.settings import get_settings
 
     settings = get_settings()
 
@@ -56,6 +74,7 @@ def validate_python_version() -> None:
 
 def validate_environment() -> None:
     """Valida el entorno antes de iniciar"""
+    from config.settings import get_settings
 
     try:
         settings = get_settings()
@@ -92,12 +111,13 @@ def setup_exception_handler() -> None:
     sys.excepthook = handle_exception
 
 
-async def main() -> int:
+async def main(force_sync: bool = False) -> int:
     """Función principal del programa"""
 
     try:
         # Ejecutar bot
-        return await run_bot()
+        from bot import run_bot
+        return await run_bot(force_sync=force_sync)
 
     except KeyboardInterrupt:
         print("\n👋 Bot detenido por el usuario")
@@ -105,11 +125,15 @@ async def main() -> int:
 
     except Exception as e:
         logger = logging.getLogger(__name__)
-        logger.exception(f"❌ Error fatal en main: {e}")
+        logger.exception("❌ Error fatal en main: %s", e)
         return 1
 
 
 if __name__ == "__main__":
+    args = parse_args()
+    if args.profile_startup:
+        timeline.enable_profiling()
+
     # Validaciones previas
     validate_python_version()
     validate_environment()
@@ -120,9 +144,13 @@ if __name__ == "__main__":
     # Mostrar banner
     print_banner()
 
+    # Import del bot (discord.py y extensiones principales)
+    import bot  # noqa: F401
+    timeline.mark("imports")
+
     # Ejecutar programa principal
     try:
-        exit_code = asyncio.run(main())
+        exit_code = asyncio.run(main(force_sync=args.force_sync))
 
         print(f"\n{'=' * 60}")
         print(f"🏁 Bot finalizado con código: {exit_code}")
@@ -0,0 +1,12 @@
+"""
+Simulador offline del gateway y la API de Discord
+Informatica UAIn'T Community Bot
+"""
+
+import sys
+from pathlib import Path
+
+# El bot importa sus módulos como `core.*`, `cogs.*`, `config`
+SOURCE = Path(__file__).resolve().parents[2] / "src"
+if str(SOURCE) not in sys.path:
+    sys.path.insert(0, str(SOURCE))
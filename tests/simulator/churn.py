@@ -0,0 +1,238 @@
+"""
+Carga de trabajo de entradas y salidas de voz sobre el bot real
+Informatica UAIn'T Community Bot
+"""
+
+import gc
+import os
+import time
+import random
+import asyncio
+import tracemalloc
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from .clock import run_virtual
+from .gateway import FakeGateway, load_fixture
+from .rest import FakeRest, RestProfile
+
+# Memoria asignada por el propio simulador (payloads de Discord), que no cuenta como del bot
+SIMULATOR_FILES = str(Path(__file__).resolve().parent / "*")
+
+# Configuración fija del bot simulado (se impone sobre .env)
+SIMULATOR_ENVIRONMENT = {
+    "DISCORD_TOKEN": "simulador",
+    "STATE_BACKEND": "memory",
+    "METRICS_PORT": "0",
+    "DYNAMIC_VOICE_SCOPE": "all",
+    "LOOP_WATCHDOG_ENABLED": "false",
+}
+
+
+class ChurnProfile(NamedTuple):
+    """Comportamiento de cada usuario simulado"""
+
+    session_mean: float = 1800.0  # duración media en un canal (s, exponencial)
+    idle_mean: float = 3600.0  # tiempo medio entre sesiones (s, exponencial)
+    hop_probability: float = 0.1  # probabilidad de cambiarse a una sala fija a mitad de sesión
+
+
+class ChurnReport(NamedTuple):
+    """Resultado de una ejecución"""
+
+    users: int
+    virtual_seconds: float
+    wall_seconds: float
+    voice_events: int
+    joins: int
+    moves: int
+    abandoned: int
+    p50: float
+    p99: float
+    max: float
+    requests: int
+    rate_limited: int
+    coalesced: int  # acciones anuladas o fusionadas en la cola (p.ej. creaciones de quien ya salió)
+    temp_channels: int
+    startup_seconds: float  # CPU de GUILD_CREATE + chunking
+    chunks: int
+    cached_members: int  # miembros en la caché de discord.py al terminar
+    startup_memory: Optional[int]  # bytes del bot tras conectar (tracemalloc), None si no se midió
+    memory: Optional[int]  # bytes del bot al terminar
+    peak_memory: Optional[int]  # pico total, simulador incluido
+
+    @property
+    def events_per_second(self) -> float:
+        return self.voice_events / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.virtual_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+def bot_memory() -> int:
+    """Bytes en uso asignados fuera del simulador (bot, discord.py, intérprete)"""
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, SIMULATOR_FILES),))
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def configure_environment(pool: bool = False, cache_profile: str = "full") -> None:
+    """Variables de entorno del bot simulado; hay que llamarla antes de leer la configuración"""
+
+    world = load_fixture("guilds.json")
+    os.environ.update(SIMULATOR_ENVIRONMENT)
+    os.environ["GUILD_ID"] = str(world["guilds"][0]["id"])
+    os.environ["DYNAMIC_VOICE_POOL_ENABLED"] = "true" if pool else "false"
+    os.environ["CACHE_PROFILE"] = cache_profile
+
+    from config import reload_settings
+    reload_settings()
+
+
+async def start_bot(users: int, rest_profile: RestProfile, lag: float, seed: int):
+    """Crea el bot con los cogs de voz, conectado al gateway y la API simulados"""
+
+    from core.client import UaintBot
+
+    bot = UaintBot()
+    await bot._async_setup_hook()
+
+    gateway = FakeGateway(bot, lag=lag)
+    rest = FakeRest(gateway, rest_profile, seed=seed)
+    rest.install(bot)
+
+    # Lo imprescindible de setup_hook (sin señales, logging ni servidor HTTP)
+    await bot.state.open()
+    bot.actions.start()
+
+    await bot.load_extension("core.events")
+    await bot.load_extension("cogs.utility.dynamic_voice")
+
+    # La reconciliación periódica usa el reloj de pared (tasks.loop), que el
+    # reloj virtual no adelanta; los canales vacíos se eliminan por su timer.
+    cog = bot.get_cog("Canales Dinámicos")
+    cog.cleanup_empty_channels.cancel()
+
+    gateway.connect(users)
+    bot._ready.set()
+    bot.dispatch("ready")
+    await asyncio.sleep(1)
+
+    return bot, gateway, rest
+
+
+async def _user_loop(gateway: FakeGateway, guild, user_id: int, profile: ChurnProfile,
+                     rng: random.Random, until: float, joins: List[int]) -> None:
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(rng.uniform(0, profile.idle_mean))
+
+    while loop.time() < until:
+        gateway.join(guild.id, user_id, rng.choice(guild.triggers))
+        joins[0] += 1
+        session = rng.expovariate(1 / profile.session_mean)
+
+        if guild.lobbies and rng.random() < profile.hop_probability:
+            await asyncio.sleep(session / 2)
+            gateway.join(guild.id, user_id, rng.choice(guild.lobbies))
+            session /= 2
+
+        await asyncio.sleep(session)
+        gateway.disconnect(guild.id, user_id)
+
+        idle = rng.expovariate(1 / profile.idle_mean)
+        if loop.time() + idle >= until:
+            return
+        await asyncio.sleep(idle)
+
+
+async def simulate(
+        users: int,
+        hours: float,
+        profile: ChurnProfile = ChurnProfile(),
+        rest_profile: RestProfile = RestProfile(),
+        lag: float = 0.05,
+        seed: int = 0,
+        trace_memory: bool = True
+) -> ChurnReport:
+    """Ejecuta `hours` horas virtuales de actividad con `users` usuarios"""
+
+    if trace_memory:
+        tracemalloc.start()
+
+    bot, gateway, rest = await start_bot(users, rest_profile, lag, seed)
+    startup_memory = bot_memory() if trace_memory else None
+    loop = asyncio.get_running_loop()
+    rng = random.Random(seed)
+
+    start_virtual = loop.time()
+    start_wall = time.perf_counter()
+    until = start_virtual + hours * 3600
+    joins = [0]
+
+    tasks = [
+        asyncio.create_task(_user_loop(gateway, guild, user_id, profile, rng, until, joins))
+        for guild in gateway.guilds.values() if guild.triggers
+        for user_id in guild.members
+    ]
+    await asyncio.gather(*tasks)
+    del tasks
+
+    # Que venzan los timers de eliminación y terminen las acciones pendientes
+    cog = bot.get_cog("Canales Dinámicos")
+    await asyncio.sleep(lag * 2)
+    while len(cog.deletion_scheduler) or bot.actions.depth or bot.actions.in_flight:
+        await asyncio.sleep(1)
+
+    wall = time.perf_counter() - start_wall
+    virtual = loop.time() - start_virtual
+
+    memory = peak = None
+    if trace_memory:
+        memory = bot_memory()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    temp_channels = sum(len(state.temp_channels) for state in cog.guilds.values())
+
+    histogram = gateway.join_to_move
+    report = ChurnReport(
+        users=users,
+        virtual_seconds=virtual,
+        wall_seconds=wall,
+        voice_events=gateway.voice_events,
+        joins=joins[0],
+        moves=histogram.count,
+        abandoned=gateway.abandoned,
+        p50=histogram.percentile(50),
+        p99=histogram.percentile(99),
+        max=histogram.max,
+        requests=sum(rest.requests.values()),
+        rate_limited=sum(rest.rate_limited.values()),
+        coalesced=bot.actions.coalesced,
+        temp_channels=temp_channels,
+        startup_seconds=gateway.startup_seconds,
+        chunks=gateway.chunks,
+        cached_members=sum(len(guild._members) for guild in bot.guilds),
+        startup_memory=startup_memory,
+        memory=memory,
+        peak_memory=peak,
+    )
+
+    for extension in list(bot.extensions):
+        await bot.unload_extension(extension)
+    await bot.actions.stop()
+    await bot.state.close()
+    return report
+
+
+def run(users: int, hours: float, pool: bool = False, cache_profile: str = "full", **options) -> ChurnReport:
+    """Punto de entrada síncrono: configura el entorno y simula en un loop virtual"""
+
+    configure_environment(pool=pool, cache_profile=cache_profile)
+
+    # Importar antes de medir, para que el pico de memoria sea solo de la simulación
+    import core.client  # noqa: F401
+    import cogs.utility.dynamic_voice  # noqa: F401
+
+    return run_virtual(simulate(users, hours, **options))
@@ -0,0 +1,75 @@
+"""
+Event loop con reloj virtual
+Informatica UAIn'T Community Bot
+"""
+
+import asyncio
+import selectors
+from typing import Any, Coroutine, List, Optional, Tuple
+
+
+class _VirtualSelector:
+    """
+    Selector que en lugar de esperar avanza el reloj virtual.
+
+    Si hay E/S real lista (p.ej. el self-pipe del loop al terminar una tarea
+    en un hilo) se atiende sin avanzar el reloj. Si no hay timers pendientes
+    se bloquea de verdad, porque solo un hilo puede despertar al loop.
+    """
+
+    def __init__(self, loop: "VirtualTimeLoop"):
+        self._loop = loop
+        self._selector = selectors.DefaultSelector()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple[selectors.SelectorKey, int]]:
+        events = self._selector.select(0)
+        if events:
+            return events
+
+        if timeout is None:
+            return self._selector.select(None)
+
+        self._loop.advance(timeout)
+        return []
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop cuyo `time()` es un reloj virtual.
+
+    Cuando todas las tareas están esperando un timer (asyncio.sleep, wait_for,
+    call_later...) el reloj salta directamente al próximo vencimiento, así que
+    horas de actividad simulada se ejecutan en lo que tarda la CPU en
+    procesarlas. `time.time()` y `datetime` siguen siendo el reloj real.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._virtual_now = start
+        self.skipped = 0.0  # segundos virtuales que no hubo que esperar
+        super().__init__(selector=_VirtualSelector(self))
+
+    def time(self) -> float:
+        return self._virtual_now
+
+    def advance(self, seconds: float) -> None:
+        if seconds > 0:
+            self._virtual_now += seconds
+            self.skipped += seconds
+
+
+def run_virtual(coroutine: Coroutine, start: float = 0.0) -> Any:
+    """Ejecuta `coroutine` hasta terminar en un VirtualTimeLoop nuevo"""
+
+    loop = VirtualTimeLoop(start)
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
@@ -0,0 +1,349 @@
+"""
+Gateway simulado: servidores en memoria y eventos hacia el bot
+Informatica UAIn'T Community Bot
+"""
+
+import json
+import time
+import asyncio
+import itertools
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import discord
+from discord.state import ChunkRequest
+
+from core.metrics import LatencyHistogram
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+# Tipos de canal de la API
+TEXT, VOICE, CATEGORY = 0, 2, 4
+
+# Permisos del rol del bot en los servidores simulados (administrador)
+ADMINISTRATOR = str(discord.Permissions(administrator=True).value)
+
+# Como en Discord: los servidores grandes no envían a todos los miembros en
+# GUILD_CREATE y el resto llega por GUILD_MEMBERS_CHUNK de 1000 en 1000
+LARGE_THRESHOLD = 250
+CHUNK_SIZE = 1000
+
+
+class SimGuild(NamedTuple):
+    """Servidor simulado y los IDs que usa la carga de trabajo"""
+
+    id: int
+    name: str
+    triggers: Tuple[int, ...]
+    lobbies: Tuple[int, ...]  # canales de voz normales
+    members: Tuple[int, ...]  # sin el bot
+    member_role: int  # rol "Miembro" (MEMBER_ROLE_ID)
+
+
+def load_fixture(name: str) -> Any:
+    with open(FIXTURES / name, encoding="utf-8") as file:
+        return json.load(file)
+
+
+class FakeGateway:
+    """
+    Estado "del lado de Discord" y conexión simulada del bot.
+
+    Los eventos se entregan con los parsers reales de discord.py
+    (`ConnectionState.parse_*`), así que la caché y el despacho de listeners
+    son los de producción. Todos los eventos llegan con el mismo retardo
+    `lag`, en el orden en que ocurrieron, como en un websocket real.
+    """
+
+    def __init__(self, bot: discord.Client, lag: float = 0.05):
+        self.bot = bot
+        self.state = bot._connection
+        self.lag = lag
+
+        self._ids = itertools.count(1300000000000000000)
+        self.guilds: Dict[int, SimGuild] = {}
+        self.channels: Dict[int, Dict[str, Any]] = {}  # canales existentes (payload)
+        self.members: Dict[Tuple[int, int], Dict[str, Any]] = {}  # (guild, user) -> payload
+        self.voice: Dict[Tuple[int, int], int] = {}  # (guild, user) -> canal de voz actual
+        self.triggers: Set[int] = set()
+
+        # Métricas de la simulación
+        self.voice_events = 0
+        self.join_to_move = LatencyHistogram()
+        self.pending_joins: Dict[Tuple[int, int], float] = {}  # entrada al trigger (reloj del loop)
+        self.abandoned = 0  # salieron del trigger antes de ser movidos
+        self.startup_seconds = 0.0  # CPU de GUILD_CREATE + chunking
+        self.chunks = 0
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    # ====================================
+    # CONSTRUCCIÓN DEL MUNDO
+    # ====================================
+
+    def _user(self, template: Dict[str, Any], suffix: str = "") -> Dict[str, Any]:
+        return {
+            "id": str(template.get("id") or self.next_id()),
+            "username": template["username"] + suffix,
+            "global_name": template.get("global_name"),
+            "discriminator": "0",
+            "avatar": None,
+            "bot": template.get("bot", False),
+        }
+
+    def _channel(self, guild_id: int, kind: int, name: str, position: int,
+                 parent_id: Optional[int] = None, overwrites: Optional[list] = None) -> Dict[str, Any]:
+        payload = {
+            "id": str(self.next_id()),
+            "type": kind,
+            "guild_id": str(guild_id),
+            "name": name,
+            "position": position,
+            "parent_id": str(parent_id) if parent_id else None,
+            "permission_overwrites": overwrites or [],
+            "nsfw": False,
+        }
+        if kind == VOICE:
+            payload.update(bitrate=64000, user_limit=0, rtc_region=None)
+        self.channels[int(payload["id"])] = payload
+        return payload
+
+    def _member(self, guild_id: int, user: Dict[str, Any], roles: List[str]) -> Dict[str, Any]:
+        payload = {
+            "user": user,
+            "roles": roles,
+            "joined_at": "2025-03-01T12:00:00+00:00",
+            "deaf": False,
+            "mute": False,
+            "flags": 0,
+        }
+        self.members[(guild_id, int(user["id"]))] = payload
+        return payload
+
+    def build(self, population: int, guilds_fixture: str = "guilds.json",
+              users_fixture: str = "users.json") -> List[Dict[str, Any]]:
+        """
+        Payloads GUILD_CREATE a partir de las fixtures.
+
+        `population` miembros (sin contar el bot) se reparten entre los
+        servidores según su `weight`, generados cíclicamente desde users.json.
+        """
+
+        world = load_fixture(guilds_fixture)
+        templates = load_fixture(users_fixture)
+
+        self.bot_user = self._user(world["bot"])
+        total_weight = sum(guild.get("weight", 1) for guild in world["guilds"])
+        generated = 0
+        payloads = []
+
+        for index, spec in enumerate(world["guilds"]):
+            guild_id = int(spec["id"])
+
+            if index == len(world["guilds"]) - 1:
+                count = population - generated
+            else:
+                count = population * spec.get("weight", 1) // total_weight
+            generated += count
+
+            bot_role = str(self.next_id())
+            member_role = str(self.next_id())
+            roles = [
+                {"id": str(guild_id), "name": "@everyone", "permissions": str(discord.Permissions.general().value),
+                 "position": 0, "color": 0, "hoist": False, "managed": False, "mentionable": False},
+                {"id": member_role, "name": "Miembro", "permissions": "0",
+                 "position": 1, "color": 0, "hoist": False, "managed": False, "mentionable": False},
+                {"id": bot_role, "name": "Bot", "permissions": ADMINISTRATOR,
+                 "position": 2, "color": 0, "hoist": False, "managed": True, "mentionable": False},
+            ]
+
+            channels = []
+            position = itertools.count()
+            for name in spec.get("text_channels", ()):
+                channels.append(self._channel(guild_id, TEXT, name, next(position)))
+
+            triggers, lobbies = [], []
+            for category in spec.get("categories", ()):
+                parent = self._channel(guild_id, CATEGORY, category["name"], next(position))
+                channels.append(parent)
+                for name in category.get("voice_channels", ()):
+                    channel = self._channel(guild_id, VOICE, name, next(position), int(parent["id"]))
+                    channels.append(channel)
+                    if "crear canal" in name.casefold():
+                        triggers.append(int(channel["id"]))
+                    else:
+                        lobbies.append(int(channel["id"]))
+
+            members = [self._member(guild_id, self.bot_user, [bot_role])]
+            member_ids = []
+            for number in range(count):
+                template = templates[number % len(templates)]
+                user = self._user({**template, "id": None}, suffix=f"_{number}")
+                members.append(self._member(guild_id, user, []))
+                member_ids.append(int(user["id"]))
+
+            self.triggers.update(triggers)
+            self.guilds[guild_id] = SimGuild(
+                guild_id, spec["name"], tuple(triggers), tuple(lobbies), tuple(member_ids), int(member_role)
+            )
+            large = len(members) > LARGE_THRESHOLD
+            payloads.append({
+                "id": str(guild_id),
+                "name": spec["name"],
+                "owner_id": self.bot_user["id"],
+                "member_count": len(members),
+                "roles": roles,
+                "channels": channels,
+                "members": members[:1] if large else members,
+                "voice_states": [],
+                "presences": [],
+                "threads": [],
+                "emojis": [],
+                "stickers": [],
+                "features": [],
+                "large": large,
+                "unavailable": False,
+                "premium_tier": 0,
+                "preferred_locale": "es-ES",
+            })
+
+        return payloads
+
+    def connect(self, population: int) -> None:
+        """
+        Equivalente a READY + GUILD_CREATE y, si el bot usa
+        chunk_guilds_at_startup, los GUILD_MEMBERS_CHUNK de los servidores
+        grandes. Anota el tiempo de CPU que le cuesta al bot procesarlo.
+        """
+
+        payloads = self.build(population)
+        start = time.perf_counter()
+
+        self.state.user = user = discord.ClientUser(state=self.state, data=self.bot_user)
+        self.state._users[user.id] = user
+        for payload in payloads:
+            self.state._add_guild_from_data(payload)
+
+            if payload["large"] and self.state._chunk_guilds:
+                self._chunk(int(payload["id"]))
+
+        self.startup_seconds = time.perf_counter() - start
+
+    def _chunk(self, guild_id: int) -> None:
+        """Respuesta a REQUEST_GUILD_MEMBERS, registrada como lo hace ConnectionState.chunk_guild"""
+
+        request = ChunkRequest(
+            guild_id, 0, asyncio.get_running_loop(), self.state._get_guild,
+            cache=self.state.member_cache_flags.joined
+        )
+        self.state._chunk_requests[request.nonce] = request
+
+        members = [member for key, member in self.members.items() if key[0] == guild_id]
+        count = -(-len(members) // CHUNK_SIZE)
+        for index in range(count):
+            self.chunks += 1
+            self.state.parse_guild_members_chunk({
+                "guild_id": str(guild_id),
+                "members": members[index * CHUNK_SIZE:(index + 1) * CHUNK_SIZE],
+                "chunk_index": index,
+                "chunk_count": count,
+                "nonce": request.nonce,
+            })
+
+    # ====================================
+    # ENTREGA DE EVENTOS
+    # ====================================
+
+    def emit(self, event: str, payload: Dict[str, Any]) -> None:
+        """Entrega un evento del gateway al bot tras `lag` segundos"""
+        parser = getattr(self.state, f"parse_{event}")
+        asyncio.get_running_loop().call_later(self.lag, self._deliver, event, parser, payload)
+
+    def _deliver(self, event: str, parser, payload: Dict[str, Any]) -> None:
+        if event == "voice_state_update":
+            self.voice_events += 1
+            key = (int(payload["guild_id"]), int(payload["user_id"]))
+            channel_id = payload["channel_id"]
+
+            # Movido desde el trigger a su canal: fin de la latencia entrada -> movimiento
+            if channel_id is not None and int(channel_id) not in self.triggers and key in self.pending_joins:
+                self.join_to_move.record(self._now() - self.pending_joins.pop(key))
+
+        parser(payload)
+
+    def set_voice(self, guild_id: int, user_id: int, channel_id: Optional[int]) -> None:
+        """Cambia el canal de voz de un usuario (lado servidor) y emite el evento"""
+
+        key = (guild_id, user_id)
+        if channel_id is None:
+            self.voice.pop(key, None)
+        else:
+            self.voice[key] = channel_id
+
+        self.emit("voice_state_update", {
+            "guild_id": str(guild_id),
+            "channel_id": str(channel_id) if channel_id else None,
+            "user_id": str(user_id),
+            "session_id": f"sim-{user_id}",
+            "deaf": False,
+            "mute": False,
+            "self_deaf": False,
+            "self_mute": False,
+            "self_video": False,
+            "suppress": False,
+            "request_to_speak_timestamp": None,
+            "member": self.members[key],
+        })
+
+    # ====================================
+    # ACCIONES DE LOS USUARIOS SIMULADOS
+    # ====================================
+
+    def join(self, guild_id: int, user_id: int, channel_id: int) -> None:
+        """El usuario entra (o se cambia) a un canal de voz"""
+
+        key = (guild_id, user_id)
+        if key in self.pending_joins:
+            self.abandoned += 1
+            del self.pending_joins[key]
+
+        if channel_id in self.triggers:
+            self.pending_joins[key] = self._now()
+        self.set_voice(guild_id, user_id, channel_id)
+
+    def disconnect(self, guild_id: int, user_id: int) -> None:
+        """El usuario se desconecta de voz"""
+
+        key = (guild_id, user_id)
+        if key in self.pending_joins:
+            self.abandoned += 1
+            del self.pending_joins[key]
+        if key in self.voice:
+            self.set_voice(guild_id, user_id, None)
+
+    def member_join(self, guild_id: int, template: Dict[str, Any]) -> int:
+        """Un usuario nuevo entra al servidor (GUILD_MEMBER_ADD); devuelve su ID"""
+
+        user = self._user({**template, "id": None}, suffix=f"_{len(self.members)}")
+        member = self._member(guild_id, user, [])
+        self.emit("guild_member_add", {**member, "guild_id": str(guild_id)})
+        return int(user["id"])
+
+    def member_remove(self, guild_id: int, user_id: int) -> None:
+        """El usuario sale del servidor (GUILD_MEMBER_REMOVE)"""
+
+        self.disconnect(guild_id, user_id)
+        member = self.members.pop((guild_id, user_id))
+        self.emit("guild_member_remove", {"guild_id": str(guild_id), "user": member["user"]})
+
+    def channel_named(self, guild_id: int, name: str) -> int:
+        return next(int(channel["id"]) for channel in self.channels.values()
+                    if channel["guild_id"] == str(guild_id) and channel["name"] == name)
+
+    def occupants(self, channel_id: int) -> List[Tuple[int, int]]:
+        return [key for key, current in self.voice.items() if current == channel_id]
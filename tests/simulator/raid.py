@@ -0,0 +1,134 @@
+"""
+Oleada de entradas al servidor (raid): registro de moderación, bienvenidas y rol automático
+Informatica UAIn'T Community Bot
+"""
+
+import os
+import time
+import random
+import asyncio
+from typing import NamedTuple
+
+from .clock import run_virtual
+from .churn import configure_environment, start_bot
+from .gateway import load_fixture
+from .rest import RestProfile
+
+# Canales de las fixtures que hacen de MOD_LOG_CHANNEL_ID y WELCOME_CHANNEL_ID
+MOD_LOG_CHANNEL = "moderacion"
+WELCOME_CHANNEL = "general"
+
+
+class RaidReport(NamedTuple):
+    """Resultado de una oleada"""
+
+    joins: int
+    leaves: int
+    virtual_seconds: float  # hasta publicar (o descartar) el último evento
+    wall_seconds: float
+    recorded: int  # eventos que llegaron al registro
+    sent: int  # eventos publicados
+    dropped: int  # eventos descartados (buffer lleno o envío fallido)
+    messages: int  # mensajes enviados al canal
+    embeds: int
+    rate_limited: int  # respuestas 429 del canal
+    max_buffer: int  # eventos pendientes como máximo
+    roles: int  # roles automáticos asignados
+    role_mean: float  # entrada -> rol (s); en una oleada supera el rango del histograma HDR
+    role_max: float
+    welcome_messages: int
+    welcomed: int  # miembros mencionados en alguna bienvenida
+    welcome_p50: float  # entrada -> bienvenida (s)
+    welcome_p99: float
+
+    @property
+    def events_per_message(self) -> float:
+        return self.sent / self.messages if self.messages else 0.0
+
+
+async def simulate(
+        joins: int,
+        rate: float,
+        leave_probability: float = 0.2,
+        rest_profile: RestProfile = RestProfile(),
+        lag: float = 0.05,
+        seed: int = 0
+) -> RaidReport:
+    """Entran `joins` cuentas a `rate` por segundo; algunas salen poco después"""
+
+    bot, gateway, rest = await start_bot(0, rest_profile, lag, seed)
+    loop = asyncio.get_running_loop()
+    rng = random.Random(seed)
+    templates = load_fixture("users.json")
+    guild_id = bot.main_guild.id
+
+    # Los canales solo existen tras conectar: se aplican como una recarga
+    os.environ["MOD_LOG_CHANNEL_ID"] = str(gateway.channel_named(guild_id, MOD_LOG_CHANNEL))
+    os.environ["WELCOME_CHANNEL_ID"] = str(gateway.channel_named(guild_id, WELCOME_CHANNEL))
+    os.environ["MEMBER_ROLE_ID"] = str(gateway.guilds[guild_id].member_role)
+    from config import reload_settings
+    reload_settings()
+    bot.modlog.start()
+    bot.welcome.start()
+
+    start_virtual = loop.time()
+    start_wall = time.perf_counter()
+    max_buffer = 0
+    leaves = 0
+
+    for number in range(joins):
+        user_id = gateway.member_join(guild_id, templates[number % len(templates)])
+        if rng.random() < leave_probability:
+            loop.call_later(rng.uniform(1, 30), gateway.member_remove, guild_id, user_id)
+            leaves += 1
+        max_buffer = max(max_buffer, len(bot.modlog.buffer))
+        await asyncio.sleep(rng.expovariate(rate))
+
+    # Que lleguen las salidas pendientes, se asignen los roles y se publique todo lo acumulado
+    await asyncio.sleep(30 + lag * 2)
+    welcome = bot.welcome
+    while welcome.pending_roles or welcome.digest or bot.actions.depth or bot.actions.in_flight:
+        await asyncio.sleep(1)
+    await bot.modlog.drain(timeout=3600)
+
+    counts = bot.modlog.events._values
+    route = "POST /channels/{channel_id}/messages"
+    mod_log_messages = [message for message in rest.messages
+                        if message["channel_id"] == os.environ["MOD_LOG_CHANNEL_ID"]]
+    welcome_messages = [message for message in rest.messages
+                        if message["channel_id"] == os.environ["WELCOME_CHANNEL_ID"]]
+    report = RaidReport(
+        joins=joins,
+        leaves=leaves,
+        virtual_seconds=loop.time() - start_virtual,
+        wall_seconds=time.perf_counter() - start_wall,
+        recorded=sum(counts.values()),
+        sent=int(counts.get(("sent",), 0)),
+        dropped=int(sum(value for labels, value in counts.items() if labels[0].startswith("dropped"))),
+        messages=len(mod_log_messages),
+        embeds=sum(len(message["embeds"]) for message in mod_log_messages),
+        rate_limited=rest.rate_limited[route],
+        max_buffer=max_buffer,
+        roles=welcome.results.get(("role", "assigned"), 0),
+        role_mean=welcome.latency["role"].mean,
+        role_max=welcome.latency["role"].max,
+        welcome_messages=len(welcome_messages),
+        welcomed=welcome.latency["welcome"].count,
+        welcome_p50=welcome.latency["welcome"].percentile(50),
+        welcome_p99=welcome.latency["welcome"].percentile(99),
+    )
+
+    await bot.welcome.stop()
+    await bot.modlog.stop()
+    for extension in list(bot.extensions):
+        await bot.unload_extension(extension)
+    await bot.actions.stop()
+    await bot.state.close()
+    return report
+
+
+def run(joins: int, rate: float, **options) -> RaidReport:
+    """Punto de entrada síncrono: configura el entorno y simula en un loop virtual"""
+
+    configure_environment()
+    return run_virtual(simulate(joins, rate, **options))
@@ -0,0 +1,239 @@
+"""
+API REST simulada: latencia, rate limits y respuestas 429
+Informatica UAIn'T Community Bot
+"""
+
+import random
+import asyncio
+import logging
+from collections import Counter, deque
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, NamedTuple, Tuple
+
+import discord
+from discord.http import Route
+
+from .gateway import FakeGateway, VOICE
+
+logger = logging.getLogger(__name__)
+
+# Límites por ruta (peticiones, ventana en segundos) y parámetro principal.
+# Aproximan los que Discord aplica en la práctica; el de renombrar canales
+# (2 cada 10 minutos por canal) es el que más se nota en el pool.
+DEFAULT_LIMITS: Mapping[str, Tuple[int, float]] = MappingProxyType({
+    "POST /guilds/{guild_id}/channels": (10, 10.0),
+    "PATCH /guilds/{guild_id}/members/{user_id}": (10, 10.0),
+    "PATCH /channels/{channel_id}": (2, 600.0),
+    "DELETE /channels/{channel_id}": (5, 5.0),
+    "POST /channels/{channel_id}/messages": (5, 5.0),
+    "PUT /guilds/{guild_id}/members/{user_id}/roles/{role_id}": (10, 10.0),
+})
+
+
+class RestProfile(NamedTuple):
+    """Comportamiento de la API simulada"""
+
+    latency: float = 0.08  # ida y vuelta base (s)
+    jitter: float = 0.04  # variación uniforme añadida a la latencia (s)
+    limits: Mapping[str, Tuple[int, float]] = DEFAULT_LIMITS
+    random_429: float = 0.0  # probabilidad de un 429 espurio (p.ej. límite global de Cloudflare)
+    retry_after: float = 1.0  # Retry-After de los 429 espurios
+
+
+class _FakeResponse:
+    """Lo mínimo de aiohttp.ClientResponse que usa discord.HTTPException"""
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str]):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+
+
+def http_error(status: int, message: str, headers: Dict[str, str] = None) -> discord.HTTPException:
+    response = _FakeResponse(status, message, headers or {})
+    data = {"message": message, "code": 0}
+    if status == 404:
+        return discord.NotFound(response, data)
+    if status == 403:
+        return discord.Forbidden(response, data)
+    return discord.HTTPException(response, data)
+
+
+class FakeRest:
+    """
+    Sustituye a `bot.http.request`.
+
+    Cada petición espera su latencia en el reloj del loop, pasa por la
+    ventana deslizante de su bucket y aplica el efecto en el FakeGateway, que
+    emite el evento correspondiente (CHANNEL_CREATE, VOICE_STATE_UPDATE...).
+    """
+
+    def __init__(self, gateway: FakeGateway, profile: RestProfile = RestProfile(), seed: int = 0):
+        self.gateway = gateway
+        self.profile = profile
+        self.random = random.Random(seed)
+
+        self.windows: Dict[Tuple[str, Any], Deque[float]] = {}
+        self.requests: Counter = Counter()  # "MÉTODO ruta" -> peticiones
+        self.rate_limited: Counter = Counter()  # "MÉTODO ruta" -> respuestas 429
+        self.messages: List[Dict[str, Any]] = []  # mensajes enviados por el bot (payload)
+
+        self.handlers = MappingProxyType({
+            "POST /guilds/{guild_id}/channels": self.create_channel,
+            "PATCH /channels/{channel_id}": self.edit_channel,
+            "DELETE /channels/{channel_id}": self.delete_channel,
+            "POST /channels/{channel_id}/messages": self.create_message,
+            "GET /guilds/{guild_id}/members/{member_id}": self.get_member,
+            "PATCH /guilds/{guild_id}/members/{user_id}": self.edit_member,
+            "PUT /guilds/{guild_id}/members/{user_id}/roles/{role_id}": self.add_member_role,
+        })
+
+    def install(self, bot: discord.Client) -> None:
+        bot.http.request = self.request
+
+    # ====================================
+    # PETICIONES
+    # ====================================
+
+    async def request(self, route: Route, **kwargs: Any) -> Any:
+        key = f"{route.method} {route.path}"
+        self.requests[key] += 1
+
+        await asyncio.sleep(self.profile.latency + self.random.uniform(0, self.profile.jitter))
+
+        retry_after = self._check_limit(key, route)
+        if retry_after is None and self.random.random() < self.profile.random_429:
+            retry_after = self.profile.retry_after
+        if retry_after is not None:
+            self.rate_limited[key] += 1
+            raise http_error(429, "You are being rate limited.", {"Retry-After": f"{retry_after:.3f}"})
+
+        handler = self.handlers.get(key)
+        if handler is None:
+            logger.debug("Petición sin simular: %s", key)
+            return None
+        return handler(route, kwargs.get("json") or {})
+
+    def _check_limit(self, key: str, route: Route) -> Any:
+        """Devuelve el Retry-After si la petición excede su bucket, o None"""
+
+        limit = self.profile.limits.get(key)
+        if limit is None:
+            return None
+
+        count, per = limit
+        now = asyncio.get_running_loop().time()
+        window = self.windows.setdefault((key, route.channel_id or route.guild_id), deque())
+        while window and now - window[0] >= per:
+            window.popleft()
+
+        if len(window) >= count:
+            return per - (now - window[0])
+        window.append(now)
+        return None
+
+    @staticmethod
+    def _ids(route: Route) -> Tuple[int, ...]:
+        return tuple(int(part) for part in route.url[len(Route.BASE):].split("/") if part.isdigit())
+
+    # ====================================
+    # EFECTOS
+    # ====================================
+
+    def create_channel(self, route: Route, payload: Dict[str, Any]) -> Dict[str, Any]:
+        guild_id, = self._ids(route)
+        parent_id = payload.get("parent_id")
+        channel = self.gateway._channel(
+            guild_id,
+            payload.get("type", VOICE),
+            payload["name"],
+            payload.get("position") or len(self.gateway.channels),
+            int(parent_id) if parent_id else None,
+            payload.get("permission_overwrites"),
+        )
+        for field in ("bitrate", "user_limit", "rtc_region"):
+            if field in payload:
+                channel[field] = payload[field]
+
+        self.gateway.emit("channel_create", channel)
+        return channel
+
+    def edit_channel(self, route: Route, payload: Dict[str, Any]) -> Dict[str, Any]:
+        channel_id, = self._ids(route)
+        channel = self.gateway.channels.get(channel_id)
+        if channel is None:
+            raise http_error(404, "Unknown Channel")
+
+        channel.update({key: value for key, value in payload.items() if key != "lock_permissions"})
+        channel = dict(channel)
+        self.gateway.emit("channel_update", channel)
+        return channel
+
+    def delete_channel(self, route: Route, payload: Dict[str, Any]) -> Dict[str, Any]:
+        channel_id, = self._ids(route)
+        channel = self.gateway.channels.pop(channel_id, None)
+        if channel is None:
+            raise http_error(404, "Unknown Channel")
+
+        # Discord desconecta a quien siguiera dentro
+        for guild_id, user_id in self.gateway.occupants(channel_id):
+            self.gateway.set_voice(guild_id, user_id, None)
+
+        self.gateway.emit("channel_delete", channel)
+        return channel
+
+    def create_message(self, route: Route, payload: Dict[str, Any]) -> Dict[str, Any]:
+        channel_id, = self._ids(route)
+        if channel_id not in self.gateway.channels:
+            raise http_error(404, "Unknown Channel")
+
+        message = {
+            "id": str(self.gateway.next_id()),
+            "channel_id": str(channel_id),
+            "author": self.gateway.bot_user,
+            "content": payload.get("content") or "",
+            "embeds": payload.get("embeds") or [],
+            "timestamp": discord.utils.utcnow().isoformat(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "pinned": False,
+            "type": 0,
+        }
+        self.messages.append(message)
+        return message
+
+    def get_member(self, route: Route, payload: Dict[str, Any]) -> Dict[str, Any]:
+        member = self.gateway.members.get(self._ids(route))
+        if member is None:
+            raise http_error(404, "Unknown Member")
+        return member
+
+    def edit_member(self, route: Route, payload: Dict[str, Any]) -> Dict[str, Any]:
+        guild_id, user_id = self._ids(route)
+        member = self.gateway.members.get((guild_id, user_id))
+        if member is None:
+            raise http_error(404, "Unknown Member")
+
+        if "channel_id" in payload:
+            channel_id = payload["channel_id"]
+            if (guild_id, user_id) not in self.gateway.voice:
+                raise http_error(400, "Target user is not connected to voice.")
+            if channel_id is not None and int(channel_id) not in self.gateway.channels:
+                raise http_error(404, "Unknown Channel")
+            self.gateway.set_voice(guild_id, user_id, int(channel_id) if channel_id else None)
+
+        return member
+
+    def add_member_role(self, route: Route, payload: Dict[str, Any]) -> None:
+        guild_id, user_id, role_id = self._ids(route)
+        member = self.gateway.members.get((guild_id, user_id))
+        if member is None:
+            raise http_error(404, "Unknown Member")
+
+        if str(role_id) not in member["roles"]:
+            member["roles"].append(str(role_id))
+            self.gateway.emit("guild_member_update", {**member, "guild_id": str(guild_id)})